@@ -16,13 +16,21 @@ from lumina.core.app import App
 from lumina.core.window import Window
 from lumina.widgets import Text, Button, Container, ScrollableContainer
 from lumina.themes import themes
-from lumina.core.style import Style
+from lumina.core.style import styled
 from lumina.core.types import Padding
 
 class CompleteDemo:
     def __init__(self):
         self.current_theme = themes.default_light
         self.window = None
+        
+        # Section subtrees are built once and reused; theme toggles only restyle them
+        self._header_section = None
+        self._text_showcase = None
+        self._scrollable_demo = None
+        self._layout_demo = None
+        
+        self._root = self.create_window_contents()
     
     def toggle_theme(self):
         """Toggle between light and dark themes"""
@@ -37,32 +45,43 @@ class CompleteDemo:
     
     def create_header_section(self):
         """Create the main header with theme toggle"""
-        return Container([
-            Text("🚀 Lumina Framework Complete Demo", style=Style(font_size=28, font_weight="bold")),
+        if self._header_section is not None:
+            return self._header_section
+        
+        self._header_section = Container([
+            Text("🚀 Lumina Framework Complete Demo", style=styled(28, "bold")),
             Text("Showcasing high-quality text, emoji support ★, scrollbars, and theme switching"),
             Button("Toggle Theme 🎨", on_click=self.toggle_theme),
         ], padding=Padding.all(20))
+        return self._header_section
     
     def create_text_showcase(self):
         """Create text quality and emoji showcase"""
-        return Container([
-            Text("Text Quality & Emoji Demo", style=Style(font_size=20, font_weight="bold")),
+        if self._text_showcase is not None:
+            return self._text_showcase
+        
+        self._text_showcase = Container([
+            Text("Text Quality & Emoji Demo", style=styled(20, "bold")),
             Text("High-quality text rendering with perfect kerning and crisp fonts ✨"),
             Text("Emoji Support: Happy ☺ Star ★ Love ♥ Arrow → Check ✓ Cross × Fire ▲"),
             Text("Unicode Symbols: ♪ ♫ ◆ ✦ ☀ ☽ ⚡ ◎ ↑ ↓ ← → ▲ ▼"),
             Text("This text demonstrates the improved font rendering quality with proper anti-aliasing."),
         ], padding=Padding.all(15))
+        return self._text_showcase
     
     def create_scrollable_demo(self):
         """Create scrollable content demo"""
+        if self._scrollable_demo is not None:
+            return self._scrollable_demo
+        
         scroll_content = []
         for i in range(20):
             scroll_content.append(
                 Text(f"Scrollable Item {i+1} - This demonstrates scrolling with emoji ★ and symbols ♥")
             )
         
-        return Container([
-            Text("Scrollable Container Demo", style=Style(font_size=20, font_weight="bold")),
+        self._scrollable_demo = Container([
+            Text("Scrollable Container Demo", style=styled(20, "bold")),
             Text("Scroll with mouse wheel or drag the scrollbar:"),
             ScrollableContainer(
                 scroll_content,
@@ -70,11 +89,15 @@ class CompleteDemo:
                 scroll_horizontal=False
             ),
         ], padding=Padding.all(15))
+        return self._scrollable_demo
     
     def create_layout_demo(self):
         """Create layout demo"""
-        return Container([
-            Text("Layout System Demo", style=Style(font_size=20, font_weight="bold")),
+        if self._layout_demo is not None:
+            return self._layout_demo
+        
+        self._layout_demo = Container([
+            Text("Layout System Demo", style=styled(20, "bold")),
             Text("Container layouts with proper spacing:"),
             Container([
                 Text("Card 1 - Flexible layouts ★"),
@@ -85,11 +108,12 @@ class CompleteDemo:
             Text("Each element maintains proper margins ↓"),
             Text("Clean typography throughout ✨"),
         ], padding=Padding.all(15))
+        return self._layout_demo
     
-    def create_window(self):
-        """Create the main window with all demos"""
+    def create_window_contents(self):
+        """Create the widget tree shown in the main window"""
         # Main content in a scrollable container
-        main_content = ScrollableContainer([
+        return ScrollableContainer([
             self.create_header_section(),
             self.create_text_showcase(),
             self.create_scrollable_demo(),
@@ -100,13 +124,15 @@ class CompleteDemo:
                 Text("✨ All features working: Theme switching, high-quality text, emoji support, and functional scrollbars ✨"),
             ], padding=Padding.all(20)),
         ], scroll_vertical=True)
-        
+    
+    def create_window(self):
+        """Create the main window with all demos"""
         self.window = Window(
             title="Lumina Framework - Complete Demo",
             width=1000,
             height=700,
             theme=self.current_theme,
-            children=[main_content]
+            children=[self._root]
         )
         
         return self.window
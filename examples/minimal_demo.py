@@ -11,7 +11,7 @@ from lumina.core.app import App
 from lumina.core.window import Window
 from lumina.widgets import Text, Button, Container
 from lumina.themes import themes
-from lumina.core.style import Style
+from lumina.core.style import styled
 from lumina.core.types import Padding
 
 def main():
@@ -37,7 +37,7 @@ def main():
     
     # Simple content without scrolling
     content = Container([
-        Text("🚀 Lumina Minimal Demo", style=Style(font_size=24, font_weight="bold")),
+        Text("🚀 Lumina Minimal Demo", style=styled(24, "bold")),
         Text("Text with emoji support: ★ ♥ ✓ ☺"),
         Button("Click Me!", on_click=on_button_click),
         Button("Toggle Theme 🎨", on_click=on_theme_click),
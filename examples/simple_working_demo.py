@@ -11,7 +11,7 @@ from lumina.core.app import App
 from lumina.core.window import Window
 from lumina.widgets import Text, Button, Container, ScrollableContainer
 from lumina.themes import themes
-from lumina.core.style import Style
+from lumina.core.style import styled
 from lumina.core.types import Padding
 
 def main():
@@ -40,7 +40,7 @@ def main():
     
     # Main content
     main_content = Container([
-        Text("🚀 Lumina Framework - Working Demo", style=Style(font_size=24, font_weight="bold")),
+        Text("🚀 Lumina Framework - Working Demo", style=styled(24, "bold")),
         Text("All fixes applied: crisp text, emoji ★, scrollbars, theme switching ✓"),
         Button("Toggle Theme 🎨", on_click=toggle_theme),
         Text("Scrollable Content (use mouse wheel):"),
@@ -1,5 +1,4 @@
 from typing import Optional, Union
-import asyncio
 import sys
 from lumina.core.window import Window
 
@@ -18,25 +17,16 @@ class App:
         self.debug = debug
         self._windows: list[Window] = []
         self._main_window: Optional[Window] = None
-        self._event_loop: Optional[asyncio.AbstractEventLoop] = None
     
     def run(self, window: Union[Window, list[Window]]) -> None:
-        """Run the application with the given window(s)"""
-        if isinstance(window, Window):
-            self._windows = [window]
-            self._main_window = window
-        else:
-            self._windows = window
-            self._main_window = window[0] if window else None
+        """Run the application with the given window(s).
         
-        if not self._main_window:
-            raise ValueError("At least one window must be provided")
+        The event loop is synchronous; use run_async() if async state
+        observers need a running asyncio loop.
+        """
+        self._set_windows(window)
         
         try:
-            # Setup event loop for async support
-            self._event_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._event_loop)
-            
             # Run the main window
             self._main_window.run()
             
@@ -44,15 +34,37 @@ class App:
             if self.debug:
                 print("\nApplication interrupted by user")
         except Exception as e:
+            self._handle_error(e)
+    
+    async def run_async(self, window: Union[Window, list[Window]]) -> None:
+        """Run the application inside the current asyncio event loop"""
+        self._set_windows(window)
+        
+        try:
+            await self._main_window.run_async()
+        except KeyboardInterrupt:
             if self.debug:
-                print(f"Application error: {e}")
-                raise
-            else:
-                sys.exit(1)
-        finally:
-            # Cleanup
-            if self._event_loop:
-                self._event_loop.close()
+                print("\nApplication interrupted by user")
+        except Exception as e:
+            self._handle_error(e)
+    
+    def _set_windows(self, window: Union[Window, list[Window]]) -> None:
+        if isinstance(window, Window):
+            self._windows = [window]
+            self._main_window = window
+        else:
+            self._windows = window
+            self._main_window = window[0] if window else None
+        
+        if not self._main_window:
+            raise ValueError("At least one window must be provided")
+    
+    def _handle_error(self, e: Exception) -> None:
+        if self.debug:
+            print(f"Application error: {e}")
+            raise e
+        else:
+            sys.exit(1)
     
     def quit(self) -> None:
         """Quit the application"""
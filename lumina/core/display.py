@@ -3,7 +3,10 @@ Display utilities for high DPI support and platform-specific optimizations
 """
 import sys
 import os
-from typing import Tuple
+import json
+import time
+from typing import Tuple, Optional
+import pygame
 
 
 class DisplayManager:
@@ -12,6 +15,10 @@ class DisplayManager:
     _scale_factor = None
     _is_retina = None
     
+    # Detection on macOS loads AppKit/CoreGraphics, so its results persist across launches
+    _cache_path = os.path.join(os.path.expanduser("~"), ".cache", "lumina", "display.json")
+    _cache_ttl = 24 * 60 * 60
+    
     @classmethod
     def get_scale_factor(cls) -> float:
         """Get the display scale factor"""
@@ -29,6 +36,62 @@ class DisplayManager:
     @classmethod
     def _detect_display_properties(cls):
         """Detect display properties once and cache them"""
+        key = cls._cache_key()
+        if key is None:
+            cls._probe_display_properties()
+            return
+        
+        cached = cls._load_cached_properties(key)
+        if cached is not None:
+            cls._scale_factor, cls._is_retina = cached
+            return
+        
+        cls._probe_display_properties()
+        cls._save_cached_properties(key)
+    
+    @classmethod
+    def _cache_key(cls) -> Optional[str]:
+        """Identify the attached displays, or None when the result shouldn't be persisted"""
+        # Other platforms probe cheaply, so only macOS keeps a cache file
+        if sys.platform != "darwin" or not pygame.display.get_init():
+            return None
+        
+        # Plugging in or swapping a monitor changes the desktop sizes, and with them the scale
+        sizes = ",".join(f"{width}x{height}" for width, height in pygame.display.get_desktop_sizes())
+        return f"{sys.platform}:{sizes}"
+    
+    @classmethod
+    def _load_cached_properties(cls, key: str) -> Optional[Tuple[float, bool]]:
+        """Read detected properties from disk if they are fresh and for this display"""
+        try:
+            with open(cls._cache_path) as f:
+                data = json.load(f)
+            if data.get("key") != key:
+                return None
+            if time.time() - data.get("timestamp", 0) > cls._cache_ttl:
+                return None
+            return float(data["scale_factor"]), bool(data["is_retina"])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+    
+    @classmethod
+    def _save_cached_properties(cls, key: str) -> None:
+        """Write detected properties to disk for later launches"""
+        try:
+            os.makedirs(os.path.dirname(cls._cache_path), exist_ok=True)
+            with open(cls._cache_path, "w") as f:
+                json.dump({
+                    "key": key,
+                    "timestamp": time.time(),
+                    "scale_factor": cls._scale_factor,
+                    "is_retina": cls._is_retina
+                }, f)
+        except OSError:
+            pass
+    
+    @classmethod
+    def _probe_display_properties(cls):
+        """Query the platform for the display scale factor"""
         cls._scale_factor = 1.0
         cls._is_retina = False
         
@@ -47,22 +110,28 @@ class DisplayManager:
                 except ImportError:
                     pass
                 
-                # Fallback: check system_profiler
-                import subprocess
-                result = subprocess.run(['system_profiler', 'SPDisplaysDataType'], 
-                                      capture_output=True, text=True, timeout=2)
-                if 'Retina' in result.stdout or 'Resolution:' in result.stdout:
-                    # Look for high resolution indicators
-                    lines = result.stdout.split('\n')
-                    for line in lines:
-                        if 'Resolution:' in line and ('2560' in line or '2880' in line or '3840' in line):
-                            cls._scale_factor = 2.0
-                            cls._is_retina = True
-                            break
-                        elif 'Retina' in line:
-                            cls._scale_factor = 2.0
-                            cls._is_retina = True
-                            break
+                # Fallback: ask CoreGraphics for the pixel vs point size of the main display mode
+                import ctypes
+                cg = ctypes.cdll.LoadLibrary('/System/Library/Frameworks/CoreGraphics.framework/CoreGraphics')
+                cg.CGMainDisplayID.restype = ctypes.c_uint32
+                cg.CGDisplayCopyDisplayMode.argtypes = [ctypes.c_uint32]
+                cg.CGDisplayCopyDisplayMode.restype = ctypes.c_void_p
+                cg.CGDisplayModeGetPixelHeight.argtypes = [ctypes.c_void_p]
+                cg.CGDisplayModeGetPixelHeight.restype = ctypes.c_size_t
+                cg.CGDisplayModeGetHeight.argtypes = [ctypes.c_void_p]
+                cg.CGDisplayModeGetHeight.restype = ctypes.c_size_t
+                cg.CGDisplayModeRelease.argtypes = [ctypes.c_void_p]
+                
+                mode = cg.CGDisplayCopyDisplayMode(cg.CGMainDisplayID())
+                if mode:
+                    try:
+                        pixel_height = cg.CGDisplayModeGetPixelHeight(mode)
+                        point_height = cg.CGDisplayModeGetHeight(mode)
+                    finally:
+                        cg.CGDisplayModeRelease(mode)
+                    if point_height:
+                        cls._scale_factor = pixel_height / point_height
+                        cls._is_retina = cls._scale_factor > 1.0
             except:
                 pass
         
@@ -101,8 +170,8 @@ class DisplayManager:
             except:
                 pass
     
-    @classmethod
-    def scale_font_size(cls, base_size: float) -> float:
+    @staticmethod
+    def scale_font_size(base_size: float) -> float:
         """Scale font size for current display"""
         # For now, disable auto-scaling to ensure crisp text
         # Users can manually adjust font sizes if needed
@@ -283,12 +283,20 @@ EMOJI_REPLACEMENTS = {
 }
 
 
+# Most replacements are one codepoint to one symbol, so a translate table handles them in one pass;
+# multi-codepoint sequences (emoji + variation selector) are replaced first
+_MULTI_CHAR_REPLACEMENTS = [(emoji, symbol) for emoji, symbol in EMOJI_REPLACEMENTS.items() if len(emoji) > 1]
+_TRANSLATE_TABLE = str.maketrans({
+    emoji: symbol for emoji, symbol in EMOJI_REPLACEMENTS.items() if len(emoji) == 1
+})
+
+
 def replace_emojis_with_symbols(text: str) -> str:
     """Replace emoji characters with Unicode symbols that render well in pygame"""
     result = text
-    for emoji, symbol in EMOJI_REPLACEMENTS.items():
+    for emoji, symbol in _MULTI_CHAR_REPLACEMENTS:
         result = result.replace(emoji, symbol)
-    return result
+    return result.translate(_TRANSLATE_TABLE)
 
 
 def has_emojis(text: str) -> bool:
@@ -5,6 +5,7 @@ import pygame
 import numpy as np
 from typing import Tuple, Union, Optional
 from lumina.core.types import Color, Rect
+from functools import lru_cache
 import math
 
 
@@ -15,7 +16,7 @@ class ModernGraphics:
     def draw_rounded_rect(
         surface: pygame.Surface,
         color: pygame.Color,
-        rect: pygame.Rect,
+        rect: Union[pygame.Rect, Tuple[int, int, int, int]],
         radius: float,
         width: int = 0,
         border_color: Optional[pygame.Color] = None,
@@ -26,28 +27,37 @@ class ModernGraphics:
             pygame.draw.rect(surface, color, rect, width)
             return
         
+        x, y, w, h = rect
+        
         # Ensure radius doesn't exceed half the smaller dimension
-        max_radius = min(rect.width, rect.height) // 2
+        max_radius = min(w, h) // 2
         radius = min(radius, max_radius)
         
-        # Create a temporary surface for anti-aliasing
-        temp_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        temp_surface.fill((0, 0, 0, 0))
-        
-        # Draw rounded rectangle on temp surface
-        if width == 0:  # Filled rectangle
-            ModernGraphics._draw_filled_rounded_rect(temp_surface, color, radius)
-        else:  # Outlined rectangle
-            ModernGraphics._draw_outlined_rounded_rect(temp_surface, color, radius, width)
-        
-        # Draw border if specified
-        if border_color and border_width > 0:
-            ModernGraphics._draw_outlined_rounded_rect(
-                temp_surface, border_color, radius, border_width
-            )
+        # Reuse the pre-rendered surface for this exact shape and colors
+        rounded_surface = _make_rounded_surface(
+            w,
+            h,
+            radius,
+            tuple(color),
+            width,
+            tuple(border_color) if border_color else None,
+            border_width
+        )
         
         # Blit with anti-aliasing
-        surface.blit(temp_surface, (rect.x, rect.y))
+        surface.blit(rounded_surface, (x, y))
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached pre-rendered shapes and derived colors"""
+        _make_rounded_surface.cache_clear()
+        _make_shadow_surface.cache_clear()
+        _corner_stamp.cache_clear()
+        _tinted_corner_stamp.cache_clear()
+        _SURFACE_POOL.clear()
+        _with_alpha.cache_clear()
+        _lighten.cache_clear()
+        _darken.cache_clear()
     
     @staticmethod
     def _draw_filled_rounded_rect(surface: pygame.Surface, color: pygame.Color, radius: float) -> None:
@@ -74,15 +84,19 @@ class ModernGraphics:
         """Draw an outlined rounded rectangle"""
         w, h = surface.get_size()
         
-        # Draw corner arcs
-        ModernGraphics._draw_arc(surface, color, (0, 0, 2*radius, 2*radius), 
-                                math.pi, 3*math.pi/2, width)
-        ModernGraphics._draw_arc(surface, color, (w-2*radius, 0, 2*radius, 2*radius), 
-                                3*math.pi/2, 2*math.pi, width)
-        ModernGraphics._draw_arc(surface, color, (w-2*radius, h-2*radius, 2*radius, 2*radius), 
-                                0, math.pi/2, width)
-        ModernGraphics._draw_arc(surface, color, (0, h-2*radius, 2*radius, 2*radius), 
-                                math.pi/2, math.pi, width)
+        # Stamp the four corner arcs from a cached tinted strip (one cell per corner)
+        stamp = _tinted_corner_stamp(radius, width, tuple(color))
+        corners = (
+            (0, 0),
+            (w - 2*radius, 0),
+            (w - 2*radius, h - 2*radius),
+            (0, h - 2*radius),
+        )
+        cell_size = stamp.get_height()
+        pad = (cell_size - pygame.Rect(0, 0, 2*radius, 2*radius).height) // 2
+        for i, (x, y) in enumerate(corners):
+            dest = pygame.Rect(x, y, 2*radius, 2*radius)
+            surface.blit(stamp, (dest.x - pad, dest.y - pad), (i * cell_size, 0, cell_size, cell_size))
         
         # Draw straight lines
         pygame.draw.line(surface, color, (radius, 0), (w-radius, 0), width)
@@ -106,39 +120,44 @@ class ModernGraphics:
         color: pygame.Color = pygame.Color(0, 0, 0, 30)
     ) -> None:
         """Draw a modern drop shadow"""
-        shadow_rect = pygame.Rect(
-            rect.x + offset[0],
-            rect.y + offset[1],
-            rect.width,
-            rect.height
-        )
+        shadow_x = rect.x + offset[0]
+        shadow_y = rect.y + offset[1]
         
-        # Create shadow surface
-        shadow_surface = pygame.Surface(
-            (rect.width + blur_radius * 2, rect.height + blur_radius * 2),
-            pygame.SRCALPHA
-        )
-        
-        # Draw shadow shape
-        ModernGraphics.draw_rounded_rect(
-            shadow_surface,
-            color,
-            pygame.Rect(blur_radius, blur_radius, rect.width, rect.height),
-            radius
-        )
-        
-        # Apply blur effect (simplified)
-        ModernGraphics._apply_blur(shadow_surface, blur_radius)
+        # Blurring is the expensive part, so reuse the shadow while size, shape and color are unchanged
+        shadow_surface = _make_shadow_surface(rect.width, rect.height, radius, blur_radius, tuple(color))
         
         # Blit shadow
-        surface.blit(shadow_surface, (shadow_rect.x - blur_radius, shadow_rect.y - blur_radius))
+        surface.blit(shadow_surface, (shadow_x - blur_radius, shadow_y - blur_radius))
     
     @staticmethod
-    def _apply_blur(surface: pygame.Surface, radius: float) -> None:
-        """Apply a simple blur effect (placeholder for more complex blur)"""
-        # This is a simplified blur - in a real implementation, 
-        # you'd use a proper gaussian blur algorithm
-        pass
+    def _apply_blur(surface: pygame.Surface, radius: float, passes: int = 3) -> None:
+        """Apply an approximate gaussian blur in place (repeated separable box blur)"""
+        r = int(round(radius))
+        if r < 1 or not surface.get_flags() & pygame.SRCALPHA:
+            return
+        
+        alpha_view = pygame.surfarray.pixels_alpha(surface)
+        rgb_view = pygame.surfarray.pixels3d(surface)
+        alpha = alpha_view.astype(np.float32)
+        
+        # Coloured shadows blur premultiplied colour so the faded edge keeps its hue
+        colored = bool(rgb_view.any())
+        if colored:
+            premultiplied = rgb_view * alpha[..., None]
+        
+        for _ in range(passes):
+            for axis in (0, 1):
+                alpha = _box_blur_axis(alpha, r, axis)
+                if colored:
+                    premultiplied = _box_blur_axis(premultiplied, r, axis)
+        
+        if colored:
+            rgb_view[...] = premultiplied / np.maximum(alpha, 1e-3)[..., None]
+        alpha_view[...] = alpha
+        
+        # Release the surface locks
+        del alpha_view
+        del rgb_view
     
     @staticmethod
     def draw_gradient(
@@ -149,61 +168,250 @@ class ModernGraphics:
         direction: str = "vertical"
     ) -> None:
         """Draw a smooth gradient"""
-        if direction == "vertical":
-            for y in range(rect.height):
-                ratio = y / rect.height
-                r = int(color1.r * (1 - ratio) + color2.r * ratio)
-                g = int(color1.g * (1 - ratio) + color2.g * ratio)
-                b = int(color1.b * (1 - ratio) + color2.b * ratio)
-                a = int(color1.a * (1 - ratio) + color2.a * ratio)
-                
-                line_color = pygame.Color(r, g, b, a)
-                pygame.draw.line(
-                    surface, 
-                    line_color, 
-                    (rect.x, rect.y + y), 
-                    (rect.x + rect.width, rect.y + y)
-                )
-        else:  # horizontal
-            for x in range(rect.width):
-                ratio = x / rect.width
-                r = int(color1.r * (1 - ratio) + color2.r * ratio)
-                g = int(color1.g * (1 - ratio) + color2.g * ratio)
-                b = int(color1.b * (1 - ratio) + color2.b * ratio)
-                a = int(color1.a * (1 - ratio) + color2.a * ratio)
-                
-                line_color = pygame.Color(r, g, b, a)
-                pygame.draw.line(
-                    surface, 
-                    line_color, 
-                    (rect.x + x, rect.y), 
-                    (rect.x + x, rect.y + rect.height)
-                )
+        area = rect.clip(surface.get_rect())
+        if area.width <= 0 or area.height <= 0:
+            return
+        
+        # Anything other than "vertical" has always meant horizontal
+        draw = _GRADIENT_DRAWERS.get(direction, _draw_horizontal_gradient)
+        draw(surface, rect, area, color1, color2)
     
     @staticmethod
-    def get_color_with_alpha(color: Union[pygame.Color, str, Tuple], alpha: int) -> pygame.Color:
-        """Get a color with specified alpha"""
-        if isinstance(color, str):
-            base_color = pygame.Color(color)
-        elif isinstance(color, tuple):
-            base_color = pygame.Color(*color)
-        else:
-            base_color = color
+    def draw_translucent_rect(
+        surface: pygame.Surface,
+        color: Union[pygame.Color, Tuple[int, int, int, int]],
+        rect: pygame.Rect
+    ) -> None:
+        """Blend a (possibly translucent) color over an area, e.g. a modal backdrop"""
+        area = rect.clip(surface.get_clip())
+        if area.width <= 0 or area.height <= 0:
+            return
         
-        return pygame.Color(base_color.r, base_color.g, base_color.b, alpha)
+        if len(color) < 4 or color[3] == 255:
+            surface.fill(color, area)
+            return
+        
+        # Fill a pooled scratch surface rather than allocating a window-sized one per frame
+        pooled = _acquire_surface(area.width, area.height)
+        scratch = pooled.subsurface((0, 0) + area.size)
+        scratch.fill(color)
+        surface.blit(scratch, area.topleft)
+        
+        del scratch
+        _release_surface(pooled)
+    
+    @staticmethod
+    def get_color_with_alpha(color: Union[pygame.Color, str, Tuple], alpha: int) -> pygame.Color:
+        """Get a color with specified alpha (shared per value, so don't mutate it)"""
+        color_key = color if isinstance(color, str) else tuple(color)
+        return _with_alpha(color_key, alpha)
     
     @staticmethod
     def lighten_color(color: pygame.Color, factor: float = 0.1) -> pygame.Color:
-        """Lighten a color by a factor (0.0 to 1.0)"""
-        r = min(255, int(color.r + (255 - color.r) * factor))
-        g = min(255, int(color.g + (255 - color.g) * factor))
-        b = min(255, int(color.b + (255 - color.b) * factor))
-        return pygame.Color(r, g, b, color.a)
+        """Lighten a color by a factor (0.0 to 1.0); the result is shared, so don't mutate it"""
+        rgba = (color.r, color.g, color.b, color.a)
+        return _lighten(rgba, round(factor * 1000))
     
     @staticmethod
     def darken_color(color: pygame.Color, factor: float = 0.1) -> pygame.Color:
-        """Darken a color by a factor (0.0 to 1.0)"""
-        r = max(0, int(color.r * (1 - factor)))
-        g = max(0, int(color.g * (1 - factor)))
-        b = max(0, int(color.b * (1 - factor)))
-        return pygame.Color(r, g, b, color.a)
\ No newline at end of file
+        """Darken a color by a factor (0.0 to 1.0); the result is shared, so don't mutate it"""
+        rgba = (color.r, color.g, color.b, color.a)
+        return _darken(rgba, round(factor * 1000))
+
+
+def _gradient_ramp(steps: int, start: int, count: int, color1: pygame.Color, color2: pygame.Color) -> np.ndarray:
+    """Interpolate every row (or column) at once instead of one draw call per line"""
+    ratio = (np.arange(start, start + count, dtype=np.float32) / steps)[:, None]
+    start_rgba = np.array([color1.r, color1.g, color1.b, color1.a], dtype=np.float32)
+    end_rgba = np.array([color2.r, color2.g, color2.b, color2.a], dtype=np.float32)
+    return (start_rgba * (1 - ratio) + end_rgba * ratio).astype(np.uint8)
+
+
+def _stretch_ramp(surface: pygame.Surface, area: pygame.Rect, strip: pygame.Surface, ramp: np.ndarray) -> None:
+    """Store the ramp in a one-pixel strip and let SDL stretch it across the other axis"""
+    pygame.surfarray.blit_array(strip, ramp[:, :, :3])
+    alpha = pygame.surfarray.pixels_alpha(strip)
+    alpha[...] = ramp[:, :, 3]
+    del alpha  # Release the surface lock
+    
+    scaled = pygame.transform.scale(strip, area.size)
+    
+    # Clear then add so the gradient replaces the target pixels instead of blending
+    surface.fill((0, 0, 0, 0), area)
+    surface.blit(scaled, area, special_flags=pygame.BLEND_RGBA_ADD)
+
+
+def _draw_vertical_gradient(surface: pygame.Surface, rect: pygame.Rect, area: pygame.Rect,
+                            color1: pygame.Color, color2: pygame.Color) -> None:
+    rgba = _gradient_ramp(rect.height, area.y - rect.y, area.height, color1, color2)
+    strip = pygame.Surface((1, area.height), pygame.SRCALPHA)
+    _stretch_ramp(surface, area, strip, rgba[None, :, :])
+
+
+def _draw_horizontal_gradient(surface: pygame.Surface, rect: pygame.Rect, area: pygame.Rect,
+                              color1: pygame.Color, color2: pygame.Color) -> None:
+    rgba = _gradient_ramp(rect.width, area.x - rect.x, area.width, color1, color2)
+    strip = pygame.Surface((area.width, 1), pygame.SRCALPHA)
+    _stretch_ramp(surface, area, strip, rgba[:, None, :])
+
+
+_GRADIENT_DRAWERS = {
+    "vertical": _draw_vertical_gradient,
+    "horizontal": _draw_horizontal_gradient,
+}
+
+
+# Free scratch surfaces keyed by power-of-two bucket size
+_SURFACE_POOL: dict[tuple[int, int], list[pygame.Surface]] = {}
+_POOL_BUCKET_LIMIT = 4
+
+
+def _bucket(n: int) -> int:
+    """Round a dimension up to the next power of two"""
+    return 1 << max(0, n - 1).bit_length()
+
+
+def _acquire_surface(w: int, h: int) -> pygame.Surface:
+    """Get a cleared SRCALPHA surface at least w x h pixels"""
+    key = (_bucket(w), _bucket(h))
+    free = _SURFACE_POOL.get(key)
+    if free:
+        return free.pop()
+    return pygame.Surface(key, pygame.SRCALPHA)
+
+
+def _release_surface(surface: pygame.Surface) -> None:
+    """Clear a scratch surface and return it to the pool"""
+    free = _SURFACE_POOL.setdefault(surface.get_size(), [])
+    if len(free) < _POOL_BUCKET_LIMIT:
+        surface.fill((0, 0, 0, 0))
+        free.append(surface)
+
+
+def _box_blur_axis(values: np.ndarray, r: int, axis: int) -> np.ndarray:
+    """One box filter pass of width 2r+1 along an axis, using running sums (cost independent of r)"""
+    moved = np.moveaxis(values, axis, 0)
+    pad_shape = moved.shape[1:]
+    padded = np.concatenate([
+        np.zeros((r + 1,) + pad_shape, dtype=np.float32),
+        moved,
+        np.zeros((r,) + pad_shape, dtype=np.float32),
+    ])
+    sums = np.cumsum(padded, axis=0)
+    blurred = (sums[2 * r + 1:] - sums[:-(2 * r + 1)]) / (2 * r + 1)
+    return np.moveaxis(blurred, 0, axis)
+
+
+@lru_cache(maxsize=1024)
+def _with_alpha(color_key: Union[str, tuple], alpha: int) -> pygame.Color:
+    """Resolve a color to a Color with the given alpha"""
+    if isinstance(color_key, str):
+        base_color = pygame.Color(color_key)
+    else:
+        base_color = pygame.Color(*color_key)
+    
+    return pygame.Color(base_color.r, base_color.g, base_color.b, alpha)
+
+
+@lru_cache(maxsize=1024)
+def _lighten(rgba: tuple[int, int, int, int], factor_x1000: int) -> pygame.Color:
+    """Lighten an RGBA tuple; factor is quantized to thousandths to keep the cache bounded"""
+    factor = factor_x1000 / 1000
+    r, g, b, a = rgba
+    return pygame.Color(
+        min(255, int(r + (255 - r) * factor)),
+        min(255, int(g + (255 - g) * factor)),
+        min(255, int(b + (255 - b) * factor)),
+        a
+    )
+
+
+@lru_cache(maxsize=1024)
+def _darken(rgba: tuple[int, int, int, int], factor_x1000: int) -> pygame.Color:
+    """Darken an RGBA tuple; factor is quantized to thousandths to keep the cache bounded"""
+    factor = factor_x1000 / 1000
+    r, g, b, a = rgba
+    return pygame.Color(
+        max(0, int(r * (1 - factor))),
+        max(0, int(g * (1 - factor))),
+        max(0, int(b * (1 - factor))),
+        a
+    )
+
+
+@lru_cache(maxsize=64)
+def _make_shadow_surface(w: int, h: int, radius: float, blur_radius: float, color_key: tuple) -> pygame.Surface:
+    """Render and blur a drop shadow once per size, shape and color"""
+    shadow_size = (int(w + blur_radius * 2), int(h + blur_radius * 2))
+    shadow_surface = pygame.Surface(shadow_size, pygame.SRCALPHA)
+    
+    # Draw shadow shape
+    ModernGraphics.draw_rounded_rect(
+        shadow_surface,
+        color_key,
+        (blur_radius, blur_radius, w, h),
+        radius
+    )
+    
+    # Apply blur effect (simplified)
+    ModernGraphics._apply_blur(shadow_surface, blur_radius)
+    return shadow_surface
+
+
+@lru_cache(maxsize=512)
+def _make_rounded_surface(
+    w: int,
+    h: int,
+    radius: float,
+    color_key: tuple,
+    width: int,
+    border_key: Optional[tuple],
+    border_width: int
+) -> pygame.Surface:
+    """Render a rounded rectangle onto its own surface (cached per shape and color)"""
+    # Create a temporary surface for anti-aliasing
+    temp_surface = pygame.Surface((w, h), pygame.SRCALPHA)
+    temp_surface.fill((0, 0, 0, 0))
+    
+    # Draw rounded rectangle on temp surface
+    if width == 0:  # Filled rectangle
+        ModernGraphics._draw_filled_rounded_rect(temp_surface, color_key, radius)
+    else:  # Outlined rectangle
+        ModernGraphics._draw_outlined_rounded_rect(temp_surface, color_key, radius, width)
+    
+    # Draw border if specified
+    if border_key and border_width > 0:
+        ModernGraphics._draw_outlined_rounded_rect(
+            temp_surface, border_key, radius, border_width
+        )
+    
+    return temp_surface
+
+
+@lru_cache(maxsize=64)
+def _corner_stamp(radius: float, width: int) -> pygame.Surface:
+    """Render the corner arcs of a rounded outline in white, one cell per corner (cached per radius and width)"""
+    # Arcs can spill a little outside their rect, so each cell gets a margin
+    arc_rect = pygame.Rect(0, 0, 2*radius, 2*radius)
+    pad = width + 1
+    cell_size = arc_rect.height + 2 * pad
+    stamp = pygame.Surface((cell_size * 4, cell_size), pygame.SRCALPHA)
+    stamp.fill((0, 0, 0, 0))
+    angles = (
+        (math.pi, 3*math.pi/2),
+        (3*math.pi/2, 2*math.pi),
+        (0, math.pi/2),
+        (math.pi/2, math.pi),
+    )
+    for i, (start_angle, end_angle) in enumerate(angles):
+        ModernGraphics._draw_arc(stamp, (255, 255, 255, 255), arc_rect.move(i * cell_size + pad, pad),
+                                 start_angle, end_angle, width)
+    return stamp
+
+
+@lru_cache(maxsize=256)
+def _tinted_corner_stamp(radius: float, width: int, color_key: tuple) -> pygame.Surface:
+    """Tint the white corner stamp with a color"""
+    stamp = _corner_stamp(radius, width).copy()
+    stamp.fill(color_key, special_flags=pygame.BLEND_RGBA_MULT)
+    return stamp
@@ -1,17 +1,82 @@
 from typing import TypeVar, Generic, Callable, Any, Optional
-from weakref import WeakSet
+from weakref import ref, WeakMethod
 import asyncio
 
 T = TypeVar("T")
 
+# In-flight async observer batches; the event loop only keeps weak references to tasks
+_PENDING_NOTIFICATIONS: set[asyncio.Future] = set()
+
+
+def _weak_ref(observer: Callable) -> ref:
+    """Weakly reference an observer (bound methods need WeakMethod to stay alive)"""
+    if hasattr(observer, "__self__") and hasattr(observer, "__func__"):
+        return WeakMethod(observer)
+    return ref(observer)
+
+
+class _ObserverList:
+    """Weakly held observers in subscription order.
+    
+    Notification walks the list in place; a subscribe or unsubscribe during a walk
+    swaps in a fresh copy instead, so the walk in progress is unaffected.
+    """
+    
+    __slots__ = ("_refs", "_walking", "_has_dead")
+    
+    def __init__(self):
+        self._refs: list[ref] = []
+        self._walking = 0
+        self._has_dead = False
+    
+    def __bool__(self) -> bool:
+        return bool(self._refs)
+    
+    def add(self, observer: Callable) -> None:
+        """Subscribe an observer; subscribing the same callable again is a no-op"""
+        for r in self._refs:
+            if r() == observer:
+                return
+        self._writable().append(_weak_ref(observer))
+    
+    def discard(self, observer: Callable) -> None:
+        """Unsubscribe an observer, dropping dead references on the way"""
+        self._refs = [r for r in self._refs if (target := r()) is not None and target != observer]
+        self._has_dead = False
+    
+    def live(self):
+        """Yield the live observers in subscription order"""
+        refs = self._refs
+        self._walking += 1
+        try:
+            for r in refs:
+                observer = r()
+                if observer is None:
+                    self._has_dead = True
+                    continue
+                yield observer
+        finally:
+            self._walking -= 1
+        
+        # Reap dead references once no walk is using the list
+        if self._has_dead and not self._walking:
+            self._refs = [r for r in self._refs if r() is not None]
+            self._has_dead = False
+    
+    def _writable(self) -> list[ref]:
+        if self._walking:
+            self._refs = list(self._refs)
+        return self._refs
+
 
 class State(Generic[T]):
     """Reactive state container that notifies observers on change"""
     
     def __init__(self, initial_value: T):
         self._value = initial_value
-        self._observers: WeakSet[Callable] = WeakSet()
-        self._async_observers: WeakSet[Callable] = WeakSet()
+        self._observers = _ObserverList()
+        self._async_observers = _ObserverList()
+        self._notify_scheduled = False
     
     @property
     def value(self) -> T:
@@ -19,34 +84,63 @@ class State(Generic[T]):
     
     @value.setter
     def value(self, new_value: T) -> None:
-        if self._value != new_value:
-            self._value = new_value
-            self._notify_observers()
+        if new_value is self._value:
+            return
+        
+        # Values like arrays compare elementwise; treat anything ambiguous as a change
+        try:
+            if bool(self._value == new_value):
+                return
+        except Exception:
+            pass
+        
+        self._value = new_value
+        self._notify_observers()
     
     def subscribe(self, observer: Callable[[], None], async_observer: bool = False) -> Callable[[], None]:
         """Subscribe to state changes. Returns unsubscribe function."""
-        if async_observer:
-            self._async_observers.add(observer)
-        else:
-            self._observers.add(observer)
+        observers = self._async_observers if async_observer else self._observers
+        observers.add(observer)
         
         def unsubscribe():
-            if async_observer:
-                self._async_observers.discard(observer)
-            else:
-                self._observers.discard(observer)
+            observers.discard(observer)
         
         return unsubscribe
     
     def _notify_observers(self) -> None:
-        for observer in list(self._observers):
+        # Sync observers (including dependent Computed values) run inside the setter, so reads
+        # right after a write are never stale
+        for observer in self._observers.live():
             try:
                 observer()
             except Exception as e:
                 print(f"Error in state observer: {e}")
         
-        for async_observer in list(self._async_observers):
-            asyncio.create_task(self._call_async_observer(async_observer))
+        if self._async_observers:
+            self._schedule_async_notify()
+    
+    def _schedule_async_notify(self) -> None:
+        """Run async observers once per loop tick (they need a running event loop)"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            print("Error in async state observer: no running event loop (use App.run_async), notification skipped")
+            return
+        
+        # Coalesce repeated writes within the same tick into one async notify pass
+        if not self._notify_scheduled:
+            self._notify_scheduled = True
+            loop.call_soon(self._flush_async_notify)
+    
+    def _flush_async_notify(self) -> None:
+        self._notify_scheduled = False
+        coros = [self._call_async_observer(observer) for observer in self._async_observers.live()]
+        
+        # Schedule all async observers as a single task, kept alive until it finishes
+        if coros:
+            batch = asyncio.gather(*coros, return_exceptions=True)
+            _PENDING_NOTIFICATIONS.add(batch)
+            batch.add_done_callback(_PENDING_NOTIFICATIONS.discard)
     
     async def _call_async_observer(self, observer: Callable) -> None:
         try:
@@ -65,7 +159,7 @@ class Computed(Generic[T]):
         self._compute_fn = compute_fn
         self._cached_value: Optional[T] = None
         self._is_dirty = True
-        self._observers: WeakSet[Callable] = WeakSet()
+        self._observers = _ObserverList()
         
         if dependencies:
             for dep in dependencies:
@@ -91,7 +185,7 @@ class Computed(Generic[T]):
         return unsubscribe
     
     def _notify_observers(self) -> None:
-        for observer in list(self._observers):
+        for observer in self._observers.live():
             try:
                 observer()
             except Exception as e:
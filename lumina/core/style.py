@@ -1,10 +1,14 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from typing import Optional, Union
 from lumina.core.types import Color
 import pygame
 
 
-@dataclass
+_BOLD_WEIGHTS = frozenset({"bold", "600", "700", "800", "900"})
+
+
+@dataclass(slots=True)
 class Style:
     """Style properties for widgets"""
     
@@ -60,32 +64,19 @@ class Style:
     transition_duration: float = 0.0
     transition_property: Optional[str] = None
     
-    def merge(self, other: "Style") -> "Style":
-        """Merge another style into this one, with other taking precedence"""
-        result = Style()
-        
-        # Copy all attributes from self
-        for attr in vars(self):
-            setattr(result, attr, getattr(self, attr))
-        
-        # Override with non-None values from other
-        for attr in vars(other):
-            value = getattr(other, attr)
-            if value is not None:
-                setattr(result, attr, value)
-        
-        return result
-    
-    def to_pygame_color(self, color: Optional[Color]) -> Optional[pygame.Color]:
-        """Convert color to pygame Color object"""
-        if color is None:
-            return None
-        
-        if isinstance(color, str):
-            # Handle named colors or hex colors
-            return pygame.Color(color)
-        elif isinstance(color, (tuple, list)):
-            return pygame.Color(*color)
+    @staticmethod
+    def to_pygame_color(color: Optional[Color]) -> Optional[pygame.Color]:
+        """Convert color to pygame Color object (shared per value, so don't mutate it)"""
+        color_type = type(color)
+        if color_type is str or color_type is tuple:
+            return _make_color(color)
+        elif color_type is pygame.Color:
+            # Already converted
+            return color
+        elif isinstance(color, (str, tuple)):
+            return _make_color(color)
+        elif isinstance(color, list):
+            return _make_color(tuple(color))
         
         return None
     
@@ -95,79 +86,151 @@ class Style:
         if not pygame.font.get_init():
             pygame.font.init()
         
-        # Check if we have a cached font for this exact style
-        cache_key = (self.font_family, self.font_size, self.font_weight, self.font_style)
-        if hasattr(self, '_font_cache') and cache_key in self._font_cache:
-            return self._font_cache[cache_key]
-        
-        if not hasattr(self, '_font_cache'):
-            self._font_cache = {}
-        
         # Map font weights to pygame font styles
-        bold = self.font_weight in ["bold", "600", "700", "800", "900"]
+        bold = self.font_weight in _BOLD_WEIGHTS
         italic = self.font_style == "italic"
         
-        # Get high-quality fonts with better kerning
-        font_name = None
-        
-        # Better font selection for quality and kerning
-        if self.font_family == "system":
-            import sys
-            
-            if sys.platform == "darwin":  # macOS
-                # Use fonts known for crisp rendering on macOS
-                preferred_fonts = [
-                    "SF Pro Text",         # Native San Francisco font
-                    "Helvetica",           # Classic, crisp font
-                    "Arial",               # Universal fallback
-                ]
-            elif sys.platform == "win32":  # Windows
-                preferred_fonts = [
-                    "Segoe UI",
-                    "Calibri", 
-                    "Arial",
-                ]
-            else:  # Linux
-                preferred_fonts = [
-                    "Ubuntu",
-                    "Liberation Sans",
-                    "DejaVu Sans",
-                    "Arial",
-                ]
-            
-            # Try to find the best available font
-            available_fonts = pygame.font.get_fonts()
-            for font in preferred_fonts:
-                # Try exact match first
-                if font in pygame.font.get_fonts():
-                    font_name = font
-                    break
-                # Try case-insensitive match
-                font_key = font.lower().replace(" ", "").replace(".", "")
-                for available in available_fonts:
-                    if font_key in available.lower():
-                        font_name = available
-                        break
-                if font_name:
-                    break
-            
-            if not font_name:
-                font_name = pygame.font.get_default_font()
-        else:
-            # Check if requested font exists
-            if self.font_family.lower().replace(" ", "") in pygame.font.get_fonts():
-                font_name = self.font_family
+        # Font sizes are not DPI-scaled (see DisplayManager.scale_font_size) to keep text crisp
+        return _resolve_font(self.font_family, int(self.font_size), bold, italic)
+
+
+def _build_merge() -> None:
+    """Generate Style.merge as straight-line code over the (fixed) dataclass fields"""
+    lines = [
+        'def merge(self, other: "Style") -> "Style":',
+        '    """Merge another style into this one, with other taking precedence"""',
+        '    result = Style.__new__(Style)',
+    ]
+    for f in fields(Style):
+        lines.append(f"    value = other.{f.name}")
+        lines.append(f"    result.{f.name} = value if value is not None else self.{f.name}")
+    lines.append("    return result")
+    
+    namespace = {"Style": Style}
+    exec("\n".join(lines), namespace)
+    merge = namespace["merge"]
+    merge.__qualname__ = "Style.merge"
+    Style.merge = merge
+
+
+_build_merge()
+
+
+@lru_cache(maxsize=256)
+def _make_color(color: Union[str, tuple]) -> pygame.Color:
+    """Parse a color value once; hex and named colors are otherwise re-parsed every frame"""
+    # pygame.Color parses names, hex strings and RGB(A) tuples directly, without unpacking
+    return pygame.Color(color)
+
+
+def clear_font_cache() -> None:
+    """Drop cached fonts; they are invalid once pygame.font has been shut down"""
+    _resolve_font.cache_clear()
+    _resolve_font_name.cache_clear()
+    get_default_font.cache_clear()
+    _available_fonts.cache_clear()
+
+
+def _normalize_font_name(name: str) -> str:
+    return name.lower().replace(" ", "").replace(".", "")
+
+
+@lru_cache(maxsize=1)
+def _available_fonts() -> tuple[tuple[str, ...], frozenset[str], dict[str, str]]:
+    """Installed system font names: ordered, as a set, and keyed by normalized name"""
+    fonts = tuple(pygame.font.get_fonts())
+    normalized = {}
+    for font in fonts:
+        normalized.setdefault(_normalize_font_name(font), font)
+    return fonts, frozenset(fonts), normalized
+
+
+@lru_cache(maxsize=32)
+def _resolve_font_name(font_family: str) -> Optional[str]:
+    """Resolve a font family to an installed font name (cached separately from Font objects)"""
+    available_fonts, available_set, normalized_fonts = _available_fonts()
+    font_name = None
+    
+    # Better font selection for quality and kerning
+    if font_family == "system":
+        import sys
         
-        # Scale font size for high DPI displays
-        from lumina.core.display import DisplayManager
-        font_size = DisplayManager.scale_font_size(self.font_size)
+        if sys.platform == "darwin":  # macOS
+            # Use fonts known for crisp rendering on macOS
+            preferred_fonts = [
+                "SF Pro Text",         # Native San Francisco font
+                "Helvetica",           # Classic, crisp font
+                "Arial",               # Universal fallback
+            ]
+        elif sys.platform == "win32":  # Windows
+            preferred_fonts = [
+                "Segoe UI",
+                "Calibri", 
+                "Arial",
+            ]
+        else:  # Linux
+            preferred_fonts = [
+                "Ubuntu",
+                "Liberation Sans",
+                "DejaVu Sans",
+                "Arial",
+            ]
         
-        if font_name:
-            font = pygame.font.SysFont(font_name, int(font_size), bold, italic)
-        else:
-            # Fallback to default font
-            font = pygame.font.Font(None, int(font_size))
+        # Try to find the best available font
+        for font in preferred_fonts:
+            # Try exact match first
+            if font in available_set:
+                font_name = font
+                break
+            # Try case-insensitive match, then fall back to a partial match
+            font_key = _normalize_font_name(font)
+            if font_key in normalized_fonts:
+                font_name = normalized_fonts[font_key]
+                break
+            for available in available_fonts:
+                if font_key in available.lower():
+                    font_name = available
+                    break
+            if font_name:
+                break
         
-        # Cache the font for future use
-        self._font_cache[cache_key] = font
-        return font
\ No newline at end of file
+        if not font_name:
+            font_name = pygame.font.get_default_font()
+    else:
+        # Check if requested font exists
+        if font_family.lower().replace(" ", "") in available_set:
+            font_name = font_family
+    
+    return font_name
+
+
+@lru_cache(maxsize=128)
+def _resolve_font(font_family: str, font_size: int, bold: bool, italic: bool) -> pygame.font.Font:
+    """Load a font, shared by every Style with the same settings"""
+    font_name = _resolve_font_name(font_family)
+    
+    if font_name:
+        return pygame.font.SysFont(font_name, font_size, bold, italic)
+    
+    # Fallback to default font
+    return pygame.font.Font(None, font_size)
+
+
+@lru_cache(maxsize=16)
+def get_default_font(font_size: int, bold: bool = False) -> pygame.font.Font:
+    """Get pygame's bundled default font, shared by every caller with the same settings"""
+    if not pygame.font.get_init():
+        pygame.font.init()
+    
+    font = pygame.font.Font(None, font_size)
+    font.set_bold(bold)
+    return font
+
+
+def styled(font_size: float, font_weight: str = "normal", color: Optional[Color] = None) -> Style:
+    """Build a text Style for the given font settings.
+    
+    Each call returns a new Style that the widget may freely mutate; the font
+    itself is resolved and cached once per settings by Style.get_font.
+    """
+    return Style(font_size=font_size, font_weight=font_weight, foreground_color=color)
@@ -4,46 +4,119 @@ Advanced text rendering with emoji support and better typography
 import pygame
 import sys
 import re
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Optional, Tuple, List
 from lumina.core.style import Style
 
 
+# Unicode ranges for emojis
+_EMOJI_PATTERN_STR = (
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map symbols
+    "\U0001F1E0-\U0001F1FF"  # flags (iOS)
+    "\U0001F900-\U0001F9FF"  # supplemental symbols
+    "\U00002600-\U000027BF"  # miscellaneous symbols
+    "\U0000FE00-\U0000FE0F"  # variation selectors
+    "]+"
+)
+_EMOJI_RE = re.compile(_EMOJI_PATTERN_STR, re.UNICODE)
+
+
 class TextRenderer:
     """Advanced text renderer with emoji and typography support"""
     
     _emoji_font_cache = {}
     _system_font_cache = {}
     
+    # Rendered surfaces shared by every widget drawing the same text, font and color
+    _TEXT_CACHE: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+    _TEXT_CACHE_MAX = 512
+    
+    # Pixel format convert_alpha() produces for the current display (None until known)
+    _display_alpha_format: Optional[tuple] = None
+    
+    @classmethod
+    def set_display_format(cls) -> None:
+        """Record the display's alpha pixel format; call after pygame.display.set_mode"""
+        probe = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+        display_alpha_format = (probe.get_bitsize(), probe.get_masks())
+        
+        # Surfaces cached before (or for another) display would be converted on every blit
+        if display_alpha_format != cls._display_alpha_format:
+            cls._TEXT_CACHE.clear()
+        cls._display_alpha_format = display_alpha_format
+    
+    @classmethod
+    def _to_display_format(cls, surface: pygame.Surface) -> pygame.Surface:
+        """Convert to the display's alpha format, skipping the copy when it already matches"""
+        if (surface.get_flags() & pygame.SRCALPHA
+                and (surface.get_bitsize(), surface.get_masks()) == cls._display_alpha_format):
+            return surface
+        # Without a display there's no format to match (and convert_alpha would raise)
+        if cls._display_alpha_format is None and pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha()
+    
     @classmethod
     def render_text(cls, text: str, style: Style, color: pygame.Color) -> pygame.Surface:
         """Render text with emoji support and better typography"""
         if not text:
             return pygame.Surface((1, 1), pygame.SRCALPHA)
         
+        # Keying on the font object keeps it alive, so its identity can't be reused
+        key = (text, style.get_font(), tuple(color))
+        cached = cls._TEXT_CACHE.get(key)
+        if cached is not None:
+            cls._TEXT_CACHE.move_to_end(key)
+            return cached
+        
         # Replace emojis with Unicode symbols that work well in pygame
         from lumina.core.emoji_handler import replace_emojis_with_symbols
         processed_text = replace_emojis_with_symbols(text)
         
         # Render the processed text
-        return cls._render_simple_text(processed_text, style, color)
+        surface = cls._render_simple_text(processed_text, style, color)
+        
+        cls._TEXT_CACHE[key] = surface
+        if len(cls._TEXT_CACHE) > cls._TEXT_CACHE_MAX:
+            cls._TEXT_CACHE.popitem(last=False)
+        return surface
+    
+    @classmethod
+    def render_with_font(cls, text: str, font: pygame.font.Font, color: pygame.Color) -> pygame.Surface:
+        """Render text exactly as given with a specific font, sharing the surface cache"""
+        # The trailing marker keeps these apart from emoji-processed render_text entries
+        key = (text, font, tuple(color), "font")
+        cached = cls._TEXT_CACHE.get(key)
+        if cached is not None:
+            cls._TEXT_CACHE.move_to_end(key)
+            return cached
+        
+        surface = cls._to_display_format(font.render(text, True, color))
+        
+        cls._TEXT_CACHE[key] = surface
+        if len(cls._TEXT_CACHE) > cls._TEXT_CACHE_MAX:
+            cls._TEXT_CACHE.popitem(last=False)
+        return surface
+    
+    @classmethod
+    def invalidate(cls, text: Optional[str] = None) -> None:
+        """Drop cached surfaces for the given text, or all of them"""
+        if text is None:
+            cls._TEXT_CACHE.clear()
+            _text_size.cache_clear()
+            return
+        
+        for key in [key for key in cls._TEXT_CACHE if key[0] == text]:
+            del cls._TEXT_CACHE[key]
     
     @classmethod
     def _contains_emoji(cls, text: str) -> bool:
         """Check if text contains emoji characters"""
-        # Unicode ranges for emojis
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"  # emoticons
-            "\U0001F300-\U0001F5FF"  # symbols & pictographs
-            "\U0001F680-\U0001F6FF"  # transport & map symbols
-            "\U0001F1E0-\U0001F1FF"  # flags (iOS)
-            "\U0001F900-\U0001F9FF"  # supplemental symbols
-            "\U00002600-\U000027BF"  # miscellaneous symbols
-            "\U0000FE00-\U0000FE0F"  # variation selectors
-            "]+", 
-            flags=re.UNICODE
-        )
-        return bool(emoji_pattern.search(text))
+        return bool(_EMOJI_RE.search(text))
     
     @classmethod
     def _render_simple_text(cls, text: str, style: Style, color: pygame.Color) -> pygame.Surface:
@@ -54,7 +127,7 @@ class TextRenderer:
         surface = font.render(text, True, color)
         
         # Convert to optimal pixel format to prevent rendering issues
-        return surface.convert_alpha()
+        return cls._to_display_format(surface)
     
     @classmethod
     def _render_text_with_emojis(cls, text: str, style: Style, color: pygame.Color) -> pygame.Surface:
@@ -116,23 +189,10 @@ class TextRenderer:
     @classmethod
     def _split_text_and_emojis(cls, text: str) -> List[Tuple[str, bool]]:
         """Split text into parts marking which are emojis"""
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"
-            "\U0001F300-\U0001F5FF" 
-            "\U0001F680-\U0001F6FF"
-            "\U0001F1E0-\U0001F1FF"
-            "\U0001F900-\U0001F9FF"
-            "\U00002600-\U000027BF"
-            "\U0000FE00-\U0000FE0F"
-            "]+",
-            flags=re.UNICODE
-        )
-        
         parts = []
         last_end = 0
         
-        for match in emoji_pattern.finditer(text):
+        for match in _EMOJI_RE.finditer(text):
             # Add text before emoji
             if match.start() > last_end:
                 parts.append((text[last_end:match.start()], False))
@@ -153,9 +213,10 @@ class TextRenderer:
         if not parts:
             return pygame.Surface((1, 1), pygame.SRCALPHA)
         
-        # Get fonts
+        # Get fonts (the larger emoji font is looked up once, not per emoji part)
         text_font = style.get_font()
         emoji_font = cls._get_emoji_font(style.font_size)
+        large_emoji_font = cls._get_emoji_font(style.font_size * 1.2) if emoji_font else None
         
         # Calculate total size needed
         total_width = 0
@@ -171,7 +232,6 @@ class TextRenderer:
                 # Try to render with emoji font using a larger size for visibility
                 try:
                     # Use a larger emoji font for better visibility
-                    large_emoji_font = cls._get_emoji_font(style.font_size * 1.2)
                     if large_emoji_font:
                         surface = large_emoji_font.render(part_text, True, color)
                         # If that fails or is too small, try fallback
@@ -196,9 +256,8 @@ class TextRenderer:
         if not rendered_parts:
             return pygame.Surface((1, 1), pygame.SRCALPHA)
         
-        # Create combined surface
+        # Create combined surface (new SRCALPHA surfaces start fully transparent)
         combined = pygame.Surface((total_width, max_height), pygame.SRCALPHA)
-        combined.fill((0, 0, 0, 0))  # Transparent background
         
         # Blit all parts
         x_offset = 0
@@ -209,7 +268,7 @@ class TextRenderer:
             x_offset += surface.get_width()
         
         # Convert to optimal format
-        return combined.convert_alpha()
+        return cls._to_display_format(combined)
     
     @classmethod
     def get_text_size(cls, text: str, style: Style) -> Tuple[int, int]:
@@ -217,10 +276,17 @@ class TextRenderer:
         if not text:
             return (0, 0)
         
-        # Process emojis first
-        from lumina.core.emoji_handler import replace_emojis_with_symbols
-        processed_text = replace_emojis_with_symbols(text)
-        
-        # Use font metrics for size calculation
         font = style.get_font()
-        return font.size(processed_text)
\ No newline at end of file
+        # Fonts are shared and set_bold/set_italic/set_underline change their metrics, so the toggles are part of the key
+        return _text_size(text, font, font.get_bold(), font.get_italic(), font.get_underline())
+
+
+@lru_cache(maxsize=2048)
+def _text_size(text: str, font: pygame.font.Font, bold: bool, italic: bool, underline: bool) -> Tuple[int, int]:
+    """Measure text with a font whose style toggles currently match bold/italic/underline"""
+    # Process emojis first
+    from lumina.core.emoji_handler import replace_emojis_with_symbols
+    processed_text = replace_emojis_with_symbols(text)
+    
+    # Use font metrics for size calculation
+    return font.size(processed_text)
@@ -25,12 +25,22 @@ class Rect:
     width: float
     height: float
     
+    # Right/bottom edges are derived on access, so they stay right if x/y/width/height are changed
+    @property
+    def x2(self) -> float:
+        return self.x + self.width
+    
+    @property
+    def y2(self) -> float:
+        return self.y + self.height
+    
     def to_pygame_rect(self) -> pygame.Rect:
         return pygame.Rect(int(self.x), int(self.y), int(self.width), int(self.height))
     
     def contains(self, x: float, y: float) -> bool:
-        return (self.x <= x <= self.x + self.width and 
-                self.y <= y <= self.y + self.height)
+        left = self.x
+        top = self.y
+        return left <= x <= left + self.width and top <= y <= top + self.height
 
 
 @dataclass
@@ -78,6 +88,11 @@ class EventType(Enum):
     UNMOUNT = "unmount"
 
 
+# Widgets store handlers in a list indexed by event ordinal instead of a dict keyed by enum
+_EVENT_COUNT = len(EventType)
+_EVENT_INDEX: dict[EventType, int] = {e: i for i, e in enumerate(EventType)}
+
+
 @runtime_checkable
 class Renderable(Protocol):
     def render(self, surface: pygame.Surface, rect: Rect) -> None:
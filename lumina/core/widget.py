@@ -1,17 +1,65 @@
 from typing import Optional, Any, Callable, TYPE_CHECKING
 from abc import ABC, abstractmethod
+from functools import wraps
 import pygame
-from lumina.core.types import Rect, Padding, Margin, EventType
+from lumina.core.types import Rect, Padding, Margin, EventType, _EVENT_COUNT, _EVENT_INDEX
 from lumina.core.style import Style
-import uuid
+import itertools
 
 if TYPE_CHECKING:
     from lumina.core.window import Window
 
+# IDs only need to be unique within the process, so a counter avoids a urandom read per widget
+_ID_COUNTER = itertools.count()
+
+# Shadows and focus rings are drawn outside the widget's rect, so repaint a little beyond it
+_DIRTY_MARGIN = 32
+
+_MOUNT_INDEX = _EVENT_INDEX[EventType.MOUNT]
+_UNMOUNT_INDEX = _EVENT_INDEX[EventType.UNMOUNT]
+
+
+def _log_handler_error(event_type: EventType, error: Exception) -> None:
+    print(f"Error in event handler for {event_type}: {error}")
+
+
+def _style_fingerprint(style: Style) -> tuple:
+    """The style settings calculate_size implementations depend on"""
+    return style.font_family, style.font_size, style.font_weight, style.font_style
+
+
+def _cached_size(calculate_size: Callable) -> Callable:
+    """Memoize a calculate_size implementation per widget and available size"""
+    @wraps(calculate_size)
+    def wrapper(self: "Widget", available_width: float, available_height: float) -> tuple[float, float]:
+        # A font edit on this widget's style (in place or by swapping the Style) changes its size,
+        # and with it the sizes of its ancestors
+        fingerprint = _style_fingerprint(self.style)
+        if self._size_fingerprint != fingerprint:
+            self._size_fingerprint = fingerprint
+            self._clear_size_cache()
+        
+        # The implementation is part of the key so an overriding subclass can still call super()
+        key = (calculate_size, round(available_width, 1), round(available_height, 1))
+        size = self._size_cache.get(key)
+        if size is None:
+            size = self._size_cache[key] = calculate_size(self, available_width, available_height)
+        return size
+    return wrapper
+
 
 class Widget(ABC):
     """Base class for all Lumina widgets"""
     
+    # Subclasses that don't declare __slots__ still get a __dict__ for their own attributes
+    __slots__ = (
+        "id", "style", "padding", "margin", "_visible", "_rect", "_parent", "_window",
+        "_event_handlers", "_is_mounted", "_size_cache", "_size_fingerprint", "__weakref__",
+    )
+    
+    # Widgets with frame-stepped animations set this; their window steps them once per frame
+    _animated = False
+    
     def __init__(
         self,
         id: Optional[str] = None,
@@ -19,19 +67,27 @@ class Widget(ABC):
         padding: Optional[Padding] = None,
         margin: Optional[Margin] = None,
         visible: bool = True,
+        id_generator: Optional[Callable[[], str]] = None,
         **kwargs
     ):
-        self.id = id or str(uuid.uuid4())
+        if id:
+            self.id = id
+        elif id_generator:
+            self.id = id_generator()
+        else:
+            self.id = f"w{next(_ID_COUNTER):x}"
         self.style = style or Style()
         self.padding = padding or Padding()
         self.margin = margin or Margin()
-        self.visible = visible
+        self._visible = visible
         
         self._rect = Rect(0, 0, 0, 0)
         self._parent: Optional[Widget] = None
         self._window: Optional["Window"] = None
-        self._event_handlers: dict[EventType, list[Callable]] = {}
+        self._event_handlers: list[Optional[list[Callable]]] = [None] * _EVENT_COUNT
         self._is_mounted = False
+        self._size_cache: dict[tuple, tuple[float, float]] = {}
+        self._size_fingerprint: Optional[tuple] = None
         
         # Apply any additional kwargs as properties
         for key, value in kwargs.items():
@@ -42,6 +98,19 @@ class Widget(ABC):
     def rect(self) -> Rect:
         return self._rect
     
+    @property
+    def visible(self) -> bool:
+        return self._visible
+    
+    @visible.setter
+    def visible(self, visible: bool) -> None:
+        if visible == self._visible:
+            return
+        self._visible = visible
+        if self._parent is not None:
+            self._parent._on_child_visibility_change(self)
+        self.invalidate_layout()
+    
     @property
     def parent(self) -> Optional["Widget"]:
         return self._parent
@@ -55,12 +124,16 @@ class Widget(ABC):
         self._parent = parent
         self._window = window or (parent.window if parent else None)
         self._is_mounted = True
-        self._emit_event(EventType.MOUNT)
+        if self._animated and self._window:
+            self._window.animate(self)
+        if self._event_handlers[_MOUNT_INDEX] is not None:
+            self._emit_event(EventType.MOUNT)
         self.on_mount()
     
     def unmount(self) -> None:
         """Called when widget is removed from the widget tree"""
-        self._emit_event(EventType.UNMOUNT)
+        if self._event_handlers[_UNMOUNT_INDEX] is not None:
+            self._emit_event(EventType.UNMOUNT)
         self.on_unmount()
         self._is_mounted = False
         self._parent = None
@@ -74,27 +147,44 @@ class Widget(ABC):
         """Override to handle unmount event"""
         pass
     
+    def _on_child_visibility_change(self, child: "Widget") -> None:
+        """Override to refresh anything derived from which children are visible"""
+        pass
+    
+    def _update_animations(self) -> None:
+        """Override to advance animations by window.frame_dt (called once per frame when _animated)"""
+        pass
+    
+    def clear_render_cache(self) -> None:
+        """Override to drop cached surfaces (called on theme change)"""
+        pass
+    
     def add_event_listener(self, event_type: EventType, handler: Callable) -> Callable[[], None]:
         """Add an event listener. Returns function to remove listener."""
-        if event_type not in self._event_handlers:
-            self._event_handlers[event_type] = []
+        index = _EVENT_INDEX[event_type]
+        if self._event_handlers[index] is None:
+            self._event_handlers[index] = []
         
-        self._event_handlers[event_type].append(handler)
+        self._event_handlers[index].append(handler)
         
         def remove():
-            if event_type in self._event_handlers:
-                self._event_handlers[event_type].remove(handler)
+            handlers = self._event_handlers[index]
+            if handlers is not None:
+                handlers.remove(handler)
         
         return remove
     
     def _emit_event(self, event_type: EventType, event_data: Optional[Any] = None) -> None:
         """Emit an event to all registered handlers"""
-        if event_type in self._event_handlers:
-            for handler in self._event_handlers[event_type]:
-                try:
-                    handler(event_data)
-                except Exception as e:
-                    print(f"Error in event handler for {event_type}: {e}")
+        handlers = self._event_handlers[_EVENT_INDEX[event_type]]
+        if not handlers:
+            return
+        
+        for handler in handlers:
+            try:
+                handler(event_data)
+            except Exception as e:
+                _log_handler_error(event_type, e)
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle pygame event. Returns True if event was consumed."""
@@ -115,11 +205,29 @@ class Widget(ABC):
         pass
     
     def invalidate(self) -> None:
-        """Mark widget as needing redraw"""
+        """Mark widget as needing redraw (repaint only; use invalidate_layout if its size may change)"""
         # Only invalidate if we have a window and we're actually mounted
         # This prevents excessive invalidation during construction/teardown
         if self._window and self._is_mounted:
-            self._window.invalidate()
+            self._window.invalidate(self.dirty_rect())
+            if self._animated:
+                self._window.animate(self)
+    
+    def invalidate_layout(self) -> None:
+        """Mark widget as needing redraw after a change that may affect its size"""
+        self._clear_size_cache()
+        self.invalidate()
+    
+    def _clear_size_cache(self) -> None:
+        """Drop cached sizes for this widget and its ancestors, whose sizes depend on it"""
+        widget = self
+        while widget is not None:
+            widget._size_cache.clear()
+            widget = widget._parent
+    
+    def dirty_rect(self) -> Optional[pygame.Rect]:
+        """Screen area to repaint when this widget changes (None repaints the whole window)"""
+        return self._rect.to_pygame_rect().inflate(2 * _DIRTY_MARGIN, 2 * _DIRTY_MARGIN)
     
     def contains_point(self, x: float, y: float) -> bool:
         """Check if point is within widget bounds"""
@@ -1,10 +1,22 @@
 from typing import Optional, Union, Callable
 import pygame
 import asyncio
+import numpy as np
+from time import monotonic
 from lumina.core.widget import Widget
 from lumina.core.types import Rect, Color
+from lumina.core.graphics import ModernGraphics
+from lumina.core.style import Style, clear_font_cache
+from lumina.core.text_renderer import TextRenderer
 from lumina.themes import Theme, themes
 
+# Below this many children a plain Python scan beats NumPy's per-call overhead
+_VECTOR_HIT_TEST_MIN = 16
+
+# Frame rate cap, and the matching time per frame for the async loop's sleep
+_FPS = 60
+_FRAME_BUDGET = 1 / _FPS
+
 
 class Window:
     """Main window container for Lumina applications"""
@@ -42,12 +54,24 @@ class Window:
         self._surface: Optional[pygame.Surface] = None
         self._clock: Optional[pygame.time.Clock] = None
         self._running = False
-        self._needs_redraw = True
         self._mouse_pos = (0, 0)
         self._focused_widget: Optional[Widget] = None
         self._hovered_widget: Optional[Widget] = None
-        self._last_invalidate_time = 0.0
-        self._invalidate_throttle = 1.0 / 120.0  # Max 120fps invalidation
+        
+        # Frame clock shared by all widget animations, advanced once per frame
+        self.frame_time = monotonic()
+        self.frame_dt = 0.0
+        # Widgets to step before the next render; animating widgets re-add themselves by invalidating
+        self._animating: dict[Widget, None] = {}
+        
+        # Regions to repaint next frame; a full redraw repaints everything
+        self._dirty_rects: list[pygame.Rect] = []
+        self._full_redraw = True
+        # Regions whose pixels were shifted in place; they need presenting but not repainting
+        self._scrolled_rects: list[pygame.Rect] = []
+        
+        # Child bounds as an (N, 4) x/y/x2/y2 array for vectorized hit testing, rebuilt after layout
+        self._child_bounds: Optional[np.ndarray] = None
         
         # Event loop
         self._event_loop: Optional[asyncio.AbstractEventLoop] = None
@@ -65,26 +89,68 @@ class Window:
     def add_child(self, child: Widget) -> None:
         """Add a child widget to the window"""
         self.children.append(child)
+        self._child_bounds = None
         if self._running:
             child.mount(parent=None, window=self)
-            self.invalidate()
+            self.force_full_redraw()
     
     def remove_child(self, child: Widget) -> None:
         """Remove a child widget from the window"""
         if child in self.children:
             child.unmount()
             self.children.remove(child)
-            self.invalidate()
+            self._child_bounds = None
+            self.force_full_redraw()
     
-    def invalidate(self) -> None:
-        """Mark window as needing redraw"""
-        import time
-        current_time = time.time()
-        
-        # Throttle invalidation to prevent excessive redraws that cause text pulsing
-        if current_time - self._last_invalidate_time > self._invalidate_throttle:
-            self._needs_redraw = True
-            self._last_invalidate_time = current_time
+    def invalidate(self, rect: Optional[pygame.Rect] = None) -> None:
+        """Mark a region (or the whole window if rect is None) as needing redraw"""
+        if self._full_redraw:
+            return
+        
+        if rect is None:
+            self.force_full_redraw()
+        else:
+            self._dirty_rects.append(rect)
+    
+    def animate(self, widget: Widget) -> None:
+        """Step a widget's animations once before the next frame is rendered"""
+        self._animating[widget] = None
+    
+    def force_full_redraw(self) -> None:
+        """Repaint the whole window next frame (theme change, resize, tree changes)"""
+        self._full_redraw = True
+        self._dirty_rects.clear()
+        self._scrolled_rects.clear()
+    
+    def scroll_area(self, area: pygame.Rect, dx: int, dy: int) -> bool:
+        """Shift the pixels already drawn in area and repaint only the strips scrolled into view.
+        
+        Returns False without changing anything when the drawn pixels can't be reused,
+        in which case the caller should invalidate the area instead.
+        """
+        surface = self._surface
+        if surface is None or self._full_redraw:
+            return False
+        
+        area = area.clip(surface.get_rect())
+        if abs(dx) >= area.width or abs(dy) >= area.height:
+            return False
+        # Pixels that are still waiting to be repainted are stale, so don't move them around
+        if area.collidelist(self._dirty_rects) != -1:
+            return False
+        
+        surface.subsurface(area).scroll(dx, dy)
+        self._scrolled_rects.append(area)
+        
+        if dy > 0:
+            self._dirty_rects.append(pygame.Rect(area.x, area.y, area.width, dy))
+        elif dy < 0:
+            self._dirty_rects.append(pygame.Rect(area.x, area.bottom + dy, area.width, -dy))
+        if dx > 0:
+            self._dirty_rects.append(pygame.Rect(area.x, area.y, dx, area.height))
+        elif dx < 0:
+            self._dirty_rects.append(pygame.Rect(area.right + dx, area.y, -dx, area.height))
+        return True
     
     def set_theme(self, theme) -> None:
         """Update window theme and trigger complete redraw"""
@@ -93,9 +159,11 @@ class Window:
         
         # Force complete re-render by clearing all caches
         self._clear_all_caches()
+        ModernGraphics.clear_cache()
+        TextRenderer.invalidate()
         
         # Force immediate redraw
-        self.invalidate()
+        self.force_full_redraw()
         
         # Trigger layout recalculation 
         self.layout()
@@ -103,24 +171,15 @@ class Window:
     def _clear_all_caches(self) -> None:
         """Clear all cached rendering data recursively"""
         def clear_recursive(widget):
-            # Clear all possible cached data
-            if hasattr(widget, '_rendered_text'):
-                widget._rendered_text = None
-            if hasattr(widget, '_last_text'):
-                widget._last_text = None
-            if hasattr(widget, '_cached_surface'):
-                widget._cached_surface = None
-            
-            # Clear any button state caches
-            if hasattr(widget, '_button_surface'):
-                widget._button_surface = None
+            widget.clear_render_cache()
             
             # Don't call widget.invalidate() here as it creates invalidation loops
             # The window invalidation will trigger re-render anyway
             
             # Recursively clear children
-            if hasattr(widget, 'children') and widget.children:
-                for child in widget.children:
+            children = getattr(widget, 'children', None)
+            if children:
+                for child in children:
                     clear_recursive(child)
         
         # Clear all widget caches
@@ -129,6 +188,8 @@ class Window:
     
     def layout(self) -> None:
         """Layout all child widgets"""
+        self._child_bounds = None
+        self.force_full_redraw()
         if not self.children:
             return
         
@@ -147,25 +208,47 @@ class Window:
             y_offset += child_height
     
     def render(self) -> None:
-        """Render the window and all children"""
+        """Render the parts of the window that changed since the last frame"""
         if not self._surface:
             return
         
-        # With double buffering, we need to redraw every frame
-        # Clear background
-        bg_color = self.theme.background_color
-        if isinstance(bg_color, str):
-            bg_color = pygame.Color(bg_color)
-        self._surface.fill(bg_color)
+        background = Style.to_pygame_color(self.theme.background_color)
         
-        # Render children
-        for child in self.children:
-            if child.visible:
-                child.render(self._surface)
+        # Reset pending work first so widgets invalidating while they render land in the next frame
+        if self._full_redraw:
+            self._full_redraw = False
+            self._dirty_rects = []
+            self._scrolled_rects = []
+            
+            self._surface.fill(background)
+            for child in self.children:
+                if child.visible:
+                    child.render(self._surface)
+            
+            pygame.display.flip()
+            return
+        
+        if not self._dirty_rects:
+            return
+        
+        dirty = _merge_rects(self._dirty_rects)
+        self._dirty_rects = []
+        scrolled = self._scrolled_rects
+        self._scrolled_rects = []
         
-        # Update display
-        pygame.display.flip()
-        self._needs_redraw = False
+        surface = self._surface
+        for area in dirty:
+            surface.set_clip(area)
+            surface.fill(background, area)
+            for child in self.children:
+                if not child.visible:
+                    continue
+                child_area = child.dirty_rect()
+                if child_area is None or area.colliderect(child_area):
+                    child.render(surface)
+        surface.set_clip(None)
+        
+        pygame.display.update(dirty + scrolled)
     
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handle pygame events"""
@@ -182,32 +265,43 @@ class Window:
                     (self.width, self.height),
                     pygame.RESIZABLE if self.resizable else 0
                 )
+                TextRenderer.set_display_format()
                 self.layout()
-                self.invalidate()
         
         elif event.type == pygame.MOUSEMOTION:
             self._mouse_pos = event.pos
             self._update_hover_state()
+            
+            # Widgets track hover from motion events, including the ones the pointer just left
+            for child in self.children:
+                if child.visible:
+                    child.handle_event(event)
         
         elif event.type in [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP]:
             # Find widget under mouse and send click event
-            for child in reversed(self.children):
-                if child.visible and child.contains_point(*self._mouse_pos):
-                    if child.handle_event(event):
-                        break
+            for child in self._children_at(*self._mouse_pos):
+                if child.handle_event(event):
+                    break
+        
+        # The wheel scrolls whatever is under the pointer
+        elif event.type == pygame.MOUSEWHEEL:
+            for child in self._children_at(*self._mouse_pos):
+                if child.handle_event(event):
+                    break
         
         # Pass events to focused widget
-        elif self._focused_widget and event.type in [pygame.KEYDOWN, pygame.KEYUP]:
+        elif self._focused_widget and event.type in [pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT]:
             self._focused_widget.handle_event(event)
+        
+        # Custom events (timers posted by widgets) go to the whole tree
+        elif event.type >= pygame.USEREVENT:
+            for child in self.children:
+                if child.visible:
+                    child.handle_event(event)
     
     def _update_hover_state(self) -> None:
         """Update which widget is being hovered"""
-        new_hovered = None
-        
-        for child in reversed(self.children):
-            if child.visible and child.contains_point(*self._mouse_pos):
-                new_hovered = child
-                break
+        new_hovered = next(self._children_at(*self._mouse_pos), None)
         
         if new_hovered != self._hovered_widget:
             # Update hover states but don't invalidate entire window
@@ -215,8 +309,50 @@ class Window:
             self._hovered_widget = new_hovered
             # Let individual widgets handle their own invalidation
     
+    def _children_at(self, x: float, y: float):
+        """Yield visible children under a point, topmost first"""
+        children = self.children
+        if len(children) < _VECTOR_HIT_TEST_MIN:
+            for child in reversed(children):
+                if child.visible and child.contains_point(x, y):
+                    yield child
+            return
+        
+        bounds = self._child_bounds
+        if bounds is None or len(bounds) != len(children):
+            bounds = self._child_bounds = np.array(
+                [(c.rect.x, c.rect.y, c.rect.x2, c.rect.y2) for c in children],
+                dtype=np.float64
+            )
+        
+        mask = (bounds[:, 0] <= x) & (x <= bounds[:, 2]) & (bounds[:, 1] <= y) & (y <= bounds[:, 3])
+        for index in np.flatnonzero(mask)[::-1]:
+            child = children[index]
+            if child.visible:
+                yield child
+    
     def run(self) -> None:
         """Run the window event loop"""
+        self._start()
+        while self._running:
+            self._step()
+            # Cap at 60 FPS
+            self._clock.tick(_FPS)
+        self._stop()
+    
+    async def run_async(self) -> None:
+        """Run the window event loop, yielding to asyncio between frames"""
+        self._start()
+        while self._running:
+            self._step()
+            # Cap at 60 FPS by sleeping out the rest of the frame in the loop, not in Clock.tick,
+            # so other tasks and async observers run meanwhile
+            remaining = _FRAME_BUDGET - (monotonic() - self.frame_time)
+            await asyncio.sleep(max(0.0, remaining))
+        self._stop()
+    
+    def _start(self) -> None:
+        """Open the display and mount the widget tree"""
         pygame.init()
         
         # Setup high DPI support
@@ -240,6 +376,7 @@ class Window:
         
         self._surface = pygame.display.set_mode((scaled_width, scaled_height), flags)
         pygame.display.set_caption(self.title)
+        TextRenderer.set_display_format()
         
         # Setup
         self._clock = pygame.time.Clock()
@@ -248,21 +385,113 @@ class Window:
         # Mount children
         self.mount_children()
         
+        # Resolve fonts before the first frame instead of during it
+        self._warm_up()
+        
         # Initial layout
         self.layout()
+        self.frame_time = monotonic()
+    
+    def _warm_up(self) -> None:
+        """Load every distinct font used by the widget tree"""
+        seen = set()
+        pending = list(self.children)
+        try:
+            while pending:
+                widget = pending.pop()
+                style = widget.style
+                key = (style.font_family, int(style.font_size), style.font_weight, style.font_style)
+                if key not in seen:
+                    seen.add(key)
+                    style.get_font()
+                pending.extend(getattr(widget, 'children', None) or [])
+        except Exception as e:
+            print(f"Error warming up fonts: {e}")
+    
+    def _step(self) -> None:
+        """Process one frame"""
+        now = monotonic()
+        self.frame_dt = now - self.frame_time
+        self.frame_time = now
         
-        # Main loop
-        while self._running:
-            # Handle events
-            for event in pygame.event.get():
-                self.handle_event(event)
-            
-            # Render
-            self.render()
-            
-            # Cap at 60 FPS
-            self._clock.tick(60)
+        # Handle events
+        for event in _coalesce_events(pygame.event.get()):
+            self.handle_event(event)
+        
+        # Advance animations exactly once per frame, however many dirty areas render them
+        self._step_animations()
+        
+        # Render
+        self.render()
+    
+    def _step_animations(self) -> None:
+        """Step the widgets that asked for an animation frame"""
+        if not self._animating:
+            return
         
+        animating = self._animating
+        self._animating = {}
+        for widget in animating:
+            if widget.window is self:
+                widget._update_animations()
+    
+    def _stop(self) -> None:
+        """Unmount the widget tree and close the display"""
         # Cleanup
         self.unmount_children()
-        pygame.quit()
\ No newline at end of file
+        
+        # Shared fonts die with pygame.font, so don't hand them to the next run
+        TextRenderer.invalidate()
+        clear_font_cache()
+        pygame.quit()
+
+
+def _coalesce_events(events: list[pygame.event.Event]) -> list[pygame.event.Event]:
+    """Collapse each run of consecutive mouse motion or wheel events into one, keeping clicks in order"""
+    coalesced: list[pygame.event.Event] = []
+    for event in events:
+        if event.type == pygame.MOUSEWHEEL and coalesced and coalesced[-1].type == pygame.MOUSEWHEEL:
+            previous = coalesced[-1]
+            # Trackpads send a burst of small steps per frame; scroll once by their sum
+            coalesced[-1] = pygame.event.Event(
+                pygame.MOUSEWHEEL,
+                x=previous.x + event.x,
+                y=previous.y + event.y,
+                precise_x=getattr(previous, "precise_x", previous.x) + getattr(event, "precise_x", event.x),
+                precise_y=getattr(previous, "precise_y", previous.y) + getattr(event, "precise_y", event.y),
+                flipped=event.flipped,
+                touch=getattr(event, "touch", False),
+                which=getattr(event, "which", 0),
+                window=getattr(event, "window", None),
+            )
+        elif event.type == pygame.MOUSEMOTION and coalesced and coalesced[-1].type == pygame.MOUSEMOTION:
+            previous = coalesced[-1]
+            # Keep the latest position and buttons, but the total distance moved
+            coalesced[-1] = pygame.event.Event(
+                pygame.MOUSEMOTION,
+                pos=event.pos,
+                rel=(previous.rel[0] + event.rel[0], previous.rel[1] + event.rel[1]),
+                buttons=event.buttons,
+                touch=getattr(event, "touch", False),
+                window=getattr(event, "window", None),
+            )
+        else:
+            coalesced.append(event)
+    return coalesced
+
+
+def _merge_rects(rects: list[pygame.Rect]) -> list[pygame.Rect]:
+    """Union overlapping rects until none overlap (n is small, so O(n^2) is fine)"""
+    merged: list[pygame.Rect] = []
+    for rect in rects:
+        rect = rect.copy()
+        i = 0
+        while i < len(merged):
+            if rect.colliderect(merged[i]):
+                # The grown rect may now touch ones already checked, so rescan
+                rect.union_ip(merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+    return merged
@@ -1,15 +1,16 @@
+from functools import cached_property
 from lumina.themes.theme import Theme
 
 
 class ThemeCollection:
-    """Collection of default themes"""
+    """Collection of default themes (each built once and shared; derive() a copy to customize)"""
     
-    @property
+    @cached_property
     def default_light(self) -> Theme:
         """Default light theme"""
         return Theme()
     
-    @property
+    @cached_property
     def default_dark(self) -> Theme:
         """Default dark theme"""
         return Theme(
@@ -46,7 +47,7 @@ class ThemeCollection:
             shadow_color="rgba(0, 0, 0, 0.3)",
         )
     
-    @property
+    @cached_property
     def material_light(self) -> Theme:
         """Material Design 3 inspired light theme"""
         return Theme(
@@ -68,7 +69,7 @@ class ThemeCollection:
             radius_xl=28,
         )
     
-    @property
+    @cached_property
     def material_dark(self) -> Theme:
         """Material Design 3 inspired dark theme"""
         return Theme(
@@ -90,7 +91,7 @@ class ThemeCollection:
             radius_xl=28,
         )
     
-    @property
+    @cached_property
     def github_light(self) -> Theme:
         """GitHub-inspired light theme"""
         return Theme(
@@ -110,7 +111,7 @@ class ThemeCollection:
             font_family="SF Pro Display, Segoe UI, sans-serif",
         )
     
-    @property
+    @cached_property
     def github_dark(self) -> Theme:
         """GitHub-inspired dark theme"""
         return Theme(
@@ -1,9 +1,16 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
+from itertools import count
 from typing import Optional, Union
+import pygame
 from lumina.core.types import Color
+from lumina.core.style import Style
 
 
-@dataclass
+# Source of Theme.revision values; never reused, unlike id() of a collected theme
+_REVISIONS = count()
+
+
+@dataclass(slots=True)
 class Theme:
     """Theme configuration for Lumina applications"""
     
@@ -75,16 +82,37 @@ class Theme:
     z_tooltip: int = 1150
     z_notification: int = 1200
     
+    # Parsed color fields and a process-unique revision, both kept current by __setattr__
+    _colors: dict[str, pygame.Color] = field(init=False, repr=False, compare=False)
+    _revision: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Parse every color once so render code reads pygame.Color objects instead of hex strings
+        object.__setattr__(self, "_colors", {name: _parse_color(getattr(self, name)) for name in _COLOR_FIELDS})
+        object.__setattr__(self, "_revision", next(_REVISIONS))
+    
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        # Edits after construction re-parse the color and move to a new revision, so widget caches keyed on it miss
+        colors = getattr(self, "_colors", None)
+        if colors is not None:
+            if name in colors:
+                colors[name] = _parse_color(value)
+            object.__setattr__(self, "_revision", next(_REVISIONS))
+    
+    @property
+    def revision(self) -> int:
+        """Changes whenever a field is assigned; distinct across all themes, so safe as a cache key"""
+        return self._revision
+    
+    def rgb(self, name: str) -> pygame.Color:
+        """Get a color field as a parsed pygame.Color (shared, so don't mutate it)"""
+        return self._colors[name]
+    
     def derive(self, **overrides) -> "Theme":
         """Create a new theme based on this one with overrides"""
-        import copy
-        new_theme = copy.deepcopy(self)
-        
-        for key, value in overrides.items():
-            if hasattr(new_theme, key):
-                setattr(new_theme, key, value)
-        
-        return new_theme
+        # Every field is an immutable value, so a shallow replace is enough
+        return replace(self, **{key: value for key, value in overrides.items() if key in _THEME_FIELDS})
     
     @classmethod
     def from_primary_color(cls, primary_color: Color, dark_mode: bool = False) -> "Theme":
@@ -101,4 +129,19 @@ class Theme:
                 border_color="#2E2E2E",
             )
         else:
-            return cls(primary_color=primary_color)
\ No newline at end of file
+            return cls(primary_color=primary_color)
+
+
+# Fields derive() may override (the parsed color table is internal)
+_THEME_FIELDS = frozenset(f.name for f in fields(Theme) if f.init)
+
+# Fields annotated as Color hold colors; derive() goes through __init__, so they are re-parsed
+_COLOR_FIELDS = tuple(f.name for f in fields(Theme) if f.type is Color)
+
+
+def _parse_color(color: Color) -> pygame.Color:
+    """Parse hex, named, tuple and CSS-style rgba(r, g, b, a) colors"""
+    if isinstance(color, str) and color.startswith("rgba("):
+        r, g, b, a = (part.strip() for part in color[5:-1].split(","))
+        return pygame.Color(int(r), int(g), int(b), round(float(a) * 255))
+    return Style.to_pygame_color(color)
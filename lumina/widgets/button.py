@@ -5,6 +5,10 @@ from lumina.core.style import Style
 from lumina.core.types import Color, EventType, Rect, Padding
 
 
+# Buttons only react to the pointer; everything else is rejected up front
+_HANDLED_EVENTS = frozenset({pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP})
+
+
 class Button(Widget):
     """Interactive button widget"""
     
@@ -31,6 +35,15 @@ class Button(Widget):
         self._is_hovered = False
         self._is_pressed = False
         
+        # Resolved colors per (theme, variant, state), dropped on theme change
+        self._color_cache: dict[tuple, tuple] = {}
+        
+        # Last rendered label and the (text, color, font) it was rendered with
+        self._text_surface: Optional[pygame.Surface] = None
+        self._text_key: Optional[tuple] = None
+        self._text_size = (0, 0)
+        self._text_size_key: Optional[tuple] = None
+        
         # Apply variant styles
         self._apply_variant_style()
     
@@ -47,13 +60,18 @@ class Button(Widget):
         elif self.variant == "text":
             self.style.cursor = "pointer"
     
+    def clear_render_cache(self) -> None:
+        """Drop resolved colors so they are rebuilt from the new theme"""
+        self._color_cache.clear()
+        self._text_surface = None
+        self._text_key = None
+    
     def calculate_size(self, available_width: float, available_height: float) -> tuple[float, float]:
         """Calculate button size based on text"""
-        font = self.style.get_font()
-        text_surface = font.render(self.text, True, (0, 0, 0))
+        text_width, text_height = self._measure_text()
         
-        width = text_surface.get_width() + self.padding.left + self.padding.right
-        height = text_surface.get_height() + self.padding.top + self.padding.bottom
+        width = text_width + self.padding.left + self.padding.right
+        height = text_height + self.padding.top + self.padding.bottom
         
         # Apply minimum size
         min_width = 80
@@ -63,10 +81,16 @@ class Button(Widget):
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle mouse events"""
-        if self.disabled:
+        if self.disabled or event.type not in _HANDLED_EVENTS:
             return False
         
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        if event.type == pygame.MOUSEMOTION:
+            was_hovered = self._is_hovered
+            self._is_hovered = self.contains_point(*event.pos)
+            if was_hovered != self._is_hovered:
+                self.invalidate()
+        
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.contains_point(*event.pos):
                 self._is_pressed = True
                 self.invalidate()
@@ -97,45 +121,7 @@ class Button(Widget):
         if not theme:
             return
         
-        # Determine colors based on variant and state
-        if self.disabled:
-            bg_color = pygame.Color(theme.surface_color)
-            text_color = pygame.Color(theme.text_disabled)
-            border_color = pygame.Color(theme.border_color)
-        elif self.variant == "primary":
-            bg_color = pygame.Color(theme.primary_color)
-            text_color = pygame.Color("#FFFFFF")
-            border_color = bg_color
-            
-            # Apply state overlays
-            if self._is_pressed:
-                bg_color = self._apply_overlay(bg_color, (0, 0, 0), 0.2)
-            elif self._is_hovered:
-                bg_color = self._apply_overlay(bg_color, (255, 255, 255), 0.1)
-        
-        elif self.variant == "secondary":
-            bg_color = pygame.Color(theme.background_color)
-            text_color = pygame.Color(theme.primary_color)
-            border_color = pygame.Color(theme.primary_color)
-            
-            if self._is_pressed:
-                bg_color = pygame.Color(theme.primary_color)
-                text_color = pygame.Color("#FFFFFF")
-            elif self._is_hovered:
-                primary_color = pygame.Color(theme.primary_color)
-                bg_color = self._apply_overlay(bg_color, primary_color, 0.05)
-        
-        else:  # text variant
-            bg_color = None
-            text_color = pygame.Color(theme.primary_color)
-            border_color = None
-            
-            if self._is_pressed or self._is_hovered:
-                bg_color = self._apply_overlay(
-                    pygame.Color(theme.background_color),
-                    theme.primary_color,
-                    0.05
-                )
+        bg_color, text_color, border_color = self._get_colors(theme)
         
         # Draw background
         if bg_color:
@@ -160,32 +146,87 @@ class Button(Widget):
             )
         
         # Draw text
-        font = self.style.get_font()
-        text_surface = font.render(self.text, True, text_color)
+        text_surface = self._get_text_surface(text_color)
         
         # Center text
         text_x = self.rect.x + (self.rect.width - text_surface.get_width()) // 2
         text_y = self.rect.y + (self.rect.height - text_surface.get_height()) // 2
         
         surface.blit(text_surface, (text_x, text_y))
+    
+    def _measure_text(self) -> tuple[int, int]:
+        """Label size from font metrics, re-measured only when the text or font change"""
+        font = self.style.get_font()
+        key = (self.text, font, font.get_bold(), font.get_italic(), font.get_underline())
+        if key != self._text_size_key:
+            self._text_size = font.size(self.text)
+            self._text_size_key = key
+        return self._text_size
+    
+    def _get_text_surface(self, text_color: pygame.Color) -> pygame.Surface:
+        """Get the rendered label, re-rasterizing only when text, color or font change"""
+        font = self.style.get_font()
+        key = (self.text, tuple(text_color), font)
+        if key != self._text_key:
+            self._text_surface = font.render(self.text, True, text_color)
+            self._text_key = key
+        return self._text_surface
+    
+    def _get_colors(self, theme) -> tuple:
+        """Get (background, text, border) colors for the current theme and state"""
+        key = (theme.revision, self.variant, self.disabled, self._is_pressed, self._is_hovered)
+        colors = self._color_cache.get(key)
+        if colors is not None:
+            return colors
         
-        # Update hover state
-        mouse_pos = pygame.mouse.get_pos()
-        was_hovered = self._is_hovered
-        self._is_hovered = self.contains_point(*mouse_pos) and not self.disabled
+        # Determine colors based on variant and state
+        if self.disabled:
+            bg_color = theme.rgb("surface_color")
+            text_color = theme.rgb("text_disabled")
+            border_color = theme.rgb("border_color")
+        elif self.variant == "primary":
+            bg_color = theme.rgb("primary_color")
+            text_color = Style.to_pygame_color("#FFFFFF")
+            border_color = bg_color
+            
+            # Apply state overlays
+            if self._is_pressed:
+                bg_color = self._apply_overlay(bg_color, (0, 0, 0), 0.2)
+            elif self._is_hovered:
+                bg_color = self._apply_overlay(bg_color, (255, 255, 255), 0.1)
         
-        if was_hovered != self._is_hovered:
-            self.invalidate()
+        elif self.variant == "secondary":
+            bg_color = theme.rgb("background_color")
+            text_color = theme.rgb("primary_color")
+            border_color = theme.rgb("primary_color")
+            
+            if self._is_pressed:
+                bg_color = theme.rgb("primary_color")
+                text_color = Style.to_pygame_color("#FFFFFF")
+            elif self._is_hovered:
+                primary_color = theme.rgb("primary_color")
+                bg_color = self._apply_overlay(bg_color, primary_color, 0.05)
+        
+        else:  # text variant
+            bg_color = None
+            text_color = theme.rgb("primary_color")
+            border_color = None
+            
+            if self._is_pressed or self._is_hovered:
+                bg_color = self._apply_overlay(
+                    theme.rgb("background_color"),
+                    theme.rgb("primary_color"),
+                    0.05
+                )
+        
+        colors = self._color_cache[key] = (bg_color, text_color, border_color)
+        return colors
     
-    def _apply_overlay(self, base_color: pygame.Color, overlay_color: Union[pygame.Color, tuple], alpha: float) -> pygame.Color:
+    def _apply_overlay(self, base_color: pygame.Color, overlay_color: Union[pygame.Color, Color], alpha: float) -> pygame.Color:
         """Apply an overlay color with alpha blending"""
-        if isinstance(overlay_color, tuple):
-            overlay = pygame.Color(*overlay_color)
-        else:
-            overlay = overlay_color
-        
-        r = int(base_color.r * (1 - alpha) + overlay.r * alpha)
-        g = int(base_color.g * (1 - alpha) + overlay.g * alpha)
-        b = int(base_color.b * (1 - alpha) + overlay.b * alpha)
+        overlay = Style.to_pygame_color(overlay_color)
         
-        return pygame.Color(r, g, b)
\ No newline at end of file
+        # Color.lerp blends all channels in C; the result stays opaque like the theme colors
+        blended = base_color.lerp(overlay, alpha)
+        blended.a = 255
+        return blended
\ No newline at end of file
@@ -1,15 +1,36 @@
 from typing import Optional, Union, Callable
 import pygame
-import time
 from lumina.core.widget import Widget
 from lumina.core.types import Rect, Padding
 from lumina.core.graphics import ModernGraphics
+from lumina.core.style import get_default_font
 from lumina.widgets.container import Container
 
 
+class _TitleCache:
+    """Bold title surface that is only re-rendered when its text or color changes"""
+    
+    def __init__(self, size: int):
+        self.size = size
+        self.clear()
+    
+    def clear(self) -> None:
+        self._key: Optional[tuple] = None
+        self._surface: Optional[pygame.Surface] = None
+    
+    def render(self, title: str, color: pygame.Color) -> pygame.Surface:
+        key = (title, tuple(color))
+        if key != self._key:
+            self._surface = get_default_font(self.size, bold=True).render(title, True, color)
+            self._key = key
+        return self._surface
+
+
 class Card(Container):
     """Modern card component with elevation and hover effects"""
     
+    _animated = True
+    
     def __init__(
         self,
         title: Optional[str] = None,
@@ -35,36 +56,48 @@ class Card(Container):
         # Animation state
         self._is_hovered = False
         self._hover_animation = 0.0
-        self._last_update = time.time()
+        
+        self._title_cache = _TitleCache(20)  # Larger font for title
+        self._title_height_key: Optional[tuple] = None
+        self._title_height_value = 0
         
         # Apply card styling
         self.style.border_radius = 12
         self.style.cursor = "pointer" if clickable else "default"
     
+    def clear_render_cache(self) -> None:
+        """Drop the rendered title so it picks up new theme colors"""
+        self._title_cache.clear()
+    
     def calculate_size(self, available_width: float, available_height: float) -> tuple[float, float]:
         """Calculate card size including title"""
         width, height = super().calculate_size(available_width, available_height)
         
         # Add space for title
-        if self.title:
-            font = self.style.get_font()
-            title_height = font.get_height() + 8  # Add some spacing
-            height += title_height
-        
-        return width, height
+        return width, height + self._title_height()
+    
+    def _title_height(self) -> float:
+        """Vertical space reserved for the title, including spacing below it"""
+        if not self.title:
+            return 0
+        
+        # Font metrics only change with the title font settings, so remember the last result
+        key = (self.style.font_family, self.style.font_size, self.style.font_weight, self.style.font_style)
+        if key != self._title_height_key:
+            self._title_height_value = self.style.get_font().get_height() + 8  # Add some spacing
+            self._title_height_key = key
+        return self._title_height_value
     
     def layout(self, rect: Rect) -> None:
         """Layout card content with title space"""
         self._rect = rect
+        self._hit_index = None
         
         if not self.children:
             return
         
         # Calculate content area (excluding title)
-        title_height = 0
-        if self.title:
-            font = self.style.get_font()
-            title_height = font.get_height() + 8
+        title_height = self._title_height()
         
         content_rect = Rect(
             self.rect.x + self.padding.left,
@@ -110,9 +143,8 @@ class Card(Container):
     
     def _update_animations(self) -> None:
         """Update hover animation"""
-        current_time = time.time()
-        dt = current_time - self._last_update
-        self._last_update = current_time
+        # Step by the window's shared frame time so every widget animates in sync
+        dt = self.window.frame_dt if self.window else 0.0
         
         # Update hover animation
         target_hover = 1.0 if self._is_hovered and self.hoverable else 0.0
@@ -128,18 +160,16 @@ class Card(Container):
         if not self.visible:
             return
         
-        # Update animations
-        self._update_animations()
-        
         # Get theme
         theme = self.window.theme if self.window else None
         if not theme:
             return
         
-        # Calculate elevation and hover effects
-        current_elevation = self.elevation + (2 * self._hover_animation)
+        # Calculate elevation and hover effects, in eighth steps so animation frames hit cached shadows
+        hover = round(self._hover_animation * 8) / 8
+        current_elevation = self.elevation + (2 * hover)
         shadow_offset = (0, int(2 + current_elevation))
-        shadow_blur = 4 + current_elevation * 2
+        shadow_blur = round(4 + current_elevation * 2)
         shadow_alpha = int(20 + current_elevation * 5)
         
         # Draw shadow
@@ -149,13 +179,13 @@ class Card(Container):
             self.style.border_radius,
             blur_radius=shadow_blur,
             offset=shadow_offset,
-            color=ModernGraphics.get_color_with_alpha((0, 0, 0), shadow_alpha)
+            color=(0, 0, 0, shadow_alpha)
         )
         
         # Draw card background
-        bg_color = pygame.Color(theme.surface_color)
-        if self._hover_animation > 0:
-            bg_color = ModernGraphics.lighten_color(bg_color, 0.02 * self._hover_animation)
+        bg_color = theme.rgb("surface_color")
+        if hover > 0:
+            bg_color = ModernGraphics.lighten_color(bg_color, 0.02 * hover)
         
         ModernGraphics.draw_rounded_rect(
             surface,
@@ -169,17 +199,13 @@ class Card(Container):
             self._draw_title(surface, theme)
         
         # Render children
-        for child in self.children:
-            if child.visible:
-                child.render(surface)
+        for child in self._children_in_clip(surface):
+            child.render(surface)
     
     def _draw_title(self, surface: pygame.Surface, theme) -> None:
         """Draw card title"""
-        font = pygame.font.Font(None, 20)  # Larger font for title
-        font.set_bold(True)
-        
-        title_color = pygame.Color(theme.text_primary)
-        title_surface = font.render(self.title, True, title_color)
+        title_color = theme.rgb("text_primary")
+        title_surface = self._title_cache.render(self.title, title_color)
         
         # Position title
         title_x = self.rect.x + self.padding.left
@@ -191,6 +217,8 @@ class Card(Container):
 class Modal(Widget):
     """Modern modal dialog with backdrop and animations"""
     
+    _animated = True
+    
     def __init__(
         self,
         title: str,
@@ -219,16 +247,28 @@ class Modal(Widget):
         self._backdrop_animation = 0.0
         self._modal_animation = 0.0
         self._is_opening = True
-        self._last_update = time.time()
+        
+        self._title_cache = _TitleCache(24)
         
         # Mount content
         for child in self.content:
             child.mount(self, self.window)
     
+    def clear_render_cache(self) -> None:
+        """Drop the rendered title so it picks up new theme colors"""
+        self._title_cache.clear()
+    
     def calculate_size(self, available_width: float, available_height: float) -> tuple[float, float]:
         """Modal takes full screen"""
+        # Containers offer unbounded height, so size to the window instead
+        if self.window:
+            return self.window.width, self.window.height
         return available_width, available_height
     
+    def dirty_rect(self) -> Optional[pygame.Rect]:
+        """The backdrop covers the whole window, so repaint all of it"""
+        return None
+    
     def layout(self, rect: Rect) -> None:
         """Layout modal in center of screen"""
         super().layout(rect)
@@ -247,9 +287,11 @@ class Modal(Widget):
             modal_rect.height - 84  # Space for title and padding
         )
         
+        # The dialog has a fixed size, so children are offered only the space left in it
         y_offset = content_rect.y
+        content_bottom = content_rect.y + content_rect.height
         for child in self.content:
-            child_width, child_height = child.calculate_size(content_rect.width, float('inf'))
+            child_width, child_height = child.calculate_size(content_rect.width, max(0, content_bottom - y_offset))
             
             child_rect = Rect(
                 content_rect.x,
@@ -299,14 +341,15 @@ class Modal(Widget):
     def close(self) -> None:
         """Close the modal"""
         self._is_opening = False
+        # Start the fade-out on the next frame
+        self.invalidate()
         if self.on_close:
             self.on_close()
     
     def _update_animations(self) -> None:
         """Update modal animations"""
-        current_time = time.time()
-        dt = current_time - self._last_update
-        self._last_update = current_time
+        # Step by the window's shared frame time so every widget animates in sync
+        dt = self.window.frame_dt if self.window else 0.0
         
         # Update animations
         target_backdrop = 1.0 if self._is_opening else 0.0
@@ -333,8 +376,9 @@ class Modal(Widget):
         if not self.visible:
             return
         
-        # Update animations
-        self._update_animations()
+        # Fully faded out while closing, so there is nothing left to draw
+        if not self._is_opening and self._modal_animation < 0.01:
+            return
         
         # Get theme
         theme = self.window.theme if self.window else None
@@ -343,11 +387,9 @@ class Modal(Widget):
         
         # Draw backdrop
         backdrop_alpha = int(128 * self._backdrop_animation)
-        backdrop_color = ModernGraphics.get_color_with_alpha((0, 0, 0), backdrop_alpha)
+        backdrop_color = (0, 0, 0, backdrop_alpha)
         
-        backdrop_surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-        backdrop_surface.fill(backdrop_color)
-        surface.blit(backdrop_surface, (self.rect.x, self.rect.y))
+        ModernGraphics.draw_translucent_rect(surface, backdrop_color, self.rect.to_pygame_rect())
         
         # Calculate modal rect with animation
         modal_x = self.rect.x + (self.rect.width - self.modal_width) / 2
@@ -369,11 +411,11 @@ class Modal(Widget):
             16,
             blur_radius=20,
             offset=(0, 8),
-            color=ModernGraphics.get_color_with_alpha((0, 0, 0), int(40 * self._modal_animation))
+            color=(0, 0, 0, int(40 * self._modal_animation))
         )
         
         # Draw modal background
-        modal_bg = pygame.Color(theme.background_color)
+        modal_bg = theme.rgb("background_color")
         ModernGraphics.draw_rounded_rect(
             surface,
             modal_bg,
@@ -393,10 +435,8 @@ class Modal(Widget):
     def _draw_title_bar(self, surface: pygame.Surface, modal_rect: pygame.Rect, theme) -> None:
         """Draw modal title bar"""
         # Draw title
-        title_font = pygame.font.Font(None, 24)
-        title_font.set_bold(True)
-        title_color = pygame.Color(theme.text_primary)
-        title_surface = title_font.render(self.title, True, title_color)
+        title_color = theme.rgb("text_primary")
+        title_surface = self._title_cache.render(self.title, title_color)
         
         title_x = modal_rect.x + 24
         title_y = modal_rect.y + 20
@@ -407,16 +447,17 @@ class Modal(Widget):
             close_x = modal_rect.x + modal_rect.width - 40
             close_y = modal_rect.y + 8
             close_rect = pygame.Rect(close_x, close_y, 32, 32)
+            close_color = theme.rgb("text_secondary")
             
             # Close button background
-            close_bg = ModernGraphics.get_color_with_alpha(theme.text_secondary, 30)
+            close_bg = ModernGraphics.get_color_with_alpha(close_color, 30)
             ModernGraphics.draw_rounded_rect(surface, close_bg, close_rect, 16)
             
             # Close icon (X)
-            close_color = pygame.Color(theme.text_secondary)
             pygame.draw.line(surface, close_color, 
                            (close_x + 10, close_y + 10), 
                            (close_x + 22, close_y + 22), 2)
             pygame.draw.line(surface, close_color, 
                            (close_x + 22, close_y + 10), 
-                           (close_x + 10, close_y + 22), 2)
\ No newline at end of file
+                           (close_x + 10, close_y + 22), 2)
+
@@ -1,15 +1,26 @@
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 from typing import Optional, Union, TYPE_CHECKING
 import pygame
-from lumina.core.widget import Widget
+from lumina.core.widget import Widget, _cached_size
 from lumina.core.types import Rect
 
 if TYPE_CHECKING:
     from lumina.core.window import Window
 
 
+# Below this many children a plain reverse scan beats building and querying the index
+_INDEXED_HIT_TEST_MIN = 8
+
+# Share of the leftover space placed before children for each alignment (others start flush)
+_ALIGN_FACTORS = {"center": 0.5, "end": 1.0}
+
+
 class Container(Widget):
     """Base container widget that can hold child widgets"""
     
+    __slots__ = ("_children", "_hit_index", "_visible_children")
+    
     def __init__(
         self,
         children: Optional[Union[Widget, list[Widget]]] = None,
@@ -25,6 +36,29 @@ class Container(Widget):
         else:
             self.children = children
     
+    @property
+    def children(self) -> list[Widget]:
+        return self._children
+    
+    @children.setter
+    def children(self, children: list[Widget]) -> None:
+        self._children = children
+        
+        # Children sorted by top edge, rebuilt lazily after layout for pointer hit testing
+        self._hit_index: Optional[tuple[list[float], list[float], list[int]]] = None
+        # Visible subset of children, rebuilt lazily when membership or visibility changes
+        self._visible_children: Optional[list[Widget]] = None
+    
+    def _get_visible_children(self) -> list[Widget]:
+        """Visible children in paint order"""
+        visible_children = self._visible_children
+        if visible_children is None:
+            visible_children = self._visible_children = [child for child in self._children if child.visible]
+        return visible_children
+    
+    def _on_child_visibility_change(self, child: Widget) -> None:
+        self._visible_children = None
+    
     def mount(self, parent: Optional[Widget] = None, window: Optional["Window"] = None) -> None:
         """Mount container and all children"""
         super().mount(parent, window)
@@ -40,6 +74,9 @@ class Container(Widget):
     def add_child(self, child: Widget) -> None:
         """Add a child widget"""
         self.children.append(child)
+        self._hit_index = None
+        self._visible_children = None
+        self._clear_size_cache()
         if self._is_mounted:
             child.mount(self, self.window)
             self.invalidate()
@@ -49,8 +86,11 @@ class Container(Widget):
         if child in self.children:
             child.unmount()
             self.children.remove(child)
-            self.invalidate()
+            self._hit_index = None
+            self._visible_children = None
+            self.invalidate_layout()
     
+    @_cached_size
     def calculate_size(self, available_width: float, available_height: float) -> tuple[float, float]:
         """Calculate container size based on children"""
         if not self.children:
@@ -73,6 +113,7 @@ class Container(Widget):
     def layout(self, rect: Rect) -> None:
         """Layout container and children"""
         super().layout(rect)
+        self._hit_index = None
         
         # Layout children vertically
         y_offset = self.rect.y + self.padding.top
@@ -103,30 +144,84 @@ class Container(Widget):
                 pygame.draw.rect(surface, bg_color, self.rect.to_pygame_rect())
         
         # Render children
-        for child in self.children:
-            if child.visible:
-                child.render(surface)
+        for child in self._children_in_clip(surface):
+            child.render(surface)
+    
+    def _children_in_clip(self, surface: pygame.Surface) -> list[Widget]:
+        """Visible children reaching into the surface's clip area, in paint order"""
+        children = self._get_visible_children()
+        clip = surface.get_clip()
+        # A full redraw leaves the clip at the whole surface, where every child is in
+        if clip == surface.get_rect():
+            return children
+        
+        in_clip = []
+        for child in children:
+            area = child.dirty_rect()
+            if area is None or clip.colliderect(area):
+                in_clip.append(child)
+        return in_clip
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Pass events to children"""
-        # Check children in reverse order (top to bottom)
-        for child in reversed(self.children):
-            if child.visible:
-                # For mouse events, check if the child contains the point
-                if event.type in [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION]:
-                    if hasattr(event, 'pos') and child.contains_point(*event.pos):
-                        if child.handle_event(event):
-                            return True
-                else:
-                    # For other events, pass them through
-                    if child.handle_event(event):
-                        return True
+        # Every child sees pointer motion, so widgets the pointer just left can drop their hover state
+        if event.type == pygame.MOUSEMOTION:
+            handled = False
+            for child in self._get_visible_children():
+                if child.handle_event(event):
+                    handled = True
+            return handled
+        
+        # For mouse events, only the children containing the point are offered the event
+        if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+            if not hasattr(event, 'pos'):
+                return False
+            for child in self._children_at(*event.pos):
+                if child.handle_event(event):
+                    return True
+            return False
+        
+        # For other events, pass them through in reverse order (top to bottom)
+        for child in reversed(self._get_visible_children()):
+            if child.handle_event(event):
+                return True
         return False
+    
+    def _children_at(self, x: float, y: float):
+        """Yield visible children under a point, topmost first"""
+        children = self.children
+        if len(children) < _INDEXED_HIT_TEST_MIN:
+            for child in reversed(self._get_visible_children()):
+                if child.contains_point(x, y):
+                    yield child
+            return
+        
+        index = self._hit_index
+        if index is None or len(index[2]) != len(children):
+            index = self._hit_index = self._build_hit_index()
+        tops, reach, order = index
+        
+        # Only children starting above the point, and past the last one that ends before it, can overlap it
+        candidates = order[bisect_left(reach, y):bisect_right(tops, y)]
+        for i in sorted(candidates, reverse=True):
+            child = children[i]
+            if child.visible and child.contains_point(x, y):
+                yield child
+    
+    def _build_hit_index(self) -> tuple[list[float], list[float], list[int]]:
+        """Sort children by top edge, with the running maximum bottom edge in that order"""
+        rects = [child.rect for child in self.children]
+        order = sorted(range(len(rects)), key=lambda i: rects[i].y)
+        tops = [rects[i].y for i in order]
+        reach = list(accumulate((rects[i].y2 for i in order), max))
+        return tops, reach, order
 
 
 class Row(Container):
     """Container that arranges children horizontally"""
     
+    __slots__ = ("spacing", "align")
+    
     def __init__(
         self,
         children: Optional[Union[Widget, list[Widget]]] = None,
@@ -138,6 +233,7 @@ class Row(Container):
         self.spacing = spacing
         self.align = align  # start, center, end, space-between, space-around
     
+    @_cached_size
     def calculate_size(self, available_width: float, available_height: float) -> tuple[float, float]:
         """Calculate row size"""
         if not self.children:
@@ -175,13 +271,8 @@ class Row(Container):
         
         # Calculate starting position based on alignment
         content_width = self.rect.width - self.padding.left - self.padding.right
-        
-        if self.align == "center":
-            x_offset = self.rect.x + self.padding.left + (content_width - total_width) / 2
-        elif self.align == "end":
-            x_offset = self.rect.x + self.rect.width - self.padding.right - total_width
-        else:  # start
-            x_offset = self.rect.x + self.padding.left
+        align_factor = _ALIGN_FACTORS.get(self.align, 0.0)
+        x_offset = self.rect.x + self.padding.left + (content_width - total_width) * align_factor
         
         # Layout each child
         for i, (child, (width, height)) in enumerate(zip(self.children, child_sizes)):
@@ -198,6 +289,8 @@ class Row(Container):
 class Column(Container):
     """Container that arranges children vertically"""
     
+    __slots__ = ("spacing", "align")
+    
     def __init__(
         self,
         children: Optional[Union[Widget, list[Widget]]] = None,
@@ -209,6 +302,7 @@ class Column(Container):
         self.spacing = spacing
         self.align = align  # start, center, end, stretch
     
+    @_cached_size
     def calculate_size(self, available_width: float, available_height: float) -> tuple[float, float]:
         """Calculate column size"""
         if not self.children:
@@ -231,21 +325,18 @@ class Column(Container):
         super().layout(rect)
         
         y_offset = self.rect.y + self.padding.top
+        content_x = self.rect.x + self.padding.left
         content_width = self.rect.width - self.padding.left - self.padding.right
+        align_factor = _ALIGN_FACTORS.get(self.align, 0.0)
+        stretch = self.align == "stretch"
         
         for i, child in enumerate(self.children):
             child_width, child_height = child.calculate_size(content_width, float('inf'))
             
             # Apply horizontal alignment
-            if self.align == "center":
-                x_offset = self.rect.x + self.padding.left + (content_width - child_width) / 2
-            elif self.align == "end":
-                x_offset = self.rect.x + self.rect.width - self.padding.right - child_width
-            elif self.align == "stretch":
-                x_offset = self.rect.x + self.padding.left
+            if stretch:
                 child_width = content_width
-            else:  # start
-                x_offset = self.rect.x + self.padding.left
+            x_offset = content_x + (content_width - child_width) * align_factor
             
             child_rect = Rect(x_offset, y_offset, child_width, child_height)
             child.layout(child_rect)
@@ -258,6 +349,9 @@ class Column(Container):
 class Stack(Container):
     """Container that stacks children on top of each other"""
     
+    __slots__ = ()
+    
+    @_cached_size
     def calculate_size(self, available_width: float, available_height: float) -> tuple[float, float]:
         """Calculate stack size (maximum of all children)"""
         if not self.children:
@@ -1,14 +1,48 @@
 from typing import Optional, List, Dict, Any, Callable, Union
+from collections import OrderedDict
+from bisect import bisect_right
 import pygame
-import time
-from lumina.core.widget import Widget
+from lumina.core.widget import Widget, _cached_size
 from lumina.core.types import Rect, Padding
 from lumina.core.graphics import ModernGraphics
 
 
+# Enough for every header, visible cell and pagination label of a large page
+_TEXT_CACHE_MAX = 512
+
+_ELLIPSIS = "\u2026"
+
+
+def _truncate_to_width(font: pygame.font.Font, text: str, max_width: int) -> str:
+    """Shorten text with an ellipsis so it renders no wider than max_width"""
+    if font.size(text)[0] <= max_width:
+        return text
+    
+    # Longest prefix that still fits next to the ellipsis
+    available = max_width - font.size(_ELLIPSIS)[0]
+    low, high = 0, len(text) - 1
+    while low < high:
+        mid = (low + high + 1) // 2
+        if font.size(text[:mid])[0] <= available:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low] + _ELLIPSIS
+
+
 class DataTable(Widget):
     """Modern data table with sorting, pagination, and selection"""
     
+    __slots__ = (
+        "_columns", "_data", "selectable", "sortable", "paginated", "rows_per_page",
+        "on_row_click", "on_selection_change", "sort_column", "sort_direction",
+        "current_page", "selected_rows", "hovered_row", "_hover_animation",
+        "_text_cache", "_row_backgrounds_revision", "_row_backgrounds_cache",
+        "_bg_surface", "_bg_surface_key", "row_height", "header_height",
+        "_col_widths", "_col_keys", "_col_titles", "_col_sortable", "_col_x",
+        "_content_rect", "_header_rect", "_pagination_rect", "_prev_button_rect", "_next_button_rect",
+    )
+    
     def __init__(
         self,
         columns: List[Dict[str, Any]],
@@ -44,7 +78,17 @@ class DataTable(Widget):
         
         # Animation state
         self._hover_animation = {}
-        self._last_update = time.time()
+        
+        # Rendered header/cell/pagination text, most recently used last
+        self._text_cache: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        
+        # Row background colors and the theme revision they were blended from
+        self._row_backgrounds_revision = None
+        self._row_backgrounds_cache: tuple = ()
+        
+        # Table frame, header background and zebra stripes, baked for the current theme and size
+        self._bg_surface: Optional[pygame.Surface] = None
+        self._bg_surface_key: tuple = ()
         
         # Calculate row height
         self.row_height = 48
@@ -52,15 +96,59 @@ class DataTable(Widget):
         
         # Apply styling
         self.style.border_radius = 8
+        
+        self._update_geometry()
     
+    @property
+    def columns(self) -> List[Dict[str, Any]]:
+        return self._columns
+    
+    @columns.setter
+    def columns(self, columns: List[Dict[str, Any]]) -> None:
+        self._columns = columns
+        self._rebuild_column_cache()
+        self.invalidate_layout()
+    
+    @property
+    def data(self) -> List[Dict[str, Any]]:
+        return self._data
+    
+    @data.setter
+    def data(self, data: List[Dict[str, Any]]) -> None:
+        # The row count sets the table's height, so assign a new list (like columns) to resize
+        self._data = data
+        self.invalidate_layout()
+    
+    def _rebuild_column_cache(self) -> None:
+        """Flatten column settings into parallel lists for rendering and hit testing.
+        
+        Assign a new list to columns (rather than mutating it in place) so this reruns.
+        """
+        self._col_widths = [column.get("width", 150) for column in self._columns]
+        self._col_keys = [column["key"] for column in self._columns]
+        self._col_titles = [column["title"] for column in self._columns]
+        self._col_sortable = [column.get("sortable", True) for column in self._columns]
+        
+        # Left edge of each column relative to the table, plus the total width at the end
+        self._col_x = [0]
+        for width in self._col_widths:
+            self._col_x.append(self._col_x[-1] + width)
+    
+    def clear_render_cache(self) -> None:
+        """Drop rendered text; surfaces for the old theme's colors won't be used again"""
+        self._text_cache.clear()
+        self._bg_surface = None
+        self._bg_surface_key = ()
+    
+    @_cached_size
     def calculate_size(self, available_width: float, available_height: float) -> tuple[float, float]:
         """Calculate table size"""
         # Calculate total width from columns
-        total_width = sum(col.get("width", 150) for col in self.columns)
+        total_width = self._col_x[-1]
         total_width += self.padding.left + self.padding.right
         
         # Calculate height based on visible rows
-        visible_rows = min(len(self.get_current_page_data()), self.rows_per_page)
+        visible_rows = min(self._current_page_length(), self.rows_per_page)
         total_height = (self.header_height + 
                        visible_rows * self.row_height + 
                        self.padding.top + self.padding.bottom)
@@ -80,6 +168,14 @@ class DataTable(Widget):
         end_idx = start_idx + self.rows_per_page
         return self.data[start_idx:end_idx]
     
+    def _current_page_length(self) -> int:
+        """Number of rows on the current page, without slicing them out"""
+        if not self.paginated:
+            return len(self.data)
+        
+        remaining = len(self.data) - self.current_page * self.rows_per_page
+        return max(0, min(self.rows_per_page, remaining))
+    
     def get_total_pages(self) -> int:
         """Get total number of pages"""
         if not self.paginated:
@@ -104,7 +200,7 @@ class DataTable(Widget):
         
         # Reset to first page
         self.current_page = 0
-        self.invalidate()
+        self.invalidate_layout()
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle table events"""
@@ -113,18 +209,18 @@ class DataTable(Widget):
             old_hovered = self.hovered_row
             self.hovered_row = self._get_row_at_position(event.pos)
             if old_hovered != self.hovered_row:
-                self.invalidate()
+                # Only the rows gaining and losing the highlight change
+                self._invalidate_row(old_hovered)
+                self._invalidate_row(self.hovered_row)
         
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             # Check header clicks (for sorting)
             header_rect = self._get_header_rect()
             if header_rect.collidepoint(event.pos):
                 column_index = self._get_column_at_position(event.pos[0])
-                if column_index >= 0 and column_index < len(self.columns):
-                    column = self.columns[column_index]
-                    if column.get("sortable", True):
-                        self.sort_data(column["key"])
-                        return True
+                if column_index >= 0 and self._col_sortable[column_index]:
+                    self.sort_data(self._col_keys[column_index])
+                    return True
             
             # Check row clicks
             row_index = self._get_row_at_position(event.pos)
@@ -135,7 +231,7 @@ class DataTable(Widget):
                     
                     # Handle selection
                     if self.selectable:
-                        if pygame.key.get_pressed()[pygame.K_LCTRL] or pygame.key.get_pressed()[pygame.K_RCTRL]:
+                        if pygame.key.get_mods() & pygame.KMOD_CTRL:
                             # Multi-select with Ctrl
                             if id(row_data) in self.selected_rows:
                                 self.selected_rows.remove(id(row_data))
@@ -175,63 +271,76 @@ class DataTable(Widget):
             return -1
         
         row_index = int(y_offset // self.row_height)
-        return row_index if row_index < len(self.get_current_page_data()) else -1
+        return row_index if row_index < self._current_page_length() else -1
+    
+    def _invalidate_row(self, row_index: int) -> None:
+        """Repaint a single row of the current page"""
+        if row_index < 0 or not (self.window and self._is_mounted):
+            return
+        
+        table_rect = self._get_table_content_rect()
+        row_y = table_rect.y + self.header_height + row_index * self.row_height
+        # One extra pixel each way covers the grid lines on the row's edges
+        self.window.invalidate(pygame.Rect(table_rect.x, row_y - 1, table_rect.width, self.row_height + 2))
     
     def _get_column_at_position(self, x: int) -> int:
         """Get column index at x position"""
         table_rect = self._get_table_content_rect()
         x_offset = x - table_rect.x
         
-        current_x = 0
-        for i, column in enumerate(self.columns):
-            column_width = column.get("width", 150)
-            if current_x <= x_offset < current_x + column_width:
-                return i
-            current_x += column_width
-        
+        index = bisect_right(self._col_x, x_offset) - 1
+        if 0 <= index < len(self._col_widths):
+            return index
         return -1
     
-    def _get_header_rect(self) -> pygame.Rect:
-        """Get header rectangle"""
-        table_rect = self._get_table_content_rect()
-        return pygame.Rect(table_rect.x, table_rect.y, table_rect.width, self.header_height)
+    def layout(self, rect: Rect) -> None:
+        """Position the table and precompute its sub-areas"""
+        super().layout(rect)
+        self._update_geometry()
     
-    def _get_table_content_rect(self) -> pygame.Rect:
-        """Get table content rectangle"""
-        return pygame.Rect(
+    def _update_geometry(self) -> None:
+        """Compute the content, header, pagination and button rects for the current layout"""
+        table_rect = self._content_rect = pygame.Rect(
             self.rect.x + self.padding.left,
             self.rect.y + self.padding.top,
             self.rect.width - self.padding.left - self.padding.right,
             self.rect.height - self.padding.top - self.padding.bottom
         )
-    
-    def _get_pagination_rect(self) -> pygame.Rect:
-        """Get pagination area rectangle"""
-        table_rect = self._get_table_content_rect()
-        return pygame.Rect(
+        self._header_rect = pygame.Rect(table_rect.x, table_rect.y, table_rect.width, self.header_height)
+        pagination_rect = self._pagination_rect = pygame.Rect(
             table_rect.x,
             table_rect.bottom - 60,
             table_rect.width,
             60
         )
+        self._prev_button_rect = pygame.Rect(pagination_rect.x + 12, pagination_rect.y + 15, 80, 30)
+        self._next_button_rect = pygame.Rect(pagination_rect.x + 100, pagination_rect.y + 15, 80, 30)
+    
+    def _get_header_rect(self) -> pygame.Rect:
+        """Get header rectangle (shared, don't mutate)"""
+        return self._header_rect
+    
+    def _get_table_content_rect(self) -> pygame.Rect:
+        """Get table content rectangle (shared, don't mutate)"""
+        return self._content_rect
+    
+    def _get_pagination_rect(self) -> pygame.Rect:
+        """Get pagination area rectangle (shared, don't mutate)"""
+        return self._pagination_rect
     
     def _handle_pagination_click(self, pos: tuple[int, int]) -> bool:
         """Handle pagination button clicks"""
-        pagination_rect = self._get_pagination_rect()
-        
         # Previous button
-        prev_rect = pygame.Rect(pagination_rect.x, pagination_rect.y + 15, 80, 30)
-        if prev_rect.collidepoint(pos) and self.current_page > 0:
+        if self._prev_button_rect.collidepoint(pos) and self.current_page > 0:
             self.current_page -= 1
-            self.invalidate()
+            self.invalidate_layout()
             return True
         
         # Next button
-        next_rect = pygame.Rect(pagination_rect.x + 100, pagination_rect.y + 15, 80, 30)
-        if (next_rect.collidepoint(pos) and 
+        if (self._next_button_rect.collidepoint(pos) and 
             self.current_page < self.get_total_pages() - 1):
             self.current_page += 1
-            self.invalidate()
+            self.invalidate_layout()
             return True
         
         return False
@@ -246,45 +355,63 @@ class DataTable(Widget):
         if not theme:
             return
         
-        # Draw table background
+        # Draw table background, border, header background and stripes in one blit
         table_rect = self._get_table_content_rect()
-        bg_color = pygame.Color(theme.surface_color)
+        current_data = self.get_current_page_data()
+        surface.blit(self._get_background(theme, table_rect.size, len(current_data)), table_rect.topleft)
+        
+        # Draw header, skipping it when only some rows are being repainted
+        clip = surface.get_clip()
+        if clip.colliderect(self._get_header_rect()):
+            self._draw_header(surface, theme)
+        
+        # Draw rows
+        self._draw_rows(surface, theme, current_data)
         
+        # Draw pagination
+        if self.paginated and len(self.data) > self.rows_per_page:
+            if clip.colliderect(self._get_pagination_rect()):
+                self._draw_pagination(surface, theme)
+    
+    def _get_background(self, theme, size: tuple[int, int], visible_rows: int) -> pygame.Surface:
+        """Static table background, re-rendered only when the theme, size or row count change"""
+        key = (
+            theme.revision, size, visible_rows, self.style.border_radius,
+            self.header_height, self.row_height, tuple(self._col_x)
+        )
+        if self._bg_surface is None or key != self._bg_surface_key:
+            self._bg_surface = self._build_background(theme, size, visible_rows)
+            self._bg_surface_key = key
+        return self._bg_surface
+    
+    def _build_background(self, theme, size: tuple[int, int], visible_rows: int) -> pygame.Surface:
+        """Render the table frame, header background and zebra stripes at the origin"""
+        width, height = max(0, size[0]), max(0, size[1])
+        background = pygame.Surface((width, height), pygame.SRCALPHA)
+        background.fill((0, 0, 0, 0))
+        table_rect = pygame.Rect(0, 0, width, height)
+        border_color = theme.rgb("border_color")
+        
+        # Draw table background and border
         ModernGraphics.draw_rounded_rect(
-            surface,
-            bg_color,
+            background,
+            theme.rgb("surface_color"),
             table_rect,
             self.style.border_radius
         )
-        
-        # Draw table border
-        border_color = pygame.Color(theme.border_color)
         ModernGraphics.draw_rounded_rect(
-            surface,
+            background,
             border_color,
             table_rect,
             self.style.border_radius,
             width=1
         )
         
-        # Draw header
-        self._draw_header(surface, theme)
-        
-        # Draw rows
-        self._draw_rows(surface, theme)
-        
-        # Draw pagination
-        if self.paginated and len(self.data) > self.rows_per_page:
-            self._draw_pagination(surface, theme)
-    
-    def _draw_header(self, surface: pygame.Surface, theme) -> None:
-        """Draw table header"""
-        header_rect = self._get_header_rect()
-        
         # Header background
-        header_bg = ModernGraphics.lighten_color(pygame.Color(theme.surface_color), 0.05)
+        header_rect = pygame.Rect(0, 0, width, self.header_height)
+        header_bg = ModernGraphics.lighten_color(theme.rgb("surface_color"), 0.05)
         ModernGraphics.draw_rounded_rect(
-            surface,
+            background,
             header_bg,
             header_rect,
             self.style.border_radius
@@ -292,42 +419,50 @@ class DataTable(Widget):
         
         # Draw header bottom border
         pygame.draw.line(
-            surface,
-            pygame.Color(theme.border_color),
+            background,
+            border_color,
             (header_rect.x, header_rect.bottom - 1),
             (header_rect.right, header_rect.bottom - 1),
             1
         )
         
-        # Draw column headers
-        x_offset = header_rect.x
-        font = self.style.get_font()
-        font.set_bold(True)
+        # Draw header column separators
+        for column_x in self._col_x[1:-1]:
+            pygame.draw.line(
+                background,
+                border_color,
+                (column_x, header_rect.y + 8),
+                (column_x, header_rect.bottom - 8),
+                1
+            )
+        
+        # Zebra stripes; selected and hovered rows are filled over them each frame
+        striped_bg = self._row_backgrounds(theme)[2]
+        for row_index in range(1, visible_rows, 2):
+            y = self.header_height + row_index * self.row_height
+            background.fill(striped_bg, (0, y, width, self.row_height))
+        
+        return background
+    
+    def _draw_header(self, surface: pygame.Surface, theme) -> None:
+        """Draw table header titles and sort indicator"""
+        header_rect = self._get_header_rect()
         
-        for column in self.columns:
-            column_width = column.get("width", 150)
+        # Draw column headers
+        for i, column_width in enumerate(self._col_widths):
+            x_offset = header_rect.x + self._col_x[i]
             column_rect = pygame.Rect(x_offset, header_rect.y, column_width, header_rect.height)
             
-            # Draw column separator
-            if x_offset > header_rect.x:
-                pygame.draw.line(
-                    surface,
-                    pygame.Color(theme.border_color),
-                    (x_offset, header_rect.y + 8),
-                    (x_offset, header_rect.bottom - 8),
-                    1
-                )
-            
             # Draw column title
-            title_color = pygame.Color(theme.text_primary)
-            title_surface = font.render(column["title"], True, title_color)
+            title_color = theme.rgb("text_primary")
+            title_surface = self._get_text_surface(self._col_titles[i], title_color, bold=True)
             
             title_x = column_rect.x + 12
             title_y = column_rect.y + (column_rect.height - title_surface.get_height()) // 2
             surface.blit(title_surface, (title_x, title_y))
             
             # Draw sort indicator
-            if self.sortable and column.get("sortable", True) and self.sort_column == column["key"]:
+            if self.sortable and self._col_sortable[i] and self.sort_column == self._col_keys[i]:
                 arrow_x = column_rect.right - 20
                 arrow_y = column_rect.y + column_rect.height // 2
                 
@@ -339,75 +474,114 @@ class DataTable(Widget):
                     points = [(arrow_x, arrow_y - 3), (arrow_x + 6, arrow_y + 3), (arrow_x + 12, arrow_y - 3)]
                 
                 pygame.draw.polygon(surface, title_color, points)
+    
+    def _get_text_surface(
+        self,
+        text: str,
+        color: pygame.Color,
+        bold: bool = False,
+        max_width: Optional[int] = None
+    ) -> pygame.Surface:
+        """Render text with the table font, reusing surfaces across frames"""
+        font = self.style.get_font()
+        key = (text, tuple(color), bold, font, max_width)
+        cached = self._text_cache.get(key)
+        if cached is not None:
+            self._text_cache.move_to_end(key)
+            return cached
+        
+        # The font is shared with other widgets, so only embolden it for this render
+        was_bold = font.get_bold()
+        font.set_bold(was_bold or bold)
+        try:
+            # Only the glyphs that fit get rasterized
+            if max_width is not None:
+                text = _truncate_to_width(font, text, max_width)
+            surface = font.render(text, True, color)
+        finally:
+            font.set_bold(was_bold)
+        
+        self._text_cache[key] = surface
+        if len(self._text_cache) > _TEXT_CACHE_MAX:
+            self._text_cache.popitem(last=False)
+        return surface
+    
+    def _row_backgrounds(self, theme) -> tuple[pygame.Color, pygame.Color, pygame.Color]:
+        """Selected, hovered and striped row colors, blended over the table background once per theme"""
+        if self._row_backgrounds_revision != theme.revision:
+            # pygame.draw doesn't blend, so translucent overlays are pre-mixed into opaque colors
+            base = theme.rgb("surface_color")
+            overlays = (
+                (theme.rgb("primary_color"), 30),
+                (theme.rgb("text_secondary"), 10),
+                (theme.rgb("text_secondary"), 5),
+            )
+            colors = []
+            for overlay, alpha in overlays:
+                color = base.lerp(overlay, alpha / 255)
+                color.a = 255
+                colors.append(color)
             
-            x_offset += column_width
+            self._row_backgrounds_cache = tuple(colors)
+            self._row_backgrounds_revision = theme.revision
+        return self._row_backgrounds_cache
     
-    def _draw_rows(self, surface: pygame.Surface, theme) -> None:
+    def _draw_rows(self, surface: pygame.Surface, theme, current_data: List[Dict[str, Any]]) -> None:
         """Draw table rows"""
         table_rect = self._get_table_content_rect()
-        current_data = self.get_current_page_data()
+        if not current_data:
+            return
         
-        y_offset = table_rect.y + self.header_height
-        font = self.style.get_font()
+        top = table_rect.y + self.header_height
+        bottom = top + len(current_data) * self.row_height
+        selected_bg, hovered_bg, _ = self._row_backgrounds(theme)
+        border_color = theme.rgb("border_color")
+        text_color = theme.rgb("text_primary")
+        
+        # Only rows inside the clip are drawn, so repainting a hovered row skips the rest
+        clip = surface.get_clip()
+        first_row = max(0, int((clip.top - top) // self.row_height))
+        last_row = min(len(current_data), int(-(-(clip.bottom - top) // self.row_height)))
+        if first_row >= last_row:
+            return
         
-        for row_index, row_data in enumerate(current_data):
-            row_rect = pygame.Rect(table_rect.x, y_offset, table_rect.width, self.row_height)
-            
-            # Draw row background
+        # Stripes are part of the baked background, so only selected and hovered rows are filled here
+        y_offset = top + first_row * self.row_height
+        for row_index in range(first_row, last_row):
+            row_data = current_data[row_index]
             if id(row_data) in self.selected_rows:
-                row_bg = ModernGraphics.get_color_with_alpha(theme.primary_color, 30)
+                row_bg = selected_bg
             elif row_index == self.hovered_row:
-                row_bg = ModernGraphics.get_color_with_alpha(theme.text_secondary, 10)
-            elif row_index % 2 == 1:
-                row_bg = ModernGraphics.get_color_with_alpha(theme.text_secondary, 5)
+                row_bg = hovered_bg
             else:
                 row_bg = None
             
             if row_bg:
-                pygame.draw.rect(surface, row_bg, row_rect)
-            
-            # Draw row border
-            if row_index < len(current_data) - 1:
-                pygame.draw.line(
-                    surface,
-                    pygame.Color(theme.border_color),
-                    (row_rect.x, row_rect.bottom),
-                    (row_rect.right, row_rect.bottom),
-                    1
-                )
-            
-            # Draw cell content
-            x_offset = row_rect.x
-            for column in self.columns:
-                column_width = column.get("width", 150)
-                cell_rect = pygame.Rect(x_offset, row_rect.y, column_width, row_rect.height)
-                
-                # Draw column separator
-                if x_offset > row_rect.x:
-                    pygame.draw.line(
-                        surface,
-                        pygame.Color(theme.border_color),
-                        (x_offset, row_rect.y),
-                        (x_offset, row_rect.bottom),
-                        1
-                    )
+                surface.fill(row_bg, (table_rect.x, y_offset, table_rect.width, self.row_height))
+            y_offset += self.row_height
+        
+        # Row borders between rows, then one separator per column spanning every row
+        for row_index in range(max(1, first_row), min(last_row + 1, len(current_data))):
+            y = top + row_index * self.row_height
+            pygame.draw.line(surface, border_color, (table_rect.x, y), (table_rect.right, y), 1)
+        for column_x in self._col_x[1:-1]:
+            x = table_rect.x + column_x
+            pygame.draw.line(surface, border_color, (x, top), (x, bottom), 1)
+        
+        # Draw cell content
+        y_offset = top + first_row * self.row_height
+        for row_data in current_data[first_row:last_row]:
+            for i, column_width in enumerate(self._col_widths):
+                cell_value = str(row_data.get(self._col_keys[i], ""))
+                if not cell_value or column_width <= 24:
+                    continue
                 
-                # Draw cell text
-                cell_value = str(row_data.get(column["key"], ""))
-                if cell_value:
-                    text_color = pygame.Color(theme.text_primary)
-                    text_surface = font.render(cell_value, True, text_color)
-                    
-                    # Clip text to cell
-                    clipped_surface = text_surface.subsurface(
-                        (0, 0, min(text_surface.get_width(), column_width - 24), text_surface.get_height())
-                    ) if text_surface.get_width() > column_width - 24 else text_surface
-                    
-                    text_x = cell_rect.x + 12
-                    text_y = cell_rect.y + (cell_rect.height - text_surface.get_height()) // 2
-                    surface.blit(clipped_surface, (text_x, text_y))
+                # Long values are cut to the cell width before rendering
+                text_surface = self._get_text_surface(cell_value, text_color, max_width=column_width - 24)
                 
-                x_offset += column_width
+                text_x = table_rect.x + self._col_x[i] + 12
+                text_y = y_offset + (self.row_height - text_surface.get_height()) // 2
+                surface.blit(text_surface, (text_x, text_y))
             
             y_offset += self.row_height
     
@@ -416,37 +590,34 @@ class DataTable(Widget):
         pagination_rect = self._get_pagination_rect()
         
         # Pagination background
-        pagination_bg = ModernGraphics.lighten_color(pygame.Color(theme.surface_color), 0.02)
+        pagination_bg = ModernGraphics.lighten_color(theme.rgb("surface_color"), 0.02)
         pygame.draw.rect(surface, pagination_bg, pagination_rect)
         
         # Draw top border
         pygame.draw.line(
             surface,
-            pygame.Color(theme.border_color),
+            theme.rgb("border_color"),
             (pagination_rect.x, pagination_rect.y),
             (pagination_rect.right, pagination_rect.y),
             1
         )
         
         # Draw pagination info
-        font = self.style.get_font()
         total_pages = self.get_total_pages()
         page_info = f"Page {self.current_page + 1} of {total_pages}"
         
-        info_color = pygame.Color(theme.text_secondary)
-        info_surface = font.render(page_info, True, info_color)
+        info_color = theme.rgb("text_secondary")
+        info_surface = self._get_text_surface(page_info, info_color)
         
         info_x = pagination_rect.right - info_surface.get_width() - 12
         info_y = pagination_rect.y + (pagination_rect.height - info_surface.get_height()) // 2
         surface.blit(info_surface, (info_x, info_y))
         
         # Draw navigation buttons
-        button_y = pagination_rect.y + 15
-        
         # Previous button
         prev_enabled = self.current_page > 0
-        prev_color = pygame.Color(theme.primary_color) if prev_enabled else pygame.Color(theme.text_disabled)
-        prev_rect = pygame.Rect(pagination_rect.x + 12, button_y, 80, 30)
+        prev_color = theme.rgb("primary_color") if prev_enabled else theme.rgb("text_disabled")
+        prev_rect = self._prev_button_rect
         
         ModernGraphics.draw_rounded_rect(
             surface,
@@ -455,15 +626,15 @@ class DataTable(Widget):
             6
         )
         
-        prev_text = font.render("Previous", True, prev_color)
+        prev_text = self._get_text_surface("Previous", prev_color)
         prev_text_x = prev_rect.x + (prev_rect.width - prev_text.get_width()) // 2
         prev_text_y = prev_rect.y + (prev_rect.height - prev_text.get_height()) // 2
         surface.blit(prev_text, (prev_text_x, prev_text_y))
         
         # Next button
         next_enabled = self.current_page < total_pages - 1
-        next_color = pygame.Color(theme.primary_color) if next_enabled else pygame.Color(theme.text_disabled)
-        next_rect = pygame.Rect(pagination_rect.x + 100, button_y, 80, 30)
+        next_color = theme.rgb("primary_color") if next_enabled else theme.rgb("text_disabled")
+        next_rect = self._next_button_rect
         
         ModernGraphics.draw_rounded_rect(
             surface,
@@ -472,7 +643,7 @@ class DataTable(Widget):
             6
         )
         
-        next_text = font.render("Next", True, next_color)
+        next_text = self._get_text_surface("Next", next_color)
         next_text_x = next_rect.x + (next_rect.width - next_text.get_width()) // 2
         next_text_y = next_rect.y + (next_rect.height - next_text.get_height()) // 2
         surface.blit(next_text, (next_text_x, next_text_y))
\ No newline at end of file
@@ -1,15 +1,56 @@
+from functools import lru_cache
+from math import ceil
 from typing import Optional, Callable, Union
 import pygame
-import time
 from lumina.core.widget import Widget
-from lumina.core.style import Style
+from lumina.core.style import Style, get_default_font
 from lumina.core.types import Color, EventType, Rect, Padding
 from lumina.core.graphics import ModernGraphics
+from lumina.core.text_renderer import TextRenderer
+
+
+# The label travels about 8px, so closer than this to the target is under a pixel of motion
+_ANIMATION_SNAP = 0.02
+
+
+# Posted every half second while any input has focus, to toggle the cursor
+_BLINK_EVENT = pygame.event.custom_type()
+_BLINK_INTERVAL_MS = 500
+_FOCUSED_INPUTS: set["TextInput"] = set()
+
+# Everything else (key releases, window and joystick events, ...) is rejected up front
+_HANDLED_EVENTS = frozenset({
+    _BLINK_EVENT,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEMOTION,
+    pygame.KEYDOWN,
+    pygame.TEXTINPUT,
+})
+
+
+# Password characters are drawn as this glyph, whose advance is constant
+_MASK_CHAR = "•"
+
+
+@lru_cache(maxsize=16)
+def _mask_advance(font: pygame.font.Font) -> int:
+    """Width of one mask glyph, so masked text widths are a multiplication"""
+    return max(font.size(_MASK_CHAR)[0], 1)
+
+
+def _approach(value: float, target: float, step: float) -> float:
+    """Ease value toward target, snapping once the remaining change is imperceptible"""
+    value = max(0.0, min(1.0, value + (target - value) * step))
+    if abs(value - target) < _ANIMATION_SNAP:
+        return target
+    return value
 
 
 class TextInput(Widget):
     """Modern text input with floating label and smooth animations"""
     
+    _animated = True
+    
     def __init__(
         self,
         placeholder: str = "",
@@ -53,13 +94,21 @@ class TextInput(Widget):
         self._selection_start = 0
         self._selection_end = 0
         self._cursor_visible = True
-        self._last_cursor_blink = time.time()
         self._scroll_offset = 0
         
+        # Width of the text before the cursor, re-measured only when that text or the font change
+        self._cursor_width_key: Optional[tuple] = None
+        self._cursor_width = 0
+        
+        # Mask string shown for passwords, cached per value length
+        self._masked_text = ""
+        
+        # Horizontal text area, recomputed on layout
+        self._clip_rect = pygame.Rect(0, 0, 0, 0)
+        
         # Animation states
         self._focus_animation = 0.0
         self._label_animation = 1.0 if value else 0.0
-        self._last_update = time.time()
         
         # Style configuration
         self._apply_size_style()
@@ -99,21 +148,35 @@ class TextInput(Widget):
         
         return min_width, total_height
     
+    def layout(self, rect: Rect) -> None:
+        """Position the input and precompute its text clip area"""
+        super().layout(rect)
+        self._clip_rect = pygame.Rect(
+            rect.x + self.padding.left,
+            rect.y,
+            rect.width - self.padding.left - self.padding.right,
+            rect.height
+        )
+    
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle input events"""
-        if self.disabled:
+        if self.disabled or event.type not in _HANDLED_EVENTS:
+            return False
+        
+        if event.type == _BLINK_EVENT:
+            if self._is_focused:
+                self._cursor_visible = not self._cursor_visible
+                self.invalidate()
+            # Every focused input needs to see the tick, so never consume it
             return False
         
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.contains_point(*event.pos):
-                self._is_focused = True
+                self._set_focused(True)
                 self._place_cursor_at_position(event.pos[0])
-                self.invalidate()
                 return True
             else:
-                if self._is_focused:
-                    self._is_focused = False
-                    self.invalidate()
+                self._set_focused(False)
         
         elif event.type == pygame.MOUSEMOTION:
             was_hovered = self._is_hovered
@@ -124,8 +187,51 @@ class TextInput(Widget):
         elif event.type == pygame.KEYDOWN and self._is_focused:
             return self._handle_key_event(event)
         
+        elif event.type == pygame.TEXTINPUT and self._is_focused:
+            # SDL only sends committed text here (including IME composition results)
+            self._insert_text(event.text)
+            return True
+        
         return False
     
+    def _set_focused(self, focused: bool) -> None:
+        """Change focus, running the shared blink timer while any input is focused"""
+        if focused == self._is_focused:
+            return
+        
+        self._is_focused = focused
+        had_focused_inputs = bool(_FOCUSED_INPUTS)
+        if focused:
+            _FOCUSED_INPUTS.add(self)
+            self._cursor_visible = True
+        else:
+            _FOCUSED_INPUTS.discard(self)
+        
+        if bool(_FOCUSED_INPUTS) != had_focused_inputs and pygame.get_init():
+            pygame.time.set_timer(_BLINK_EVENT, _BLINK_INTERVAL_MS if _FOCUSED_INPUTS else 0)
+            # Typed text arrives as TEXTINPUT events, which SDL only needs to produce while editing
+            if _FOCUSED_INPUTS:
+                pygame.key.start_text_input()
+            else:
+                pygame.key.stop_text_input()
+        
+        # Keyboard and text events are routed to the window's focused widget
+        window = self.window
+        if window:
+            if focused:
+                # Clicks outside an input never reach it, so the previous input is blurred here
+                previous = window._focused_widget
+                if isinstance(previous, TextInput) and previous is not self:
+                    previous._set_focused(False)
+                window._focused_widget = self
+            elif window._focused_widget is self:
+                window._focused_widget = None
+        self.invalidate()
+    
+    def on_unmount(self) -> None:
+        """Release focus so the blink timer doesn't outlive the widget"""
+        self._set_focused(False)
+    
     def _handle_key_event(self, event: pygame.event.Event) -> bool:
         """Handle keyboard input"""
         if event.key == pygame.K_RETURN:
@@ -171,10 +277,6 @@ class TextInput(Widget):
             self.invalidate()
             return True
         
-        elif event.unicode and event.unicode.isprintable():
-            self._insert_text(event.unicode)
-            return True
-        
         return False
     
     def _insert_text(self, text: str) -> None:
@@ -190,51 +292,66 @@ class TextInput(Widget):
         self._emit_event(EventType.CHANGE, self.value)
         self.invalidate()
     
+    def _display_text(self) -> str:
+        """Value as shown on screen (masked for passwords)"""
+        if self.password:
+            # Rebuilt only when the length changes, not every frame
+            if len(self._masked_text) != len(self.value):
+                self._masked_text = _MASK_CHAR * len(self.value)
+            return self._masked_text
+        return self.value
+    
     def _place_cursor_at_position(self, x: float) -> None:
         """Place cursor at screen position"""
         font = self.style.get_font()
-        text_x = self.rect.x + self.padding.left - self._scroll_offset
+        target = x - (self.rect.x + self.padding.left - self._scroll_offset)
+        
+        # Masked text is a row of equal-width glyphs, so the nearest boundary is arithmetic
+        if self.password:
+            position = ceil(target / _mask_advance(font) - 0.5)
+            self._cursor_position = min(max(position, 0), len(self.value))
+            self.invalidate()
+            return
         
-        # Find closest character position
-        best_pos = 0
-        best_distance = float('inf')
+        text = self.value
+        # Prefix widths grow with length, so binary search for the first prefix reaching the click
+        low, high = 0, len(text)
+        while low < high:
+            mid = (low + high) // 2
+            if font.size(text[:mid])[0] < target:
+                low = mid + 1
+            else:
+                high = mid
         
-        for i in range(len(self.value) + 1):
-            text_width = font.size(self.value[:i])[0]
-            char_x = text_x + text_width
-            distance = abs(x - char_x)
-            
-            if distance < best_distance:
-                best_distance = distance
-                best_pos = i
+        # Then take whichever neighbouring character boundary is closer
+        if low > 0 and target - font.size(text[:low - 1])[0] <= font.size(text[:low])[0] - target:
+            low -= 1
         
-        self._cursor_position = best_pos
+        self._cursor_position = low
         self.invalidate()
     
     def _update_animations(self) -> None:
         """Update animation states"""
-        current_time = time.time()
-        dt = current_time - self._last_update
-        self._last_update = current_time
+        # Step by the window's shared frame clock so every widget animates in sync
+        if not self.window:
+            return
         
-        # Update focus animation
+        old_focus = self._focus_animation
+        old_label = self._label_animation
         target_focus = 1.0 if self._is_focused else 0.0
-        self._focus_animation += (target_focus - self._focus_animation) * 8.0 * dt
-        self._focus_animation = max(0.0, min(1.0, self._focus_animation))
-        
-        # Update label animation (float up when focused or has value)
+        # Label floats up when focused or has value
         target_label = 1.0 if (self._is_focused or self.value) else 0.0
-        self._label_animation += (target_label - self._label_animation) * 8.0 * dt
-        self._label_animation = max(0.0, min(1.0, self._label_animation))
         
-        # Update cursor blink
-        if current_time - self._last_cursor_blink > 0.5:
-            self._cursor_visible = not self._cursor_visible
-            self._last_cursor_blink = current_time
+        # Settled inputs (nearly all of them, most frames) have nothing to step
+        if old_focus == target_focus and old_label == target_label:
+            return
+        
+        dt = self.window.frame_dt
+        self._focus_animation = _approach(old_focus, target_focus, 8.0 * dt)
+        self._label_animation = _approach(old_label, target_label, 8.0 * dt)
         
-        # Request redraw if animating
-        if (abs(self._focus_animation - target_focus) > 0.01 or 
-            abs(self._label_animation - target_label) > 0.01):
+        # Request redraw while animating (the cursor blink is driven by _BLINK_EVENT)
+        if self._focus_animation != old_focus or self._label_animation != old_label:
             self.invalidate()
     
     def render(self, surface: pygame.Surface) -> None:
@@ -242,9 +359,6 @@ class TextInput(Widget):
         if not self.visible:
             return
         
-        # Update animations
-        self._update_animations()
-        
         # Get theme colors
         theme = self.window.theme if self.window else None
         if not theme:
@@ -252,45 +366,12 @@ class TextInput(Widget):
         
         # Calculate colors based on state
         bg_color, border_color, text_color = self._get_input_colors(theme)
+        rect = self.rect
+        input_rect = rect.to_pygame_rect()
+        border_radius = self.style.border_radius
         
-        # Draw input background
-        if self.variant == "filled":
-            ModernGraphics.draw_rounded_rect(
-                surface,
-                bg_color,
-                self.rect.to_pygame_rect(),
-                self.style.border_radius
-            )
-        elif self.variant == "outlined":
-            # Draw background
-            if bg_color:
-                ModernGraphics.draw_rounded_rect(
-                    surface,
-                    bg_color,
-                    self.rect.to_pygame_rect(),
-                    self.style.border_radius
-                )
-            
-            # Draw border
-            border_width = 2 if self._is_focused else 1
-            ModernGraphics.draw_rounded_rect(
-                surface,
-                border_color,
-                self.rect.to_pygame_rect(),
-                self.style.border_radius,
-                width=border_width
-            )
-        elif self.variant == "underlined":
-            # Draw underline
-            underline_y = self.rect.y + self.rect.height - 2
-            underline_width = 2 if self._is_focused else 1
-            pygame.draw.line(
-                surface,
-                border_color,
-                (self.rect.x, underline_y),
-                (self.rect.x + self.rect.width, underline_y),
-                underline_width
-            )
+        # Draw input background/border for the variant
+        self._draw_frame(surface, rect, input_rect, border_radius, bg_color, border_color)
         
         # Draw floating label
         if self.label:
@@ -303,33 +384,90 @@ class TextInput(Widget):
         if self._is_focused and self._cursor_visible:
             self._draw_cursor(surface, text_color)
     
+    @property
+    def variant(self) -> str:
+        return self._variant
+    
+    @variant.setter
+    def variant(self, variant: str) -> None:
+        self._variant = variant
+        # Resolve the frame painter once instead of re-dispatching every frame
+        self._draw_frame = {
+            "filled": self._draw_filled_frame,
+            "outlined": self._draw_outlined_frame,
+            "underlined": self._draw_underlined_frame,
+        }.get(variant, self._draw_no_frame)
+    
+    def _draw_filled_frame(self, surface, rect, input_rect, border_radius, bg_color, border_color) -> None:
+        ModernGraphics.draw_rounded_rect(
+            surface,
+            bg_color,
+            input_rect,
+            border_radius
+        )
+    
+    def _draw_outlined_frame(self, surface, rect, input_rect, border_radius, bg_color, border_color) -> None:
+        # Draw background
+        if bg_color:
+            ModernGraphics.draw_rounded_rect(
+                surface,
+                bg_color,
+                input_rect,
+                border_radius
+            )
+        
+        # Draw border
+        border_width = 2 if self._is_focused else 1
+        ModernGraphics.draw_rounded_rect(
+            surface,
+            border_color,
+            input_rect,
+            border_radius,
+            width=border_width
+        )
+    
+    def _draw_underlined_frame(self, surface, rect, input_rect, border_radius, bg_color, border_color) -> None:
+        # Draw underline
+        underline_y = rect.y + rect.height - 2
+        underline_width = 2 if self._is_focused else 1
+        pygame.draw.line(
+            surface,
+            border_color,
+            (rect.x, underline_y),
+            (rect.x2, underline_y),
+            underline_width
+        )
+    
+    def _draw_no_frame(self, surface, rect, input_rect, border_radius, bg_color, border_color) -> None:
+        pass
+    
     def _get_input_colors(self, theme) -> tuple[Optional[pygame.Color], pygame.Color, pygame.Color]:
         """Get input colors based on state"""
         if self.disabled:
             return (
-                pygame.Color(theme.surface_color),
-                pygame.Color(theme.border_color),
-                pygame.Color(theme.text_disabled)
+                theme.rgb("surface_color"),
+                theme.rgb("border_color"),
+                theme.rgb("text_disabled")
             )
         
         # Background color
         if self.variant == "filled":
-            bg_color = pygame.Color(theme.surface_color)
+            bg_color = theme.rgb("surface_color")
             if self._is_hovered:
                 bg_color = ModernGraphics.lighten_color(bg_color, 0.05)
         else:
-            bg_color = pygame.Color(theme.background_color)
+            bg_color = theme.rgb("background_color")
         
         # Border color
         if self._is_focused:
-            border_color = pygame.Color(theme.primary_color)
+            border_color = theme.rgb("primary_color")
         elif self._is_hovered:
-            border_color = pygame.Color(theme.text_secondary)
+            border_color = theme.rgb("text_secondary")
         else:
-            border_color = pygame.Color(theme.border_color)
+            border_color = theme.rgb("border_color")
         
         # Text color
-        text_color = pygame.Color(theme.text_primary)
+        text_color = theme.rgb("text_primary")
         
         return bg_color, border_color, text_color
     
@@ -340,25 +478,27 @@ class TextInput(Widget):
         
         # Calculate label properties based on animation
         label_font_size = int(12 + (16 - 12) * (1 - self._label_animation))
-        label_color = pygame.Color(theme.primary_color) if self._is_focused else pygame.Color(theme.text_secondary)
+        label_color = theme.rgb("primary_color") if self._is_focused else theme.rgb("text_secondary")
         
-        # Create label font
-        label_font = pygame.font.Font(None, label_font_size)
-        label_surface = label_font.render(self.label, True, label_color)
+        # Shared font per size (the animation only passes through 12-16)
+        label_font = get_default_font(label_font_size)
+        label_surface = TextRenderer.render_with_font(self.label, label_font, label_color)
         
         # Calculate label position
-        if self._label_animation > 0.5:
+        rect = self.rect
+        padding = self.padding
+        animation = self._label_animation
+        label_x = rect.x + padding.left
+        if animation > 0.5:
             # Floating position
-            label_x = self.rect.x + self.padding.left
-            label_y = self.rect.y + 4
+            label_y = rect.y + 4
         else:
             # Placeholder position
-            label_x = self.rect.x + self.padding.left
-            label_y = self.rect.y + self.padding.top + (self.rect.height - self.padding.top - self.padding.bottom - label_surface.get_height()) / 2
+            label_y = rect.y + padding.top + (rect.height - padding.top - padding.bottom - label_surface.get_height()) / 2
         
         # Interpolate position
         final_x = label_x
-        final_y = label_y * self._label_animation + (self.rect.y + self.padding.top + 8) * (1 - self._label_animation)
+        final_y = label_y * animation + (rect.y + padding.top + 8) * (1 - animation)
         
         surface.blit(label_surface, (final_x, final_y))
     
@@ -367,14 +507,12 @@ class TextInput(Widget):
         font = self.style.get_font()
         
         # Determine display text
-        display_text = self.value
-        if self.password:
-            display_text = "•" * len(self.value)
+        display_text = self._display_text()
         
         # Show placeholder if no value and not focused
         if not display_text and not self._is_focused and self.placeholder:
             display_text = self.placeholder
-            text_color = pygame.Color(self.window.theme.text_hint if self.window else "#999999")
+            text_color = self.window.theme.rgb("text_hint") if self.window else Style.to_pygame_color("#999999")
         
         if display_text:
             # Calculate text position
@@ -383,31 +521,41 @@ class TextInput(Widget):
             text_y = self.rect.y + self.padding.top + text_y_offset
             
             # Render text
-            text_surface = font.render(display_text, True, text_color)
+            text_surface = TextRenderer.render_with_font(display_text, font, text_color)
             
-            # Create clipping rect
-            clip_rect = pygame.Rect(
-                self.rect.x + self.padding.left,
-                self.rect.y,
-                self.rect.width - self.padding.left - self.padding.right,
-                self.rect.height
-            )
+            # Unscrolled text that fits needs no clipping
+            clip_rect = self._clip_rect
+            if (
+                self._scroll_offset == 0
+                and text_surface.get_width() <= clip_rect.width
+                and text_y + text_surface.get_height() <= clip_rect.bottom
+            ):
+                surface.blit(text_surface, (text_x, text_y))
+                return
             
             # Draw with clipping
-            surface.set_clip(clip_rect)
+            old_clip = surface.get_clip()
+            surface.set_clip(clip_rect.clip(old_clip))
             surface.blit(text_surface, (text_x, text_y))
-            surface.set_clip(None)
+            surface.set_clip(old_clip)
     
     def _draw_cursor(self, surface: pygame.Surface, text_color: pygame.Color) -> None:
         """Draw blinking cursor"""
         font = self.style.get_font()
         
         # Calculate cursor position
-        text_before_cursor = self.value[:self._cursor_position]
         if self.password:
-            text_before_cursor = "•" * len(text_before_cursor)
-        
-        text_width = font.size(text_before_cursor)[0]
+            key = (self._cursor_position, font)
+            if key != self._cursor_width_key:
+                self._cursor_width = self._cursor_position * _mask_advance(font)
+                self._cursor_width_key = key
+        else:
+            text_before_cursor = self.value[:self._cursor_position]
+            key = (text_before_cursor, font)
+            if key != self._cursor_width_key:
+                self._cursor_width = font.size(text_before_cursor)[0]
+                self._cursor_width_key = key
+        text_width = self._cursor_width
         text_y_offset = 20 if self.label and self._label_animation > 0.5 else 0
         
         cursor_x = self.rect.x + self.padding.left + text_width - self._scroll_offset
@@ -1,15 +1,25 @@
+from functools import lru_cache
 from typing import Optional, Callable, Union
 import pygame
-import time
 from lumina.core.widget import Widget
 from lumina.core.style import Style
 from lumina.core.types import Color, EventType, Rect, Padding
 from lumina.core.graphics import ModernGraphics
+from lumina.core.text_renderer import TextRenderer
+
+
+# Buttons only react to the pointer; everything else is rejected up front
+_HANDLED_EVENTS = frozenset({pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP})
+
+# Room around an idle button for its drop shadow (blur 4px, offset 2px)
+_IDLE_MARGIN = 8
 
 
 class ModernButton(Widget):
     """Modern button with smooth animations and beautiful design"""
     
+    _animated = True
+    
     def __init__(
         self,
         text: str,
@@ -43,7 +53,10 @@ class ModernButton(Widget):
         self._is_pressed = False
         self._hover_animation = 0.0  # 0.0 to 1.0
         self._press_animation = 0.0  # 0.0 to 1.0
-        self._last_update = time.time()
+        
+        # Pre-composed resting appearance, rebuilt when its key changes
+        self._idle_surface: Optional[pygame.Surface] = None
+        self._idle_key: Optional[tuple] = None
         
         # Style configuration
         self._apply_size_style()
@@ -73,11 +86,9 @@ class ModernButton(Widget):
     def calculate_size(self, available_width: float, available_height: float) -> tuple[float, float]:
         """Calculate button size with modern proportions"""
         font = self.style.get_font()
-        text_surface = font.render(self.text, True, (0, 0, 0))
         
-        # Base size from text
-        text_width = text_surface.get_width()
-        text_height = text_surface.get_height()
+        # Base size from text (font metrics, no rasterization needed)
+        text_width, text_height = font.size(self.text)
         
         # Add icon space if present
         icon_width = 20 if self.icon else 0
@@ -101,11 +112,7 @@ class ModernButton(Widget):
         return max(total_width, min_width), max(total_height, min_height)
     
     def _update_animations(self) -> None:
-        """Update animation states - simplified to prevent text pulsing"""
-        current_time = time.time()
-        dt = current_time - self._last_update
-        self._last_update = current_time
-        
+        """Update animation states (stepped by the window before each render) - simplified to prevent text pulsing"""
         # Snap animations to target instantly to prevent render loops
         # This fixes the text pulsing issue caused by constant invalidation
         target_hover = 1.0 if self._is_hovered and not self.disabled else 0.0
@@ -125,7 +132,7 @@ class ModernButton(Widget):
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle mouse events with smooth animations"""
-        if self.disabled:
+        if self.disabled or event.type not in _HANDLED_EVENTS:
             return False
         
         if event.type == pygame.MOUSEMOTION:
@@ -160,15 +167,16 @@ class ModernButton(Widget):
         if not self.visible:
             return
         
-        # Update animations only when state might have changed
-        # This prevents constant re-rendering that causes text pulsing
-        self._update_animations()
-        
         # Get theme colors
         theme = self.window.theme if self.window else None
         if not theme:
             return
         
+        # Idle buttons (the common case) blit one pre-composed surface
+        if self._hover_animation == 0 and self._press_animation == 0:
+            self._render_idle(surface, theme)
+            return
+        
         # Calculate animated scale
         scale = 1.0
         if not self.disabled:
@@ -176,23 +184,50 @@ class ModernButton(Widget):
             scale += (self.press_scale - 1.0) * self._press_animation
         
         # Calculate scaled rect
-        scaled_width = self.rect.width * scale
-        scaled_height = self.rect.height * scale
-        scaled_x = self.rect.x + (self.rect.width - scaled_width) / 2
-        scaled_y = self.rect.y + (self.rect.height - scaled_height) / 2
+        rect = self.rect
+        scaled_width = rect.width * scale
+        scaled_height = rect.height * scale
+        scaled_x = rect.x + (rect.width - scaled_width) / 2
+        scaled_y = rect.y + (rect.height - scaled_height) / 2
         scaled_rect = pygame.Rect(scaled_x, scaled_y, scaled_width, scaled_height)
         
+        self._draw_layers(surface, scaled_rect, theme)
+    
+    def _render_idle(self, surface: pygame.Surface, theme) -> None:
+        """Blit the cached shadow, background, border and content for the resting state"""
+        rect = self.rect
+        button_rect = pygame.Rect(rect.x, rect.y, rect.width, rect.height)
+        key = (
+            button_rect.size, theme.revision, self.variant, self.disabled,
+            self.text, self.icon, self.style.border_radius, self.style.get_font()
+        )
+        
+        if self._idle_key != key:
+            width, height = button_rect.size
+            composite = pygame.Surface(
+                (width + 2 * _IDLE_MARGIN, height + 2 * _IDLE_MARGIN), pygame.SRCALPHA
+            )
+            self._draw_layers(composite, pygame.Rect(_IDLE_MARGIN, _IDLE_MARGIN, width, height), theme)
+            self._idle_surface = composite
+            self._idle_key = key
+        
+        surface.blit(self._idle_surface, (button_rect.x - _IDLE_MARGIN, button_rect.y - _IDLE_MARGIN))
+    
+    def _draw_layers(self, surface: pygame.Surface, button_rect: pygame.Rect, theme) -> None:
+        """Draw shadow, background, border and content into button_rect"""
+        border_radius = self.style.border_radius
+        
         # Draw shadow first
         if not self.disabled and self.variant != "text":
             shadow_alpha = int(20 + 10 * self._hover_animation)
             shadow_offset = (0, int(2 + 2 * self._hover_animation))
             ModernGraphics.draw_shadow(
                 surface,
-                scaled_rect,
-                self.style.border_radius,
+                button_rect,
+                border_radius,
                 blur_radius=4 + 2 * self._hover_animation,
                 offset=shadow_offset,
-                color=ModernGraphics.get_color_with_alpha((0, 0, 0), shadow_alpha)
+                color=(0, 0, 0, shadow_alpha)
             )
         
         # Determine colors based on variant and state
@@ -203,8 +238,8 @@ class ModernButton(Widget):
             ModernGraphics.draw_rounded_rect(
                 surface,
                 bg_color,
-                scaled_rect,
-                self.style.border_radius
+                button_rect,
+                border_radius
             )
         
         # Draw border for outlined variants
@@ -212,86 +247,88 @@ class ModernButton(Widget):
             ModernGraphics.draw_rounded_rect(
                 surface,
                 border_color,
-                scaled_rect,
-                self.style.border_radius,
+                button_rect,
+                border_radius,
                 width=2
             )
         
         # Draw button content (icon + text)
-        self._draw_button_content(surface, scaled_rect, text_color)
+        self._draw_button_content(surface, button_rect, text_color)
+    
+    @property
+    def variant(self) -> str:
+        return self._variant
+    
+    @variant.setter
+    def variant(self, variant: str) -> None:
+        self._variant = variant
+        # Resolve the per-variant color method once instead of re-dispatching every frame
+        self._color_fn = {
+            "primary": self._colors_primary,
+            "secondary": self._colors_secondary,
+            "success": self._colors_success,
+            "danger": self._colors_danger,
+        }.get(variant, self._colors_text)
     
     def _get_button_colors(self, theme) -> tuple[Optional[pygame.Color], pygame.Color, Optional[pygame.Color]]:
         """Get button colors based on variant and state"""
         if self.disabled:
             return (
-                pygame.Color(theme.surface_color),
-                pygame.Color(theme.text_disabled),
-                pygame.Color(theme.border_color)
+                theme.rgb("surface_color"),
+                theme.rgb("text_disabled"),
+                theme.rgb("border_color")
             )
         
-        if self.variant == "primary":
-            bg_color = pygame.Color(theme.primary_color)
-            text_color = pygame.Color("#FFFFFF")
-            
-            # Apply state effects
-            if self._press_animation > 0:
-                bg_color = ModernGraphics.darken_color(bg_color, 0.1 * self._press_animation)
-            elif self._hover_animation > 0:
-                bg_color = ModernGraphics.lighten_color(bg_color, 0.1 * self._hover_animation)
-            
-            return bg_color, text_color, None
-        
-        elif self.variant == "secondary":
-            bg_color = pygame.Color(theme.background_color)
-            text_color = pygame.Color(theme.primary_color)
-            border_color = pygame.Color(theme.primary_color)
-            
-            # Apply hover effects
-            if self._press_animation > 0:
-                bg_color = pygame.Color(theme.primary_color)
-                text_color = pygame.Color("#FFFFFF")
-            elif self._hover_animation > 0:
-                overlay_alpha = int(20 * self._hover_animation)
-                bg_color = ModernGraphics.get_color_with_alpha(theme.primary_color, overlay_alpha)
-            
-            return bg_color, text_color, border_color
-        
-        elif self.variant == "success":
-            bg_color = pygame.Color(theme.success_color)
-            text_color = pygame.Color("#FFFFFF")
-            
-            if self._press_animation > 0:
-                bg_color = ModernGraphics.darken_color(bg_color, 0.1 * self._press_animation)
-            elif self._hover_animation > 0:
-                bg_color = ModernGraphics.lighten_color(bg_color, 0.1 * self._hover_animation)
-            
-            return bg_color, text_color, None
+        return self._color_fn(theme)
+    
+    def _colors_filled(self, bg_color: pygame.Color) -> tuple[pygame.Color, pygame.Color, None]:
+        """Colors for solid variants: white text on a background shaded by state"""
+        # Apply state effects
+        if self._press_animation > 0:
+            bg_color = ModernGraphics.darken_color(bg_color, 0.1 * self._press_animation)
+        elif self._hover_animation > 0:
+            bg_color = ModernGraphics.lighten_color(bg_color, 0.1 * self._hover_animation)
+        
+        return bg_color, Style.to_pygame_color("#FFFFFF"), None
+    
+    def _colors_primary(self, theme) -> tuple[pygame.Color, pygame.Color, None]:
+        return self._colors_filled(theme.rgb("primary_color"))
+    
+    def _colors_success(self, theme) -> tuple[pygame.Color, pygame.Color, None]:
+        return self._colors_filled(theme.rgb("success_color"))
+    
+    def _colors_danger(self, theme) -> tuple[pygame.Color, pygame.Color, None]:
+        return self._colors_filled(theme.rgb("error_color"))
+    
+    def _colors_secondary(self, theme) -> tuple[pygame.Color, pygame.Color, pygame.Color]:
+        bg_color = theme.rgb("background_color")
+        text_color = theme.rgb("primary_color")
+        border_color = theme.rgb("primary_color")
+        
+        # Apply hover effects
+        if self._press_animation > 0:
+            bg_color = theme.rgb("primary_color")
+            text_color = Style.to_pygame_color("#FFFFFF")
+        elif self._hover_animation > 0:
+            overlay_alpha = int(20 * self._hover_animation)
+            bg_color = ModernGraphics.get_color_with_alpha(theme.rgb("primary_color"), overlay_alpha)
+        
+        return bg_color, text_color, border_color
+    
+    def _colors_text(self, theme) -> tuple[Optional[pygame.Color], pygame.Color, None]:
+        bg_color = None
+        text_color = theme.rgb("primary_color")
         
-        elif self.variant == "danger":
-            bg_color = pygame.Color(theme.error_color)
-            text_color = pygame.Color("#FFFFFF")
-            
-            if self._press_animation > 0:
-                bg_color = ModernGraphics.darken_color(bg_color, 0.1 * self._press_animation)
-            elif self._hover_animation > 0:
-                bg_color = ModernGraphics.lighten_color(bg_color, 0.1 * self._hover_animation)
-            
-            return bg_color, text_color, None
+        if self._press_animation > 0 or self._hover_animation > 0:
+            alpha = int(30 * max(self._press_animation, self._hover_animation * 0.5))
+            bg_color = ModernGraphics.get_color_with_alpha(theme.rgb("primary_color"), alpha)
         
-        else:  # text variant
-            bg_color = None
-            text_color = pygame.Color(theme.primary_color)
-            
-            if self._press_animation > 0 or self._hover_animation > 0:
-                alpha = int(30 * max(self._press_animation, self._hover_animation * 0.5))
-                bg_color = ModernGraphics.get_color_with_alpha(theme.primary_color, alpha)
-            
-            return bg_color, text_color, None
+        return bg_color, text_color, None
     
     def _draw_button_content(self, surface: pygame.Surface, rect: pygame.Rect, text_color: pygame.Color) -> None:
         """Draw button content (icon + text) with proper spacing"""
         font = self.style.get_font()
-        text_surface = font.render(self.text, True, text_color)
+        text_surface = TextRenderer.render_with_font(self.text, font, text_color)
         
         # Calculate content positioning
         icon_width = 20 if self.icon else 0
@@ -302,42 +339,37 @@ class ModernButton(Widget):
         content_x = rect.x + (rect.width - total_content_width) / 2
         content_y = rect.y + (rect.height - text_surface.get_height()) / 2
         
-        # Draw icon if present
+        # Icon and text go to pygame as one batch
+        draws = []
         if self.icon:
-            icon_rect = pygame.Rect(content_x, rect.y + (rect.height - 20) / 2, 20, 20)
-            self._draw_icon(surface, icon_rect, text_color)
+            icon_surface = _icon_surface(self.icon, tuple(text_color))
+            if icon_surface:
+                draws.append((icon_surface, (content_x, rect.y + (rect.height - 20) / 2)))
             content_x += icon_width + icon_spacing
+        draws.append((text_surface, (content_x, content_y)))
         
-        # Draw text
-        surface.blit(text_surface, (content_x, content_y))
+        surface.blits(draws, doreturn=False)
+
+
+# Placeholder icon strokes in a 20x20 box, until there is a real icon system
+_ICON_STROKES = {
+    "check": (((4, 10), (8, 14), (16, 6)),),
+    "plus": (((10, 4), (10, 16)), ((4, 10), (16, 10))),
+    "close": (((4, 4), (16, 16)), ((16, 4), (4, 16))),
+}
+
+
+@lru_cache(maxsize=64)
+def _icon_surface(icon: str, color_key: tuple) -> Optional[pygame.Surface]:
+    """Draw an icon's strokes once per color"""
+    strokes = _ICON_STROKES.get(icon)
+    if strokes is None:
+        return None
     
-    def _draw_icon(self, surface: pygame.Surface, rect: pygame.Rect, color: pygame.Color) -> None:
-        """Draw button icon (placeholder - would use actual icon system)"""
-        # For now, draw a simple shape as placeholder
-        if self.icon == "check":
-            # Draw checkmark
-            points = [
-                (rect.x + 4, rect.y + 10),
-                (rect.x + 8, rect.y + 14),
-                (rect.x + 16, rect.y + 6)
-            ]
-            pygame.draw.lines(surface, color, False, points, 2)
-        elif self.icon == "plus":
-            # Draw plus sign
-            pygame.draw.line(surface, color, 
-                           (rect.x + 10, rect.y + 4), 
-                           (rect.x + 10, rect.y + 16), 2)
-            pygame.draw.line(surface, color, 
-                           (rect.x + 4, rect.y + 10), 
-                           (rect.x + 16, rect.y + 10), 2)
-        elif self.icon == "close":
-            # Draw X
-            pygame.draw.line(surface, color, 
-                           (rect.x + 4, rect.y + 4), 
-                           (rect.x + 16, rect.y + 16), 2)
-            pygame.draw.line(surface, color, 
-                           (rect.x + 16, rect.y + 4), 
-                           (rect.x + 4, rect.y + 16), 2)
+    icon_surface = pygame.Surface((20, 20), pygame.SRCALPHA)
+    for points in strokes:
+        pygame.draw.lines(icon_surface, color_key, False, points, 2)
+    return icon_surface
 
 
 # Alias for backwards compatibility
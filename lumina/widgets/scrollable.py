@@ -1,10 +1,18 @@
+from bisect import bisect_left, bisect_right
 from typing import Optional, Union
 import pygame
-import time
-from lumina.core.widget import Widget
+from lumina.core.widget import Widget, _DIRTY_MARGIN
 from lumina.core.types import Rect, Padding, EventType
 from lumina.core.graphics import ModernGraphics
 from lumina.widgets.container import Container
+from lumina.widgets.text import Text
+
+
+# Children whose render is exactly Text.render can be drawn through a batched Surface.blits
+_TEXT_RENDER = Text.render
+
+# Events aimed at a screen position, offered only to children shown in the viewport
+_POINTER_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL)
 
 
 class ScrollableContainer(Container):
@@ -45,7 +53,18 @@ class ScrollableContainer(Container):
         
         # Animation
         self._scrollbar_hover = 0.0
-        self._last_update = time.time()
+        
+        # (child, width, height) from the last full layout, so scrolling only repositions
+        self._child_layout: Optional[list[tuple[Widget, float, float]]] = None
+        # Content-relative top and bottom edge of each child; both ascend, so they can be bisected
+        self._child_tops: list[float] = []
+        self._child_bottoms: list[float] = []
+        # Index range of the children positioned by the last scroll; all others lie outside the viewport
+        self._placed_span = (0, 0)
+        # On-screen content area, recomputed on layout rather than per frame
+        self._viewport = pygame.Rect(0, 0, 0, 0)
+        # Children offered the last pointer motion
+        self._motion_children: list[Widget] = []
     
     def calculate_size(self, available_width: float, available_height: float) -> tuple[float, float]:
         """Calculate size including scrollbars"""
@@ -83,52 +102,107 @@ class ScrollableContainer(Container):
     
     def layout(self, rect: Rect) -> None:
         """Layout with scrolling support"""
-        super().layout(rect)
-        
-        # Update viewport dimensions
-        self.viewport_width = self.rect.width
-        self.viewport_height = self.rect.height
-        
-        # Calculate actual content size
-        total_content_height = 0
-        max_content_width = 0
+        # Children are placed at the scroll offset below, so skip Container's own stacking pass
+        Widget.layout(self, rect)
         
-        for child in self.children:
-            child_width, child_height = child.calculate_size(self.viewport_width, float('inf'))
-            max_content_width = max(max_content_width, child_width)
-            total_content_height += child_height + 8  # Add spacing
+        # Guess the vertical scrollbar from the last layout, so one measuring pass usually suffices
+        had_v_scrollbar = self._v_scrollbar_rect is not None
+        sizes = self._measure_children(self.rect.width - (self.scrollbar_width if had_v_scrollbar else 0))
+        needs_v_scrollbar = self.scroll_vertical and sum(height + 8 for _, height in sizes) > self.rect.height
+        if needs_v_scrollbar != had_v_scrollbar:
+            sizes = self._measure_children(self.rect.width - (self.scrollbar_width if needs_v_scrollbar else 0))
         
-        self.content_width = max_content_width
-        self.content_height = total_content_height
+        self.content_width = max((width for width, _ in sizes), default=0)
+        self.content_height = sum(height + 8 for _, height in sizes)  # Add spacing
         
         # Adjust for scrollbars
+        self.viewport_width = self.rect.width
+        self.viewport_height = self.rect.height
         if self.scroll_vertical and self.content_height > self.viewport_height:
             self.viewport_width -= self.scrollbar_width
         
         if self.scroll_horizontal and self.content_width > self.viewport_width:
             self.viewport_height -= self.scrollbar_width
         
-        # Layout children with scroll offset
-        y_offset = self.rect.y + self.padding.top - self.scroll_y
+        # Record the measured sizes, then place children at the scroll offset
+        max_child_width = self.viewport_width - self.padding.left - self.padding.right
+        self._child_layout = []
+        self._child_tops = []
+        self._child_bottoms = []
+        content_y = 0
+        for child, (child_width, child_height) in zip(self.children, sizes):
+            self._child_layout.append((child, min(child_width, max_child_width), child_height))
+            self._child_tops.append(content_y)
+            self._child_bottoms.append(content_y + child_height)
+            content_y += child_height + 8
+        
+        self._viewport = self._viewport_rect()
+        self._update_scrollbar_rects()
         
-        for child in self.children:
-            child_width, child_height = child.calculate_size(self.viewport_width, float('inf'))
-            
-            child_rect = Rect(
-                self.rect.x + self.padding.left - self.scroll_x,
-                y_offset,
-                min(child_width, self.viewport_width - self.padding.left - self.padding.right),
-                child_height
-            )
-            
-            child.layout(child_rect)
-            y_offset += child_height + 8
+        # Every child gets a position here; scrolling then only moves the ones near the viewport
+        self._place_children(0, len(self._child_layout))
+        self._placed_span = self._span_near_viewport()
+        self._update_thumb_positions()
+    
+    def _measure_children(self, width: float) -> list[tuple[float, float]]:
+        """Measure every child against a viewport width"""
+        return [child.calculate_size(width, float('inf')) for child in self.children]
+    
+    def _reflow_scroll_only(self) -> None:
+        """Move children to the current scroll offset, reusing the sizes from the last layout"""
+        if self._child_layout is None:
+            self.layout(self.rect)
+            return
+        
+        # Children that were near the viewport move out of it, and those now near it move in.
+        # The rest were already placed outside it and the viewport itself hasn't moved, so
+        # they can keep their stale positions until the next full layout
+        old_lo, old_hi = self._placed_span
+        lo, hi = self._span_near_viewport()
+        self._place_children(lo, hi)
+        self._place_children(old_lo, min(old_hi, lo))
+        self._place_children(max(old_lo, hi), old_hi)
+        self._placed_span = (lo, hi)
         
         # Update scrollbar positions
-        self._update_scrollbar_rects()
+        self._update_thumb_positions()
+    
+    def _place_children(self, lo: int, hi: int) -> None:
+        """Lay out children lo..hi at the current scroll offset, reusing their measured sizes"""
+        if lo >= hi:
+            return
+        self._hit_index = None
+        x_offset = self.rect.x + self.padding.left - self.scroll_x
+        origin = self.rect.y + self.padding.top - self.scroll_y
+        for index in range(lo, hi):
+            child, child_width, child_height = self._child_layout[index]
+            child.layout(Rect(x_offset, origin + self._child_tops[index], child_width, child_height))
+    
+    def _span_near_viewport(self) -> tuple[int, int]:
+        """Index range of the children that can paint into the viewport, overhang included"""
+        return self._span(self._viewport.inflate(2 * _DIRTY_MARGIN, 2 * _DIRTY_MARGIN))
+    
+    def _span(self, area: pygame.Rect) -> tuple[int, int]:
+        """Index range of the children whose content span meets an on-screen area vertically"""
+        # Bisect the stacked child spans instead of testing every child (1px slack for rounding)
+        origin = self.rect.y + self.padding.top - self.scroll_y
+        lo = bisect_right(self._child_bottoms, area.top - origin - 1)
+        hi = bisect_left(self._child_tops, area.bottom - origin + 1)
+        return lo, hi
+    
+    def add_child(self, child: Widget) -> None:
+        """Add a child widget"""
+        self._child_layout = None
+        super().add_child(child)
+    
+    def remove_child(self, child: Widget) -> None:
+        """Remove a child widget"""
+        self._child_layout = None
+        self._motion_children = []
+        super().remove_child(child)
     
     def _update_scrollbar_rects(self) -> None:
-        """Update scrollbar and thumb rectangles"""
+        """Update scrollbar tracks and thumb sizes (positioned by _update_thumb_positions)"""
         # Vertical scrollbar
         if self.scroll_vertical and self.content_height > self.viewport_height:
             self._v_scrollbar_rect = pygame.Rect(
@@ -138,16 +212,15 @@ class ScrollableContainer(Container):
                 self.viewport_height
             )
             
-            # Calculate thumb size and position
+            # Calculate thumb size and how far it can travel
             thumb_ratio = self.viewport_height / self.content_height
             thumb_height = max(20, self.viewport_height * thumb_ratio)
-            
-            scroll_ratio = self.scroll_y / (self.content_height - self.viewport_height)
-            thumb_y = self.rect.y + scroll_ratio * (self.viewport_height - thumb_height)
+            self._v_max_scroll = self.content_height - self.viewport_height
+            self._v_thumb_travel = self.viewport_height - thumb_height
             
             self._v_thumb_rect = pygame.Rect(
                 self.rect.x + self.viewport_width + 2,
-                thumb_y,
+                self.rect.y,
                 self.scrollbar_width - 4,
                 thumb_height
             )
@@ -166,12 +239,11 @@ class ScrollableContainer(Container):
             
             thumb_ratio = self.viewport_width / self.content_width
             thumb_width = max(20, self.viewport_width * thumb_ratio)
-            
-            scroll_ratio = self.scroll_x / (self.content_width - self.viewport_width)
-            thumb_x = self.rect.x + scroll_ratio * (self.viewport_width - thumb_width)
+            self._h_max_scroll = self.content_width - self.viewport_width
+            self._h_thumb_travel = self.viewport_width - thumb_width
             
             self._h_thumb_rect = pygame.Rect(
-                thumb_x,
+                self.rect.x,
                 self.rect.y + self.viewport_height + 2,
                 thumb_width,
                 self.scrollbar_width - 4
@@ -180,17 +252,33 @@ class ScrollableContainer(Container):
             self._h_scrollbar_rect = None
             self._h_thumb_rect = None
     
+    def _update_thumb_positions(self) -> None:
+        """Move the thumbs to the current scroll offset, in place"""
+        # Truncate like the pygame.Rect constructor (attribute assignment would round)
+        if self._v_thumb_rect:
+            scroll_ratio = self.scroll_y / self._v_max_scroll
+            self._v_thumb_rect.y = int(self.rect.y + scroll_ratio * self._v_thumb_travel)
+        
+        if self._h_thumb_rect:
+            scroll_ratio = self.scroll_x / self._h_max_scroll
+            self._h_thumb_rect.x = int(self.rect.x + scroll_ratio * self._h_thumb_travel)
+    
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle scrolling events"""
         # Mouse wheel scrolling
         if event.type == pygame.MOUSEWHEEL:
-            if self.contains_point(*pygame.mouse.get_pos()):
+            # The window tracks the pointer from motion events, so no need to query SDL per tick
+            mouse_pos = self._window._mouse_pos if self._window else pygame.mouse.get_pos()
+            if self.contains_point(*mouse_pos):
                 if self.scroll_vertical:
+                    old_scroll_y = self.scroll_y
                     self.scroll_y -= event.y * 30  # Scroll speed
                     self.scroll_y = max(0, min(self.scroll_y, 
                                               max(0, self.content_height - self.viewport_height)))
-                    self._update_scrollbar_rects()
-                    self.invalidate()
+                    # Already at the end being scrolled towards: nothing moves, nothing to redraw
+                    if self.scroll_y != old_scroll_y:
+                        self._reflow_scroll_only()
+                        self._repaint_scrolled(0, old_scroll_y - self.scroll_y)
                     return True
         
         # Scrollbar dragging
@@ -222,9 +310,12 @@ class ScrollableContainer(Container):
                 
                 if scroll_range > 0:
                     scroll_delta = (delta_y / scroll_range) * max_scroll
-                    self.scroll_y = max(0, min(max_scroll, self._drag_start_scroll + scroll_delta))
-                    self.layout(self.rect)
-                    self.invalidate()
+                    old_scroll_y = self.scroll_y
+                    # Whole-pixel offsets let the drawn content be shifted instead of repainted
+                    self.scroll_y = max(0, min(max_scroll, round(self._drag_start_scroll + scroll_delta)))
+                    if self.scroll_y != old_scroll_y:
+                        self._reflow_scroll_only()
+                        self._repaint_scrolled(0, old_scroll_y - self.scroll_y)
                 return True
             
             elif self._dragging_h_scrollbar:
@@ -235,36 +326,132 @@ class ScrollableContainer(Container):
                 
                 if scroll_range > 0:
                     scroll_delta = (delta_x / scroll_range) * max_scroll
-                    self.scroll_x = max(0, min(max_scroll, self._drag_start_scroll + scroll_delta))
-                    self.layout(self.rect)
-                    self.invalidate()
+                    old_scroll_x = self.scroll_x
+                    self.scroll_x = max(0, min(max_scroll, round(self._drag_start_scroll + scroll_delta)))
+                    if self.scroll_x != old_scroll_x:
+                        self._reflow_scroll_only()
+                        self._repaint_scrolled(old_scroll_x - self.scroll_x, 0)
                 return True
         
-        # Pass events to visible children
-        for child in self.children:
-            if child.visible and self._is_child_visible(child):
+        # Pointer motion reaches the children in the viewport and those it reached last time, so a
+        # hovered child that has since scrolled out still sees the pointer leave it
+        if event.type == pygame.MOUSEMOTION:
+            in_view = list(self._children_overlapping(self._viewport))
+            handled = False
+            for child in in_view:
+                if child.handle_event(event):
+                    handled = True
+            for child in self._motion_children:
+                if child.visible and child not in in_view:
+                    if child.handle_event(event):
+                        handled = True
+            self._motion_children = in_view
+            return handled
+        
+        # Other pointer events only go to what is shown in the viewport
+        if event.type in _POINTER_EVENTS:
+            for child in self._children_overlapping(self._viewport):
                 if child.handle_event(event):
                     return True
+            return False
         
+        # Keyboard and other events also reach children scrolled out of view (a focused input, say)
+        for child in reversed(self._get_visible_children()):
+            if child.handle_event(event):
+                return True
         return False
     
-    def _is_child_visible(self, child: Widget) -> bool:
-        """Check if child is within the viewport"""
-        viewport_rect = pygame.Rect(
-            self.rect.x,
-            self.rect.y, 
-            self.viewport_width,
-            self.viewport_height
-        )
+    def _repaint_scrolled(self, dx: float, dy: float) -> None:
+        """Request a redraw after the content moved by (dx, dy), reusing on-screen pixels if possible"""
+        window = self._window
+        viewport_rect = self._viewport
+        if (
+            window is not None
+            and self._is_mounted
+            and float(dx).is_integer()
+            and float(dy).is_integer()
+            and self._has_opaque_background()
+            and not self._is_overdrawn(viewport_rect)
+            and window.scroll_area(viewport_rect, int(dx), int(dy))
+        ):
+            # Only the newly exposed strip and the scrollbars need repainting
+            for scrollbar_rect in (self._v_scrollbar_rect, self._h_scrollbar_rect):
+                if scrollbar_rect:
+                    window.invalidate(scrollbar_rect)
+            return
         
-        child_rect = pygame.Rect(
-            child.rect.x,
-            child.rect.y,
-            child.rect.width,
-            child.rect.height
+        self.invalidate()
+    
+    def _has_opaque_background(self) -> bool:
+        """Whether the background fully covers whatever earlier siblings and ancestors drew here"""
+        # Without one, the viewport shows pixels that don't move with the content (an ancestor's
+        # background, an earlier sibling's shadow), and shifting them would smear them
+        if not self.style.background_color:
+            return False
+        bg_color = self.style.to_pygame_color(self.style.background_color)
+        return bool(bg_color) and bg_color.a == 255
+    
+    def _is_overdrawn(self, area: pygame.Rect) -> bool:
+        """Whether anything clips this container or is painted over area after it"""
+        widget = self
+        parent = self._parent
+        while parent is not None:
+            # An outer scroll viewport may hide part of the area, so its pixels aren't all ours
+            if isinstance(parent, ScrollableContainer):
+                return True
+            siblings = getattr(parent, 'children', ())
+            if widget in siblings:
+                for sibling in siblings[siblings.index(widget) + 1:]:
+                    if sibling.visible and area.colliderect(sibling.rect.to_pygame_rect()):
+                        return True
+            widget = parent
+            parent = parent._parent
+        
+        # Top-level widgets painted after this tree, like modal overlays
+        window_children = self._window.children if self._window else ()
+        if widget in window_children:
+            for other in window_children[window_children.index(widget) + 1:]:
+                if other.visible:
+                    other_area = other.dirty_rect()
+                    if other_area is None or other_area.colliderect(area):
+                        return True
+        return False
+    
+    def _viewport_rect(self) -> pygame.Rect:
+        """On-screen area the content is clipped to (excluding scrollbars)"""
+        # Sanitize viewport dimensions to prevent infinity conversion errors
+        safe_width = min(self.viewport_width, self.rect.width) if self.viewport_width != float('inf') else self.rect.width
+        safe_height = min(self.viewport_height, self.rect.height) if self.viewport_height != float('inf') else self.rect.height
+        
+        return pygame.Rect(
+            int(self.rect.x),
+            int(self.rect.y),
+            int(safe_width),
+            int(safe_height)
         )
+    
+    def _children_overlapping(self, area: pygame.Rect, margin: int = 0):
+        """Yield visible children that overlap an on-screen area (grown by margin), in paint order"""
+        if margin:
+            area = area.inflate(2 * margin, 2 * margin)
+        children = self.children
+        if self._child_layout is None or len(self._child_tops) != len(children):
+            candidates = children
+        else:
+            lo, hi = self._span(area)
+            candidates = children[lo:hi]
         
-        return viewport_rect.colliderect(child_rect)
+        if area.width <= 0 or area.height <= 0:
+            return
+        left, top, right, bottom = area.left, area.top, area.right, area.bottom
+        for child in candidates:
+            if not child.visible:
+                continue
+            # Same test as area.colliderect(child.rect.to_pygame_rect()), without allocating a Rect
+            rect = child.rect
+            x, y, width, height = int(rect.x), int(rect.y), int(rect.width), int(rect.height)
+            if width > 0 and height > 0 and x < right and x + width > left and y < bottom and y + height > top:
+                yield child
     
     def render(self, surface: pygame.Surface) -> None:
         """Render with clipping and scrollbars"""
@@ -277,26 +464,26 @@ class ScrollableContainer(Container):
             if bg_color:
                 pygame.draw.rect(surface, bg_color, self.rect.to_pygame_rect())
         
-        # Create clipping rectangle for content
-        # Sanitize viewport dimensions to prevent infinity conversion errors
-        safe_width = min(self.viewport_width, self.rect.width) if self.viewport_width != float('inf') else self.rect.width
-        safe_height = min(self.viewport_height, self.rect.height) if self.viewport_height != float('inf') else self.rect.height
-        
-        viewport_rect = pygame.Rect(
-            int(self.rect.x),
-            int(self.rect.y),
-            int(safe_width),
-            int(safe_height)
-        )
-        
-        # Set clipping
+        # Set clipping, staying inside any clip the window already applied
         old_clip = surface.get_clip()
-        surface.set_clip(viewport_rect)
-        
-        # Render visible children
-        for child in self.children:
-            if child.visible and self._is_child_visible(child):
-                child.render(surface)
+        clip = self._viewport.clip(old_clip)
+        surface.set_clip(clip)
+        
+        # Render children inside the clip (after a scroll, often just the exposed strip), plus
+        # those just outside it whose shadows and focus rings overhang into it.
+        # Runs of plain Text children go out in one blits() call, flushed before any other
+        # child so paint order is unchanged
+        batch = []
+        for child in self._children_overlapping(clip, _DIRTY_MARGIN):
+            if type(child).render is _TEXT_RENDER:
+                batch.append(child._blit_args())
+                continue
+            if batch:
+                surface.blits(batch, doreturn=False)
+                batch.clear()
+            child.render(surface)
+        if batch:
+            surface.blits(batch, doreturn=False)
         
         # Restore clipping
         surface.set_clip(old_clip)
@@ -313,7 +500,7 @@ class ScrollableContainer(Container):
         # Vertical scrollbar
         if self._v_scrollbar_rect and self._v_thumb_rect:
             # Scrollbar track
-            track_color = ModernGraphics.get_color_with_alpha(theme.text_secondary, 20)
+            track_color = ModernGraphics.get_color_with_alpha(theme.rgb("text_secondary"), 20)
             ModernGraphics.draw_rounded_rect(
                 surface,
                 track_color,
@@ -322,9 +509,9 @@ class ScrollableContainer(Container):
             )
             
             # Scrollbar thumb
-            thumb_color = pygame.Color(theme.text_secondary)
+            thumb_color = theme.rgb("text_secondary")
             if self._dragging_v_scrollbar:
-                thumb_color = pygame.Color(theme.primary_color)
+                thumb_color = theme.rgb("primary_color")
             
             ModernGraphics.draw_rounded_rect(
                 surface,
@@ -335,7 +522,7 @@ class ScrollableContainer(Container):
         
         # Horizontal scrollbar (similar)
         if self._h_scrollbar_rect and self._h_thumb_rect:
-            track_color = ModernGraphics.get_color_with_alpha(theme.text_secondary, 20)
+            track_color = ModernGraphics.get_color_with_alpha(theme.rgb("text_secondary"), 20)
             ModernGraphics.draw_rounded_rect(
                 surface,
                 track_color,
@@ -343,9 +530,9 @@ class ScrollableContainer(Container):
                 self.scrollbar_width // 2
             )
             
-            thumb_color = pygame.Color(theme.text_secondary)
+            thumb_color = theme.rgb("text_secondary")
             if self._dragging_h_scrollbar:
-                thumb_color = pygame.Color(theme.primary_color)
+                thumb_color = theme.rgb("primary_color")
             
             ModernGraphics.draw_rounded_rect(
                 surface,
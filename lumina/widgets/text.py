@@ -1,10 +1,20 @@
 from typing import Optional, Union
 import pygame
-from lumina.core.widget import Widget
+from lumina.core.widget import Widget, _cached_size
 from lumina.core.style import Style
 from lumina.core.types import Color
 
 
+# Style settings for the named text presets; unknown names get a default Style
+_STYLE_PRESETS = {
+    "heading": {"font_size": 32, "font_weight": "bold"},
+    "subheading": {"font_size": 24, "font_weight": "600"},
+    "body": {"font_size": 16},
+    "caption": {"font_size": 14, "opacity": 0.7},
+    "small": {"font_size": 12},
+}
+
+
 class Text(Widget):
     """Basic text widget"""
     
@@ -27,24 +37,31 @@ class Text(Widget):
         if color:
             self.style.foreground_color = color
         
+        # Last surface from TextRenderer's shared cache, reused while (text, font, color) is unchanged
         self._rendered_text: Optional[pygame.Surface] = None
-        self._last_text: Optional[str] = None
+        self._render_key: Optional[tuple] = None
     
     def _get_style_preset(self, preset: str) -> Style:
         """Get predefined text styles"""
-        if preset == "heading":
-            return Style(font_size=32, font_weight="bold")
-        elif preset == "subheading":
-            return Style(font_size=24, font_weight="600")
-        elif preset == "body":
-            return Style(font_size=16)
-        elif preset == "caption":
-            return Style(font_size=14, opacity=0.7)
-        elif preset == "small":
-            return Style(font_size=12)
-        else:
-            return Style()
+        # A fresh Style per widget, since Text sets its color on the style
+        return Style(**_STYLE_PRESETS.get(preset, {}))
+    
+    @property
+    def text(self) -> str:
+        return self._text
+    
+    @text.setter
+    def text(self, value: str) -> None:
+        if getattr(self, "_text", None) != value:
+            self._text = value
+            self.invalidate_layout()
+    
+    def clear_render_cache(self) -> None:
+        """Drop the rendered text so it picks up new theme colors"""
+        self._rendered_text = None
+        self._render_key = None
     
+    @_cached_size
     def calculate_size(self, available_width: float, available_height: float) -> tuple[float, float]:
         """Calculate text size"""
         from lumina.core.text_renderer import TextRenderer
@@ -61,21 +78,30 @@ class Text(Widget):
         if not self.visible:
             return
         
-        # Render text if needed
-        if self._rendered_text is None or self._last_text != self.text:
-            from lumina.core.text_renderer import TextRenderer
+        surface.blit(*self._blit_args())
+    
+    def _blit_args(self) -> tuple[pygame.Surface, tuple[int, int]]:
+        """Rendered text surface and its position, ready for Surface.blit or Surface.blits"""
+        # Get text color
+        if self.style.foreground_color:
+            color = self.style.to_pygame_color(self.style.foreground_color)
+        elif self.window and self.window.theme:
+            color = self.window.theme.rgb("text_primary")
+        else:
+            color = Style.to_pygame_color("black")
+        
+        # Re-fetch when the text, font or color changed (style edits and theme switches included)
+        key = (self.text, self.style.get_font(), color)
+        if self._rendered_text is None or self._render_key != key:
+            # A font edited in place also invalidates sizes measured with the old one, up the tree
+            if self._render_key is not None and self._render_key[1] is not key[1]:
+                self._clear_size_cache()
             
-            # Get text color
-            if self.style.foreground_color:
-                color = self.style.to_pygame_color(self.style.foreground_color)
-            elif self.window and self.window.theme:
-                color = pygame.Color(self.window.theme.text_primary)
-            else:
-                color = pygame.Color("black")
+            from lumina.core.text_renderer import TextRenderer
             
-            # Render with advanced text renderer (supports emojis)
+            # Render with advanced text renderer (supports emojis); identical Text widgets share the surface
             self._rendered_text = TextRenderer.render_text(self.text, self.style, color)
-            self._last_text = self.text
+            self._render_key = key
         
         # Calculate position with integer pixel alignment to prevent blur
         x = int(self.rect.x + self.padding.left)
@@ -88,7 +114,7 @@ class Text(Widget):
             x = int(self.rect.x + self.rect.width - self._rendered_text.get_width() - self.padding.right)
         
         # Draw text at integer pixel position to prevent sub-pixel blur
-        surface.blit(self._rendered_text, (x, y))
+        return self._rendered_text, (x, y)
 
 
 class Header(Text):
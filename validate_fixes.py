@@ -56,6 +56,25 @@ def test_scrollable_container():
     assert container.scroll_horizontal == False  
     assert len(container.children) == 10
     
+    # Layout measures the children once; repeating it with the same geometry hits the size cache
+    from unittest import mock
+    from lumina.core.text_renderer import TextRenderer
+    from lumina.core.types import Rect
+    import pygame
+    
+    with mock.patch.object(TextRenderer, "get_text_size", wraps=TextRenderer.get_text_size) as get_text_size:
+        container.layout(Rect(0, 0, 400, 300))
+        first_layout_calls = get_text_size.call_count
+        assert first_layout_calls > 0, "First layout should measure the children"
+        
+        container.layout(Rect(0, 0, 400, 300))
+        assert get_text_size.call_count == first_layout_calls, "Identical layout should reuse cached sizes"
+        
+        # Scrolling only moves children, it should never re-measure text
+        container.scroll_y = 50
+        container.handle_event(pygame.event.Event(pygame.MOUSEMOTION, pos=(10, 10), rel=(0, 0), buttons=(0, 0, 0)))
+        assert get_text_size.call_count == first_layout_calls, "Scrolling should not re-measure text"
+    
     print("✓ ScrollableContainer works")
 
 def test_theme_switching():